@@ -0,0 +1,381 @@
+"""Benchmark the video notes pipeline on synthetic transcripts.
+
+Measures the text processing steps on transcripts from 1 KB to 5 MB, a full
+``process_video`` run against a simulated Ollama server with configurable
+latency and throughput, and the prompt evaluation saved by the shared-prefix
+chunk prompt layout. Results are written as JSON so that runs
+of different releases can be compared.
+
+Usage:
+    uv run python scripts/benchmark.py --output benchmark.json
+    uv run python scripts/benchmark.py --sizes 1KB,100KB --tokens-per-second 40
+"""
+
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import click
+
+DEFAULT_SIZES = "1KB,10KB,100KB,1MB,5MB"
+MODEL = "gemma3:12b"
+VIDEO_ID = "benchmark01"
+
+# Manual notes sent with every chunk by the prompt layout benchmark
+LAYOUT_NOTES = (
+    "Focus on the worked examples, the numbers quoted by the speaker and any "
+    "recommendation about tooling or deployment."
+)
+
+SIZE_UNITS = {"KB": 1024, "MB": 1024 * 1024, "B": 1}
+
+WORDS = (
+    "the model learns a representation of the input data and uses it to predict "
+    "what comes next in the sequence while the speaker explains why this matters "
+    "for practical systems and gives several examples from recent research"
+).split()
+
+
+def parse_size(size: str) -> int:
+    """Convert a size such as ``100KB`` to bytes."""
+    size = size.strip().upper()
+    for unit, factor in SIZE_UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[: -len(unit)]) * factor)
+    return int(size)
+
+
+def synthetic_transcript(size: int, seed: int = 0) -> str:
+    """Generate a deterministic transcript of about ``size`` characters.
+
+    Sentences have a realistic spread of lengths and only some of them end
+    with punctuation, like automatically generated captions.
+    """
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 30)))
+        if rng.random() < 0.6:
+            sentence += rng.choice(".?!")
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)[:size]
+
+
+def measure(function: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time a function and summarize the durations."""
+    durations = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started_at)
+    return {
+        "repeat": repeat,
+        "min_s": min(durations),
+        "median_s": statistics.median(durations),
+        "mean_s": statistics.fmean(durations),
+        "max_s": max(durations),
+    }
+
+
+def repeat_for(size: int, repeat: int) -> int:
+    """Use fewer repetitions for the largest transcripts."""
+    return max(1, repeat // 10) if size >= 1024 * 1024 else repeat
+
+
+def benchmark_text_processing(
+    transcript: str, repeat: int, context_length: int
+) -> list[dict[str, Any]]:
+    """Measure chunking, chunk sizing, prompt construction and final markdown."""
+    from video_notes.agents import ai_client, compute_chunk_parameters, generate_final_markdown
+    from video_notes.agents.chunk_combiner import get_messages as combiner_messages
+    from video_notes.agents.chunk_summarizer import get_messages as summarizer_messages
+    from video_notes.models import TextChunker
+
+    # Size chunks for the simulated model without asking a server
+    ai_client.configure(
+        ai_client.ClientSettings(cache_enabled=False, context_window=context_length)
+    )
+    chunk_params = compute_chunk_parameters(transcript, model=MODEL)
+    chunker = TextChunker(chunk_size=chunk_params.chunk_size, overlap=chunk_params.chunk_overlap)
+    chunks = chunker.chunk_text(transcript)
+    summaries = [chunk.content[:2000] for chunk in chunks]
+    repeat = repeat_for(len(transcript), repeat)
+
+    benchmarks: dict[str, Callable[[], Any]] = {
+        "chunk_text": lambda: chunker.chunk_text(transcript),
+        "iter_spans": lambda: list(chunker.iter_spans(transcript)),
+        "compute_chunk_parameters": lambda: compute_chunk_parameters(transcript, model=MODEL),
+        "chunk_summarizer.get_messages": lambda: [
+            summarizer_messages(chunk.content, chunk.chunk_index + 1, notes="Focus on examples")
+            for chunk in chunks
+        ],
+        "chunk_combiner.get_messages": lambda: combiner_messages(
+            summaries, notes="Focus on examples"
+        ),
+        "generate_final_markdown": lambda: generate_final_markdown(
+            summary_content="\n\n".join(summaries),
+            video_title="Benchmark video",
+            author="Benchmark",
+            video_url=f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        ),
+    }
+
+    results = []
+    for name, function in benchmarks.items():
+        result = {"benchmark": name, "size_bytes": len(transcript), "chunks": len(chunks)}
+        result.update(measure(function, repeat))
+        result["throughput_mb_s"] = len(transcript) / result["median_s"] / 1e6
+        results.append(result)
+    return results
+
+
+def benchmark_process_video(
+    transcript: str,
+    fake_settings: dict[str, Any],
+    max_workers: int,
+    output_folder: Path,
+    http: bool = False,
+) -> dict[str, Any]:
+    """Run the full workflow on a transcript against the simulated Ollama server.
+
+    The transcript and video metadata are seeded in the caches and the
+    workflow runs offline, so no network access is needed. With ``http`` the
+    simulated server is reached over a local socket instead of in-process.
+    """
+    from video_notes.agents import ai_client
+    from video_notes.models import ProcessingConfig, ProcessingTimings
+    from video_notes.services import video
+    from video_notes.services.workflow import process_video
+    from video_notes.testing import FakeOllama, OllamaServer
+
+    fake = FakeOllama(**fake_settings)
+    server = None
+    if http:
+        server = OllamaServer(fake, port=0)
+        server.start()
+        ai_client.configure(ai_client.ClientSettings(cache_enabled=False, host=server.url))
+    else:
+        ai_client.configure(ai_client.ClientSettings(cache_enabled=False), fake.transport())
+
+    video._store_transcript(VIDEO_ID, "en", True, transcript)
+    video.get_video_info_cache().set(VIDEO_ID, {"title": "Benchmark video", "author": "Benchmark"})
+
+    config = ProcessingConfig(
+        youtube_url=f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        model=MODEL,
+        output_folder=str(output_folder),
+        max_workers=max_workers,
+    )
+
+    started_at = time.perf_counter()
+    try:
+        result = process_video(config)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    duration = time.perf_counter() - started_at
+
+    return {
+        "benchmark": "process_video",
+        "size_bytes": len(transcript),
+        "success": result.success,
+        "error_message": result.error_message,
+        "duration_s": duration,
+        "llm_requests": fake.stats.chat_requests,
+        "llm_truncated": fake.stats.truncated,
+        "llm_loads": fake.stats.loads,
+        "llm_errors": fake.stats.errors,
+        "llm_max_in_flight": fake.stats.max_in_flight,
+        "max_workers": max_workers,
+        "transport": "http" if http else "in-process",
+        "stages_s": {
+            timing.stage: timing.elapsed
+            for timing in (result.timings or ProcessingTimings()).stages
+        },
+    }
+
+
+def benchmark_prompt_layouts(
+    transcript: str, fake_settings: dict[str, Any], max_workers: int
+) -> list[dict[str, Any]]:
+    """Compare the prompt evaluation of each chunk prompt layout with a prefix cache.
+
+    The simulated server keeps one cached prompt per parallel slot, like
+    Ollama, and only evaluates the part of a prompt not shared with a cached
+    one. Prompt evaluation time is only simulated with ``--prompt-tokens-per-second``.
+    """
+    from video_notes.agents import (
+        PromptLayout,
+        ai_client,
+        compute_chunk_parameters,
+        summarize_chunk,
+    )
+    from video_notes.models import TextChunker
+    from video_notes.testing import FakeOllama
+
+    results = []
+    for layout in PromptLayout:
+        fake = FakeOllama(
+            **fake_settings,
+            prefix_cache_slots=fake_settings["parallel"] or max_workers,
+        )
+        ai_client.configure(ai_client.ClientSettings(cache_enabled=False), fake.transport())
+
+        chunk_params = compute_chunk_parameters(transcript, model=MODEL, notes=LAYOUT_NOTES)
+        chunker = TextChunker(
+            chunk_size=chunk_params.chunk_size, overlap=chunk_params.chunk_overlap
+        )
+        chunks = chunker.chunk_text(transcript)
+
+        def summarize(chunk: Any, layout: PromptLayout = layout) -> Any:
+            return summarize_chunk(
+                chunk.content, chunk.chunk_index, model=MODEL, notes=LAYOUT_NOTES, layout=layout
+            )
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summaries = list(executor.map(summarize, chunks))
+        duration = time.perf_counter() - started_at
+
+        stats = fake.stats
+        results.append(
+            {
+                "benchmark": "prompt_layout",
+                "layout": layout.value,
+                "size_bytes": len(transcript),
+                "chunks": len(chunks),
+                "duration_s": duration,
+                "prompt_tokens": stats.prompt_tokens,
+                "cached_prompt_tokens": stats.cached_prompt_tokens,
+                "evaluated_prompt_tokens": stats.prompt_tokens - stats.cached_prompt_tokens,
+                "prompt_eval_s": sum(
+                    summary.usage.prompt_eval_duration for summary in summaries if summary.usage
+                ),
+            }
+        )
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """Describe the machine and package version the benchmark ran on."""
+    try:
+        package_version = version("video-notes")
+    except PackageNotFoundError:
+        package_version = None
+
+    return {
+        "package_version": package_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+@click.command()
+@click.option("--sizes", default=DEFAULT_SIZES, show_default=True, help="Transcript sizes.")
+@click.option("--repeat", default=20, show_default=True, help="Repetitions per benchmark.")
+@click.option("--skip-pipeline", is_flag=True, help="Only run the text processing benchmarks.")
+@click.option("--latency", default=0.02, show_default=True, help="Seconds added per LLM call.")
+@click.option(
+    "--prompt-tokens-per-second",
+    default=0.0,
+    show_default=True,
+    help="Simulated prompt evaluation speed, 0 for instant.",
+)
+@click.option(
+    "--tokens-per-second",
+    default=0.0,
+    show_default=True,
+    help="Simulated generation speed, 0 for instant.",
+)
+@click.option("--response-tokens", default=200, show_default=True, help="Tokens per response.")
+@click.option(
+    "--parallel", default=0, show_default=True, help="Simulated server slots, 0 for no limit."
+)
+@click.option(
+    "--context-length", default=8192, show_default=True, help="Model context window in tokens."
+)
+@click.option("--load-seconds", default=0.0, show_default=True, help="Simulated model load time.")
+@click.option("--error-rate", default=0.0, show_default=True, help="Fraction of LLM calls failing.")
+@click.option("--http", is_flag=True, help="Reach the simulated server over a local socket.")
+@click.option("--max-workers", default=4, show_default=True, help="Concurrent chunk requests.")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write results to a file.")
+def main(
+    sizes: str,
+    repeat: int,
+    skip_pipeline: bool,
+    latency: float,
+    prompt_tokens_per_second: float,
+    tokens_per_second: float,
+    response_tokens: int,
+    parallel: int,
+    context_length: int,
+    load_seconds: float,
+    error_rate: float,
+    http: bool,
+    max_workers: int,
+    output: str | None,
+) -> None:
+    """Benchmark the pipeline and print the results as JSON."""
+    fake_settings = {
+        "models": [MODEL],
+        "latency": latency,
+        "prompt_tokens_per_second": prompt_tokens_per_second,
+        "tokens_per_second": tokens_per_second,
+        "response_tokens": response_tokens,
+        "parallel": parallel,
+        "context_length": context_length,
+        "load_seconds": load_seconds,
+        "error_rate": error_rate,
+        "seed": 0,
+    }
+
+    with tempfile.TemporaryDirectory(prefix="video-notes-benchmark-") as work_dir:
+        # Keep the user's caches untouched and never reach YouTube
+        os.environ["VIDEO_NOTES_CACHE_DIR"] = str(Path(work_dir) / "cache")
+        os.environ["VIDEO_NOTES_OFFLINE"] = "1"
+
+        results = []
+        for size in (parse_size(size) for size in sizes.split(",")):
+            transcript = synthetic_transcript(size)
+            print(f"Benchmarking {size} bytes...", file=sys.stderr)
+            results.extend(benchmark_text_processing(transcript, repeat, context_length))
+            if not skip_pipeline:
+                results.append(
+                    benchmark_process_video(
+                        transcript, fake_settings, max_workers, Path(work_dir), http=http
+                    )
+                )
+                results.extend(benchmark_prompt_layouts(transcript, fake_settings, max_workers))
+
+    report = {
+        "timestamp": time.time(),
+        "environment": environment(),
+        "settings": {"repeat": repeat, "max_workers": max_workers, "fake_ollama": fake_settings},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Check the import time of the video notes entry points against a budget.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``,
+so nothing is shared between measurements. A module fails its budget when its
+median import time is over the limit, or when it pulls in a dependency it
+should leave to the code that needs it (yt-dlp, Ollama, Streamlit...). The
+results are printed as JSON and the exit code is 1 if any budget is exceeded.
+
+Usage:
+    uv run python scripts/import_time.py
+    uv run python scripts/import_time.py --repeat 10 --scale 2 --output import_time.json
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+
+# Dependencies that only the processing workflow and the web app need
+WORKFLOW_DEPENDENCIES = ("yt_dlp", "youtube_transcript_api", "ollama", "httpx")
+APP_DEPENDENCIES = ("streamlit",)
+
+# Module imported, milliseconds allowed and top-level modules it must not import
+BUDGETS: tuple[tuple[str, float, tuple[str, ...]], ...] = (
+    ("video_notes", 50, ("pydantic", *WORKFLOW_DEPENDENCIES, *APP_DEPENDENCIES)),
+    ("video_notes.utils.tokenizer", 50, ("pydantic", *WORKFLOW_DEPENDENCIES, *APP_DEPENDENCIES)),
+    ("video_notes.models.text", 500, (*WORKFLOW_DEPENDENCIES, *APP_DEPENDENCIES)),
+    ("video_notes.cli", 1000, (*WORKFLOW_DEPENDENCIES, *APP_DEPENDENCIES)),
+    ("video_notes.services.workflow", 2500, APP_DEPENDENCIES),
+)
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative import time in milliseconds, top-level packages imported).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    cumulative_us = 0
+    packages = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if not cumulative.strip().isdigit():
+            continue
+        packages.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, packages
+
+
+def check_budget(
+    module: str, budget_ms: float, forbidden: tuple[str, ...], repeat: int
+) -> dict[str, Any]:
+    """Measure a module and compare it to its budget."""
+    timings = []
+    packages: set[str] = set()
+    for _ in range(repeat):
+        elapsed_ms, packages = measure_import(module)
+        timings.append(elapsed_ms)
+
+    median_ms = statistics.median(timings)
+    imported = sorted(packages.intersection(forbidden))
+    return {
+        "module": module,
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(min(timings), 1),
+        "budget_ms": budget_ms,
+        "forbidden_imports": imported,
+        "within_budget": median_ms <= budget_ms and not imported,
+    }
+
+
+@click.command()
+@click.option("--repeat", default=5, show_default=True, help="Fresh imports per module.")
+@click.option(
+    "--scale",
+    default=1.0,
+    show_default=True,
+    help="Multiply every time budget, for slower machines.",
+)
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write results to a file.")
+def main(repeat: int, scale: float, output: str | None) -> None:
+    """Measure import times and exit with 1 if any budget is exceeded."""
+    results = [
+        check_budget(module, budget_ms * scale, forbidden, repeat)
+        for module, budget_ms, forbidden in BUDGETS
+    ]
+
+    text = json.dumps({"python": sys.version, "repeat": repeat, "results": results}, indent=2)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    for result in results:
+        if not result["within_budget"]:
+            print(
+                f"{result['module']}: {result['median_ms']} ms "
+                f"(budget {result['budget_ms']} ms), imports {result['forbidden_imports']}",
+                file=sys.stderr,
+            )
+    sys.exit(0 if all(result["within_budget"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
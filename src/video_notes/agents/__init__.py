@@ -5,19 +5,62 @@ in the video processing pipeline. Each agent is a pure function with
 clear input/output contracts using Pydantic for validation.
 """
 
-from . import ai_client
-from .chunk_combiner import (
-    CombinedSummary,
-    combine_relevant_chunks,
-)
-from .chunk_sizing import ChunkParameters, compute_chunk_parameters
-from .chunk_summarizer import ChunkSummary, summarize_chunk
-from .filename_generator import (
-    FilenameResult,
-    generate_filename,
-    generate_filename_from_video_info,
+from typing import TYPE_CHECKING
+
+from video_notes.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from . import ai_client
+    from .chunk_combiner import (
+        CombinedSummary,
+        combine_relevant_chunks,
+        combine_relevant_chunks_async,
+    )
+    from .chunk_sizing import ChunkParameters, compute_chunk_parameters
+    from .chunk_summarizer import (
+        ChunkSummary,
+        PromptLayout,
+        summarize_chunk,
+        summarize_chunk_async,
+    )
+    from .filename_generator import (
+        FilenameResult,
+        generate_filename,
+        generate_filename_from_video_info,
+    )
+    from .final_markdown import generate_final_markdown
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    submodules=(
+        "ai_client",
+        "chunk_combiner",
+        "chunk_sizing",
+        "chunk_summarizer",
+        "filename_generator",
+        "final_markdown",
+    ),
+    attributes={
+        ".chunk_combiner": (
+            "CombinedSummary",
+            "combine_relevant_chunks",
+            "combine_relevant_chunks_async",
+        ),
+        ".chunk_sizing": ("ChunkParameters", "compute_chunk_parameters"),
+        ".chunk_summarizer": (
+            "ChunkSummary",
+            "PromptLayout",
+            "summarize_chunk",
+            "summarize_chunk_async",
+        ),
+        ".filename_generator": (
+            "FilenameResult",
+            "generate_filename",
+            "generate_filename_from_video_info",
+        ),
+        ".final_markdown": ("generate_final_markdown",),
+    },
 )
-from .final_markdown import generate_final_markdown
 
 __all__ = [
     # Modules
@@ -25,7 +68,9 @@ __all__ = [
     # Functions
     "compute_chunk_parameters",
     "summarize_chunk",
+    "summarize_chunk_async",
     "combine_relevant_chunks",
+    "combine_relevant_chunks_async",
     "generate_filename",
     "generate_filename_from_video_info",
     "generate_final_markdown",
@@ -34,4 +79,6 @@ __all__ = [
     "ChunkSummary",
     "CombinedSummary",
     "FilenameResult",
+    # Enums
+    "PromptLayout",
 ]
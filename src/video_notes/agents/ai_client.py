@@ -1,10 +1,329 @@
-"""AI client for agent text generation using Ollama."""
+"""AI client for agent text generation using Ollama.
+
+Ollama clients are shared through a small registry keyed by host and timeout,
+so every request reuses the same pooled HTTP connections instead of paying
+connection setup on each chunk. Responses are cached on disk, keyed by the
+model, its digest, the messages and the generation options. The context
+window of each model is read once from ``ollama show`` and requested as
+``num_ctx``, so prompts are sized for the model actually used. The prompt sizes
+reported by Ollama calibrate the per-model token estimates used for chunking,
+and the token counts and durations of every call can be collected through an
+``on_usage`` callback.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from typing import Any
 
 import click
-from ollama import ChatResponse, chat
+import httpx
+from loguru import logger
+from ollama import AsyncClient, ChatResponse, Client
+from pydantic import BaseModel, Field
+
+from video_notes.models.usage import LLMUsage
+from video_notes.utils.cache import DiskCache, default_cache_dir
+from video_notes.utils.tokenizer import calibrate_from_prompt
+
+# Options shared by every generation request
+GENERATION_OPTIONS = {
+    "temperature": 0,
+}
+
+# Context window assumed when the model cannot be inspected, Ollama's default num_ctx
+DEFAULT_CONTEXT_WINDOW = 4096
+
+# Seconds before retrying to inspect a model that could not be reached
+MODEL_INFO_RETRY_SECONDS = 60.0
+
+
+class ClientSettings(BaseModel):
+    """Connection settings for the shared Ollama clients.
+
+    Attributes:
+        host (str | None): Ollama server URL, defaults to the ``OLLAMA_HOST`` variable.
+        keep_alive (str | float): How long Ollama keeps the model loaded after a request.
+        timeouts (dict[str, float]): Request timeout in seconds for each pipeline stage.
+        default_timeout (float): Timeout used for stages without a dedicated entry.
+        cache_enabled (bool): Whether responses are served from and stored in the cache.
+        cache_max_bytes (int): Size budget of the response cache before LRU eviction.
+        context_window (int | None): Context length in tokens that prompts must fit in,
+            read from the model when None.
+        max_context_window (int): Upper bound of the context length read from the model,
+            since Ollama allocates memory for the whole window.
+    """
+
+    host: str | None = Field(default_factory=lambda: os.environ.get("OLLAMA_HOST"))
+    keep_alive: str | float = Field(
+        default_factory=lambda: os.environ.get("VIDEO_NOTES_KEEP_ALIVE", "30m")
+    )
+    timeouts: dict[str, float] = Field(
+        default_factory=lambda: {
+            "summarize": 300.0,
+            "combine": 900.0,
+            "models": 10.0,
+        }
+    )
+    default_timeout: float = Field(default=600.0, gt=0)
+    cache_enabled: bool = Field(
+        default_factory=lambda: os.environ.get("VIDEO_NOTES_LLM_CACHE", "1") != "0"
+    )
+    cache_max_bytes: int = Field(default=256 * 1024 * 1024, gt=0)
+    context_window: int | None = Field(
+        default_factory=lambda: _int_from_env("VIDEO_NOTES_CONTEXT_WINDOW"), gt=0
+    )
+    max_context_window: int = Field(
+        default_factory=lambda: _int_from_env("VIDEO_NOTES_MAX_CONTEXT_WINDOW") or 32768, gt=0
+    )
+
+    def timeout_for(self, stage: str | None) -> float:
+        """Get the request timeout for a pipeline stage.
+
+        Args:
+            stage: Pipeline stage name, or None for the default timeout.
+
+        Returns:
+            Timeout in seconds.
+        """
+        if stage is None:
+            return self.default_timeout
+        return self.timeouts.get(stage, self.default_timeout)
+
+
+class ModelInfo(BaseModel):
+    """Properties of an installed model reported by ``ollama show``.
+
+    Attributes:
+        model (str): Ollama model name
+        context_length (int | None): Context window in tokens, from the Modelfile
+            ``num_ctx`` parameter or else the model architecture
+        parameter_count (int | None): Number of parameters of the model
+    """
+
+    model: str
+    context_length: int | None = Field(default=None, gt=0)
+    parameter_count: int | None = Field(default=None, gt=0)
+
+
+def _int_from_env(name: str) -> int | None:
+    """Read an optional integer environment variable.
+
+    Args:
+        name: Name of the variable.
+
+    Returns:
+        The integer value, or None when the variable is unset or empty.
+    """
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+_settings = ClientSettings()
+_transport: httpx.MockTransport | httpx.BaseTransport | None = None
+_clients: dict[tuple[str | None, float], Client] = {}
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str | None, float], AsyncClient]
+] = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+_response_cache: DiskCache | None = None
+_response_cache_failed = False
+_model_digests: dict[tuple[str | None, str], str] = {}
+_model_digest_failures: dict[tuple[str | None, str], float] = {}
+_model_infos: dict[tuple[str | None, str], ModelInfo] = {}
+_model_info_failures: dict[tuple[str | None, str], float] = {}
+
+
+def configure(
+    settings: ClientSettings,
+    transport: httpx.MockTransport | httpx.BaseTransport | None = None,
+) -> None:
+    """Replace the client settings and drop clients built from the old ones.
+
+    Args:
+        settings: New connection settings.
+        transport: Optional httpx transport used by new clients instead of the
+            network, for instance to run against a simulated Ollama server.
+    """
+    global _settings, _transport, _response_cache, _response_cache_failed
+
+    with _clients_lock:
+        _settings = settings
+        _transport = transport
+        _clients.clear()
+        _async_clients.clear()
+        _model_digests.clear()
+        _model_digest_failures.clear()
+        _model_infos.clear()
+        _model_info_failures.clear()
+        _response_cache = None
+        _response_cache_failed = False
+
+
+def get_settings() -> ClientSettings:
+    """Get the current client settings.
+
+    Returns:
+        The active ClientSettings.
+    """
+    return _settings
+
+
+def get_context_window(model: str | None) -> int:
+    """Get the number of tokens a prompt and its response must fit in.
+
+    The configured ``context_window`` wins; otherwise the context length of
+    the model, capped at ``max_context_window``.
+
+    Args:
+        model: Ollama model name, None when unknown.
+
+    Returns:
+        Context window in tokens, also requested from Ollama as ``num_ctx``.
+    """
+    if _settings.context_window is not None:
+        return _settings.context_window
+
+    info = get_model_info(model) if model else None
+    if info is None or info.context_length is None:
+        return min(DEFAULT_CONTEXT_WINDOW, _settings.max_context_window)
+    return min(info.context_length, _settings.max_context_window)
+
+
+def get_model_info(model: str) -> ModelInfo | None:
+    """Inspect an installed model, remembered for the process lifetime.
+
+    A model that cannot be inspected is retried after
+    ``MODEL_INFO_RETRY_SECONDS`` rather than on every call.
+
+    Args:
+        model: Ollama model name.
+
+    Returns:
+        The model properties, or None if Ollama could not describe the model.
+    """
+    key = (_settings.host, model)
+    if key in _model_infos:
+        return _model_infos[key]
+
+    failed_at = _model_info_failures.get(key)
+    if failed_at is not None and time.monotonic() - failed_at < MODEL_INFO_RETRY_SECONDS:
+        return None
+
+    try:
+        response = get_client("models").show(model)
+    except Exception:
+        _model_info_failures[key] = time.monotonic()
+        return None
+
+    model_info = response.modelinfo or {}
+    architecture_context = next(
+        (value for name, value in model_info.items() if name.endswith(".context_length")), None
+    )
+    info = ModelInfo(
+        model=model,
+        context_length=_modelfile_context(response.parameters) or architecture_context,
+        parameter_count=model_info.get("general.parameter_count"),
+    )
+    _model_infos[key] = info
+    return info
+
+
+def _modelfile_context(parameters: str | None) -> int | None:
+    """Read the ``num_ctx`` parameter set in a Modelfile.
+
+    Args:
+        parameters: Parameters reported by ``ollama show``, one per line.
+
+    Returns:
+        The context window in tokens, or None when not set.
+    """
+    match = re.search(r"^\s*num_ctx\s+(\d+)", parameters or "", re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+
+def generation_options(model: str) -> dict[str, Any]:
+    """Get the options sent with every generation request.
+
+    Args:
+        model: Ollama model name.
+
+    Returns:
+        ``GENERATION_OPTIONS`` with the model's context window as ``num_ctx``.
+    """
+    return {**GENERATION_OPTIONS, "num_ctx": get_context_window(model)}
+
+
+def get_client(stage: str | None = None) -> Client:
+    """Get the shared Ollama client for a pipeline stage.
+
+    Clients are created once per host and timeout and reused by all threads;
+    the underlying HTTP client keeps connections alive between requests.
+
+    Args:
+        stage: Pipeline stage name used to pick the request timeout.
+
+    Returns:
+        Shared Ollama client.
+    """
+    key = (_settings.host, _settings.timeout_for(stage))
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = Client(host=key[0], timeout=key[1], **_transport_options())
+            _clients[key] = client
+        return client
+
+
+def get_async_client(stage: str | None = None) -> AsyncClient:
+    """Get the shared asyncio Ollama client for a pipeline stage.
+
+    Async HTTP clients are bound to the event loop that uses them, so one
+    client is kept per running loop, host and timeout.
+
+    Args:
+        stage: Pipeline stage name used to pick the request timeout.
+
+    Returns:
+        Shared asyncio Ollama client for the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    key = (_settings.host, _settings.timeout_for(stage))
+
+    with _clients_lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            client = AsyncClient(host=key[0], timeout=key[1], **_transport_options())
+            loop_clients[key] = client
+        return client
+
+
+def _transport_options() -> dict[str, Any]:
+    """Get the extra httpx options of new clients.
+
+    Returns:
+        Keyword arguments selecting the configured transport, if any.
+    """
+    return {"transport": _transport} if _transport is not None else {}
 
 
-def generate_with_messages(messages: list[dict[str, str]], model: str = "gemma3:12b") -> str | None:
+def generate_with_messages(
+    messages: list[dict[str, str]],
+    model: str = "gemma3:12b",
+    stage: str | None = None,
+    on_token: Callable[[str], None] | None = None,
+    use_cache: bool = True,
+    on_usage: Callable[[LLMUsage], None] | None = None,
+) -> str | None:
     """Generate text using Ollama chat API with messages.
 
     This is the primary function used by agents for AI text generation.
@@ -12,24 +331,301 @@ def generate_with_messages(messages: list[dict[str, str]], model: str = "gemma3:
     Args:
         messages: List of message dictionaries with 'role' and 'content' keys.
         model: Ollama model name to use.
+        stage: Pipeline stage name used to pick the request timeout.
+        on_token: Optional callback receiving each piece of text as it is
+            generated; the response is streamed when it is set.
+        use_cache: Whether to consult and fill the response cache.
+        on_usage: Optional callback receiving the token counts and durations of the call.
 
     Returns:
         Generated text or None if failed.
     """
     try:
-        response: ChatResponse = chat(
+        cache_key = _cache_key_if_enabled(messages, model, use_cache)
+        if cache_key and (cached := get_response_cache().get(cache_key)):
+            if on_token is not None:
+                on_token(cached)
+            if on_usage is not None:
+                on_usage(LLMUsage(model=model, stage=stage, cached=True))
+            return str(cached)
+
+        if on_token is not None:
+            parts = []
+            for token in stream_with_messages(
+                messages, model=model, stage=stage, on_usage=on_usage
+            ):
+                parts.append(token)
+                on_token(token)
+            content = "".join(parts).strip() or None
+        else:
+            response: ChatResponse = get_client(stage).chat(
+                model=model,
+                messages=messages,
+                options=generation_options(model),
+                keep_alive=_settings.keep_alive,
+            )
+            calibrate_from_prompt(messages, response.prompt_eval_count, model)
+            if on_usage is not None:
+                on_usage(usage_from_response(response, model, stage))
+            content = _extract_content(response)
+
+        if cache_key and content:
+            get_response_cache().set(cache_key, content)
+        return content
+
+    except Exception as e:
+        click.echo(f"❌ Error calling Ollama: {e}", err=True)
+        return None
+
+
+def stream_with_messages(
+    messages: list[dict[str, str]],
+    model: str = "gemma3:12b",
+    stage: str | None = None,
+    on_usage: Callable[[LLMUsage], None] | None = None,
+) -> Iterator[str]:
+    """Stream generated text from the Ollama chat API piece by piece.
+
+    Unlike ``generate_with_messages`` errors are raised to the caller, since
+    part of the response may already have been consumed.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys.
+        model: Ollama model name to use.
+        stage: Pipeline stage name used to pick the request timeout.
+        on_usage: Optional callback receiving the token counts and durations of
+            the call once the response is complete.
+
+    Yields:
+        Pieces of the generated text in order.
+    """
+    for part in get_client(stage).chat(
+        model=model,
+        messages=messages,
+        options=generation_options(model),
+        keep_alive=_settings.keep_alive,
+        stream=True,
+    ):
+        if part.message and part.message.content:
+            yield part.message.content
+        if part.done:
+            calibrate_from_prompt(messages, part.prompt_eval_count, model)
+            if on_usage is not None:
+                on_usage(usage_from_response(part, model, stage))
+
+
+async def generate_with_messages_async(
+    messages: list[dict[str, str]],
+    model: str = "gemma3:12b",
+    stage: str | None = None,
+    use_cache: bool = True,
+    on_usage: Callable[[LLMUsage], None] | None = None,
+) -> str | None:
+    """Generate text using the asyncio-native Ollama client.
+
+    Counterpart of ``generate_with_messages`` that lets a single event loop
+    keep many chat requests in flight without a thread per request. The
+    blocking model lookups and response cache reads and writes run in worker
+    threads so they never stall the loop.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys.
+        model: Ollama model name to use.
+        stage: Pipeline stage name used to pick the request timeout.
+        use_cache: Whether to consult and fill the response cache.
+        on_usage: Optional callback receiving the token counts and durations of the call.
+
+    Returns:
+        Generated text or None if failed.
+    """
+    try:
+        cache_key = await asyncio.to_thread(_cache_key_if_enabled, messages, model, use_cache)
+        if cache_key and (cached := await asyncio.to_thread(get_response_cache().get, cache_key)):
+            if on_usage is not None:
+                on_usage(LLMUsage(model=model, stage=stage, cached=True))
+            return str(cached)
+
+        options = await asyncio.to_thread(generation_options, model)
+        response: ChatResponse = await get_async_client(stage).chat(
             model=model,
             messages=messages,
-            options={
-                "temperature": 0,
-            },
+            options=options,
+            keep_alive=_settings.keep_alive,
         )
+        calibrate_from_prompt(messages, response.prompt_eval_count, model)
+        if on_usage is not None:
+            on_usage(usage_from_response(response, model, stage))
+        content = _extract_content(response)
 
-        # Access the message content from the response
-        if response.message and response.message.content:
-            return str(response.message.content).strip()
-        return None
+        if cache_key and content:
+            await asyncio.to_thread(get_response_cache().set, cache_key, content)
+        return content
 
     except Exception as e:
         click.echo(f"❌ Error calling Ollama: {e}", err=True)
         return None
+
+
+def usage_from_response(response: ChatResponse, model: str, stage: str | None) -> LLMUsage:
+    """Read the token counts and durations of a chat response.
+
+    Args:
+        response: Chat response, or the final part of a streamed one.
+        model: Ollama model name that was requested.
+        stage: Pipeline stage that made the call.
+
+    Returns:
+        LLMUsage with durations converted to seconds.
+    """
+    return LLMUsage(
+        model=response.model or model,
+        stage=stage,
+        prompt_tokens=response.prompt_eval_count or 0,
+        completion_tokens=response.eval_count or 0,
+        load_duration=_seconds(response.load_duration),
+        prompt_eval_duration=_seconds(response.prompt_eval_duration),
+        eval_duration=_seconds(response.eval_duration),
+        total_duration=_seconds(response.total_duration),
+    )
+
+
+def _seconds(nanoseconds: int | None) -> float:
+    """Convert a duration reported by Ollama to seconds.
+
+    Args:
+        nanoseconds: Duration in nanoseconds, None when not reported.
+
+    Returns:
+        Duration in seconds.
+    """
+    return (nanoseconds or 0) / 1_000_000_000
+
+
+def _extract_content(response: ChatResponse) -> str | None:
+    """Extract the stripped message content from a chat response.
+
+    Args:
+        response: Chat response returned by Ollama.
+
+    Returns:
+        Message content or None if the response is empty.
+    """
+    # Access the message content from the response
+    if response.message and response.message.content:
+        return str(response.message.content).strip()
+    return None
+
+
+def get_response_cache() -> DiskCache:
+    """Get the shared on-disk cache of LLM responses.
+
+    Returns:
+        The response cache, created on first use.
+    """
+    global _response_cache
+
+    with _clients_lock:
+        if _response_cache is None:
+            _response_cache = DiskCache(
+                default_cache_dir() / "llm_responses.sqlite3",
+                max_bytes=_settings.cache_max_bytes,
+            )
+        return _response_cache
+
+
+def response_cache_key(messages: list[dict[str, str]], model: str) -> str:
+    """Compute the content address of a generation request.
+
+    The key covers the model name and digest, so pulling a new version of a
+    model under the same tag invalidates its cached responses.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys.
+        model: Ollama model name to use.
+
+    Returns:
+        Hex-encoded SHA-256 of the request.
+    """
+    request = {
+        "model": model,
+        "digest": _model_digest(model),
+        "messages": messages,
+        "options": generation_options(model),
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _cache_key_if_enabled(
+    messages: list[dict[str, str]], model: str, use_cache: bool
+) -> str | None:
+    """Get the response cache key when caching applies to a request.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys.
+        model: Ollama model name to use.
+        use_cache: Whether the caller allows caching.
+
+    Returns:
+        The cache key, or None when caching is disabled or the cache cannot be opened.
+    """
+    if not (use_cache and _settings.cache_enabled) or _open_response_cache() is None:
+        return None
+    return response_cache_key(messages, model)
+
+
+def _open_response_cache() -> DiskCache | None:
+    """Get the response cache, or None when it cannot be opened.
+
+    A cache that fails to open, for instance in an unwritable cache directory,
+    is bypassed for the process instead of failing every generation.
+
+    Returns:
+        The shared response cache, or None if it is unavailable.
+    """
+    global _response_cache_failed
+
+    if _response_cache_failed:
+        return None
+    try:
+        return get_response_cache()
+    except (OSError, sqlite3.Error):
+        logger.opt(exception=True).warning("Could not open the LLM response cache.")
+        _response_cache_failed = True
+        return None
+
+
+def _model_digest(model: str) -> str:
+    """Get the digest of a local model, remembered for the process lifetime.
+
+    A model whose digest cannot be determined is retried after
+    ``MODEL_INFO_RETRY_SECONDS``, so that a slow or unreachable Ollama server
+    is not asked before every call, yet a transient error does not leave the
+    cache keys of the model without a digest for good.
+
+    Args:
+        model: Ollama model name.
+
+    Returns:
+        The model digest, or an empty string if it cannot be determined.
+    """
+    key = (_settings.host, model)
+    if key in _model_digests:
+        return _model_digests[key]
+
+    failed_at = _model_digest_failures.get(key)
+    if failed_at is not None and time.monotonic() - failed_at < MODEL_INFO_RETRY_SECONDS:
+        return ""
+
+    try:
+        models = get_client("models").list().models
+    except Exception:
+        models = []
+
+    for local_model in models:
+        if local_model.model and local_model.digest:
+            _model_digests[(_settings.host, local_model.model)] = local_model.digest
+
+    if key not in _model_digests:
+        _model_digest_failures[key] = time.monotonic()
+        return ""
+    return _model_digests[key]
@@ -1,12 +1,30 @@
 """Chunk combiner agent for combining relevant chunk summaries into a cohesive summary.
 
 This agent takes multiple chunk summaries and combines them into a unified,
-comprehensive summary using AI services.
+comprehensive summary using AI services. Summaries that do not fit in the
+model context are reduced as a tree of smaller combine calls.
 """
 
-from pydantic import BaseModel
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
-from video_notes.agents.ai_client import generate_with_messages
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from video_notes.agents.ai_client import (
+    generate_with_messages,
+    generate_with_messages_async,
+    get_context_window,
+)
+from video_notes.models.usage import LLMUsage
+from video_notes.utils.tokenizer import count_message_tokens, count_tokens
+
+# Separator placed between summaries in a combine prompt
+SUMMARY_SEPARATOR = "\n\n---\n\n"
+
+# Tokens kept free in the context window for the generated summary
+COMBINE_RESPONSE_TOKENS = 1024
 
 
 class CombinedSummary(BaseModel):
@@ -14,6 +32,8 @@ class CombinedSummary(BaseModel):
 
     summary: str
     chunks_processed: int
+    reduce_levels: int = 1
+    usage: list[LLMUsage] = Field(default_factory=list)
 
 
 def get_messages(chunk_summaries: list[str], notes: str | None = None) -> list[dict[str, str]]:
@@ -26,7 +46,7 @@ def get_messages(chunk_summaries: list[str], notes: str | None = None) -> list[d
     Returns:
         A list of message dictionaries for the AI client.
     """
-    summaries_text = "\n\n---\n\n".join(chunk_summaries)
+    summaries_text = SUMMARY_SEPARATOR.join(chunk_summaries)
 
     base_prompt = (
         "You have been given a series of summaries from a long video transcript. "
@@ -76,6 +96,8 @@ def combine_relevant_chunks(
     chunk_summaries: list[str],
     model: str = "gemma:7b",
     notes: str | None = None,
+    on_token: Callable[[str], None] | None = None,
+    max_workers: int = 1,
 ) -> CombinedSummary:
     """Combine multiple chunk summaries into a cohesive final summary.
 
@@ -83,32 +105,276 @@ def combine_relevant_chunks(
     comprehensive summary that maintains coherence and emphasizes
     the most important information.
 
+    When the summaries do not fit in the model context in one prompt, they
+    are reduced as a tree: grouped into batches that fit, each batch combined
+    in parallel, and the partial summaries combined again until a single
+    prompt remains.
+
     Args:
         chunk_summaries: List of individual chunk summaries to combine.
         model: The name of the Ollama model to use.
         notes: Optional manual notes to guide the summary.
+        on_token: Optional callback receiving the final summary text as it streams in.
+        max_workers: Maximum number of batches combined concurrently.
 
     Returns:
         CombinedSummary with the unified summary and metadata.
     """
+    early_result = _check_chunk_summaries(chunk_summaries)
+    if early_result:
+        return early_result
+
+    valid_summaries = [s for s in chunk_summaries if s.strip()]
+    budget = _prompt_budget(model)
+    summaries = valid_summaries
+    levels = 1
+    usages: list[LLMUsage] = []
+
+    def _combine_group(group: list[str]) -> str | None:
+        if len(group) == 1:
+            return group[0]
+        return generate_with_messages(
+            messages=get_messages(group, notes=notes),
+            model=model,
+            stage="combine",
+            on_usage=usages.append,
+        )
+
+    while len(summaries) > 1 and (
+        count_message_tokens(get_messages(summaries, notes=notes), model) > budget
+    ):
+        groups = group_summaries(summaries, model=model, notes=notes, budget=budget)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(groups))), thread_name_prefix="chunk-combiner"
+        ) as executor:
+            responses = list(executor.map(_combine_group, groups))
+
+        next_summaries = _next_level(groups, responses)
+        if next_summaries is None:
+            return _build_combined_summary(None, len(valid_summaries), levels, usages)
+
+        summaries = next_summaries
+        levels += 1
+
+    messages = get_messages(summaries, notes=notes)
+
+    response = generate_with_messages(
+        messages=messages,
+        model=model,
+        stage="combine",
+        on_token=on_token,
+        on_usage=usages.append,
+    )
+
+    return _build_combined_summary(response, len(valid_summaries), levels, usages)
+
+
+async def combine_relevant_chunks_async(
+    chunk_summaries: list[str],
+    model: str = "gemma:7b",
+    notes: str | None = None,
+    max_workers: int = 1,
+) -> CombinedSummary:
+    """Combine multiple chunk summaries using the asyncio AI client.
+
+    Async counterpart of ``combine_relevant_chunks`` with the same contract.
+
+    Args:
+        chunk_summaries: List of individual chunk summaries to combine.
+        model: The name of the Ollama model to use.
+        notes: Optional manual notes to guide the summary.
+        max_workers: Maximum number of batches combined concurrently.
+
+    Returns:
+        CombinedSummary with the unified summary and metadata.
+    """
+    early_result = _check_chunk_summaries(chunk_summaries)
+    if early_result:
+        return early_result
+
+    valid_summaries = [s for s in chunk_summaries if s.strip()]
+    budget = _prompt_budget(model)
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    summaries = valid_summaries
+    levels = 1
+    usages: list[LLMUsage] = []
+
+    async def _combine_group(group: list[str]) -> str | None:
+        if len(group) == 1:
+            return group[0]
+        async with semaphore:
+            return await generate_with_messages_async(
+                messages=get_messages(group, notes=notes),
+                model=model,
+                stage="combine",
+                on_usage=usages.append,
+            )
+
+    while len(summaries) > 1 and (
+        count_message_tokens(get_messages(summaries, notes=notes), model) > budget
+    ):
+        groups = group_summaries(summaries, model=model, notes=notes, budget=budget)
+        responses = await asyncio.gather(*(_combine_group(group) for group in groups))
+
+        next_summaries = _next_level(groups, responses)
+        if next_summaries is None:
+            return _build_combined_summary(None, len(valid_summaries), levels, usages)
+
+        summaries = next_summaries
+        levels += 1
+
+    messages = get_messages(summaries, notes=notes)
+
+    response = await generate_with_messages_async(
+        messages=messages, model=model, stage="combine", on_usage=usages.append
+    )
+
+    return _build_combined_summary(response, len(valid_summaries), levels, usages)
+
+
+def group_summaries(
+    summaries: list[str], model: str, notes: str | None = None, budget: int | None = None
+) -> list[list[str]]:
+    """Split summaries into consecutive batches that each fit in one combine prompt.
+
+    Batches hold at least two summaries, so each reduce level shrinks the
+    number of summaries even when a single one is close to the budget. A last
+    summary left alone takes one from the previous batch when both fit in the
+    budget, otherwise it passes through to the next level unchanged.
+
+    Args:
+        summaries: Summaries to group, in transcript order.
+        model: The name of the Ollama model to use.
+        notes: Optional manual notes included in every prompt.
+        budget: Maximum prompt size in tokens, derived from the model context by default.
+
+    Returns:
+        Batches of summaries in their original order.
+    """
+    if budget is None:
+        budget = _prompt_budget(model)
+
+    base_tokens = count_message_tokens(get_messages([], notes=notes), model)
+    separator_tokens = count_tokens(SUMMARY_SEPARATOR, model)
+
+    groups: list[list[str]] = []
+    group: list[str] = []
+    group_tokens = base_tokens
+
+    for summary in summaries:
+        summary_tokens = count_tokens(summary, model) + separator_tokens
+        if len(group) >= 2 and group_tokens + summary_tokens > budget:
+            groups.append(group)
+            group, group_tokens = [], base_tokens
+        group.append(summary)
+        group_tokens += summary_tokens
+
+    if len(group) == 1 and groups and len(groups[-1]) > 2:
+        # A summary alone would be combined with nothing, borrow one from the previous batch
+        # when both still fit. It never fits in the previous batch, that is why it was split.
+        borrowed = groups[-1][-1]
+        if group_tokens + count_tokens(borrowed, model) + separator_tokens <= budget:
+            groups[-1].pop()
+            group.insert(0, borrowed)
+    if group:
+        groups.append(group)
+
+    return groups
+
+
+def _next_level(groups: list[list[str]], responses: list[str | None]) -> list[str] | None:
+    """Build the summaries of the next reduce level from the combined batches.
+
+    A batch that could not be combined passes its summaries through joined
+    together, so that one failed call does not discard the rest of the tree.
+
+    Args:
+        groups: Batches of summaries of the current level.
+        responses: Combined summary of each batch, None where the call failed.
+
+    Returns:
+        Summaries of the next level, or None if every combine call failed.
+    """
+    pairs = list(zip(groups, responses, strict=True))
+    if not any(response for group, response in pairs if len(group) > 1):
+        return None
+
+    failed = 0
+    summaries = []
+    for group, response in pairs:
+        if response:
+            summaries.append(response)
+        else:
+            failed += 1
+            summaries.append(SUMMARY_SEPARATOR.join(group))
+    if failed:
+        logger.warning(
+            f"Could not combine {failed} of {len(groups)} batches, keeping their summaries."
+        )
+    return summaries
+
+
+def _prompt_budget(model: str) -> int:
+    """Get the maximum size of a combine prompt.
+
+    Args:
+        model: The name of the Ollama model to use.
+
+    Returns:
+        Prompt budget in tokens, leaving room for the generated summary.
+    """
+    return max(1, get_context_window(model) - COMBINE_RESPONSE_TOKENS)
+
+
+def _check_chunk_summaries(chunk_summaries: list[str]) -> CombinedSummary | None:
+    """Return the result for inputs that have nothing to combine.
+
+    Args:
+        chunk_summaries: List of individual chunk summaries to combine.
+
+    Returns:
+        CombinedSummary when no valid summary was provided, None otherwise.
+    """
     if not chunk_summaries:
         return CombinedSummary(summary="", chunks_processed=0)
 
-    valid_summaries = [s for s in chunk_summaries if s.strip()]
-    if not valid_summaries:
+    if not any(s.strip() for s in chunk_summaries):
         return CombinedSummary(
             summary="No valid chunk summaries were provided to combine.",
             chunks_processed=0,
         )
 
-    messages = get_messages(valid_summaries, notes=notes)
+    return None
 
-    response = generate_with_messages(messages=messages, model=model)
 
+def _build_combined_summary(
+    response: str | None,
+    chunks_processed: int,
+    reduce_levels: int = 1,
+    usage: list[LLMUsage] | None = None,
+) -> CombinedSummary:
+    """Build the combined summary for a generated response.
+
+    Args:
+        response: Text returned by the AI client, if any.
+        chunks_processed: Number of valid chunk summaries that were combined.
+        reduce_levels: Number of combine levels that were run.
+        usage: Usage reported for each combine call.
+
+    Returns:
+        CombinedSummary with an empty summary when generation failed.
+    """
     if not response:
-        return CombinedSummary(summary="", chunks_processed=len(valid_summaries))
+        return CombinedSummary(
+            summary="",
+            chunks_processed=chunks_processed,
+            reduce_levels=reduce_levels,
+            usage=usage or [],
+        )
 
     return CombinedSummary(
         summary=response,
-        chunks_processed=len(valid_summaries),
+        chunks_processed=chunks_processed,
+        reduce_levels=reduce_levels,
+        usage=usage or [],
     )
@@ -1,13 +1,20 @@
 """Chunk sizing agent for determining optimal text chunking parameters.
 
 This agent analyzes transcript text and computes the optimal chunk size
-and overlap parameters for processing.
+and overlap parameters for processing, from the context window of the
+model that will summarize it.
 """
 
+import math
 from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from video_notes.utils.tokenizer import count_message_tokens, count_tokens
+
+from .ai_client import get_context_window
+from .chunk_summarizer import get_messages
+
 
 class TextLengthCategory(Enum):
     """Categories for text length classification."""
@@ -29,87 +36,109 @@ class TextAnalysis(BaseModel):
 class ChunkParameters(BaseModel):
     """Output model for chunk sizing parameters."""
 
-    chunk_size: int = Field(..., description="Optimal chunk size in characters", gt=0)
-    chunk_overlap: int = Field(..., description="Optimal overlap in characters", ge=0)
+    chunk_size: int = Field(..., description="Optimal chunk size in tokens", gt=0)
+    chunk_overlap: int = Field(..., description="Optimal overlap in tokens", ge=0)
     category: TextLengthCategory = Field(..., description="Text length category")
     should_use_hierarchical: bool = Field(
         ..., description="Whether hierarchical summarization is recommended"
     )
+    context_window: int | None = Field(
+        default=None, description="Context window of the model in tokens", gt=0
+    )
+
+
+# Tokens kept free in the context window for a chunk summary
+SUMMARY_RESPONSE_TOKENS = 1024
 
+# Smallest chunk size, whatever the context window left after the prompt
+MIN_CHUNK_TOKENS = 256
 
-# Optimal chunk size mapping based on text length category
-CHUNK_SIZE_MAP = {
-    TextLengthCategory.VERY_SHORT: 2000,  # No chunking needed
-    TextLengthCategory.SHORT: 3000,  # Small chunks for better granularity
-    TextLengthCategory.MEDIUM: 4000,  # Standard chunk size
-    TextLengthCategory.LONG: 5000,  # Larger chunks for efficiency
-    TextLengthCategory.VERY_LONG: 6000,  # Maximum chunk size
-}
-
-# Optimal overlap mapping based on text length category
-OVERLAP_MAP = {
-    TextLengthCategory.VERY_SHORT: 100,  # Minimal overlap
-    TextLengthCategory.SHORT: 150,  # Small overlap
-    TextLengthCategory.MEDIUM: 200,  # Standard overlap
-    TextLengthCategory.LONG: 300,  # More overlap for continuity
-    TextLengthCategory.VERY_LONG: 400,  # Maximum overlap for context preservation
-}
-
-# Hierarchical summarization recommendation mapping based on text length category
-HIERARCHICAL_MAP = {
-    TextLengthCategory.VERY_SHORT: False,  # No hierarchical needed for very short text
-    TextLengthCategory.SHORT: False,  # No hierarchical needed for short text
-    TextLengthCategory.MEDIUM: True,  # Use hierarchical for medium text
-    TextLengthCategory.LONG: True,  # Use hierarchical for long text
-    TextLengthCategory.VERY_LONG: True,  # Use hierarchical for very long text
-}
-
-
-def compute_chunk_parameters(text: str) -> ChunkParameters:
+# Fraction of each chunk repeated at the start of the next one
+OVERLAP_RATIO = 0.05
+
+# Extra room given to balanced chunks, since sentence boundaries end them up
+# to 20% early and would otherwise push a sliver of text into one more chunk
+BOUNDARY_SLACK = 0.1
+
+
+def compute_chunk_parameters(
+    text: str, model: str | None = None, notes: str | None = None
+) -> ChunkParameters:
     """Compute optimal chunk size and overlap parameters for text processing.
 
-    This agent analyzes the input text characteristics and determines
-    the best chunking strategy based on text length and complexity.
+    Chunks are sized from the context window of the model: the window minus
+    the summarization prompt and room for the summary is the largest chunk a
+    single call can take. Text fitting in that budget is summarized directly;
+    longer text is split into the fewest chunks that fit, of balanced sizes.
 
     Args:
         text (str): The transcript text to analyze
+        model (str | None): Model whose tokenizer measures the text and whose
+            context window bounds the chunks
+        notes (str | None): Manual notes included in every summarization prompt
 
     Returns:
         ChunkParameters with optimal chunk_size, overlap, and processing strategy
     """
-    text_length = len(text)
-    category = _categorize_text_length(text_length)
-
-    chunk_size = CHUNK_SIZE_MAP[category]
-    chunk_overlap = OVERLAP_MAP[category]
-
-    # Determine if hierarchical summarization should be used
-    should_use_hierarchical = HIERARCHICAL_MAP[category]
+    token_count = count_tokens(text, model)
+    context_window = get_context_window(model)
+    budget = chunk_token_budget(context_window, model, notes)
+
+    if token_count <= budget:
+        return ChunkParameters(
+            chunk_size=budget,
+            chunk_overlap=0,
+            category=_categorize_token_count(token_count),
+            should_use_hierarchical=False,
+            context_window=context_window,
+        )
+
+    # Each chunk after the first only adds its size minus the overlap
+    chunk_overlap = int(budget * OVERLAP_RATIO)
+    stride = budget - chunk_overlap
+    chunk_count = math.ceil((token_count - chunk_overlap) / stride)
+    balanced_stride = math.ceil((token_count - chunk_overlap) / chunk_count * (1 + BOUNDARY_SLACK))
 
     return ChunkParameters(
-        chunk_size=chunk_size,
+        chunk_size=min(budget, balanced_stride + chunk_overlap),
         chunk_overlap=chunk_overlap,
-        category=category,
-        should_use_hierarchical=should_use_hierarchical,
+        category=_categorize_token_count(token_count),
+        should_use_hierarchical=True,
+        context_window=context_window,
     )
 
 
-def _categorize_text_length(text_length: int) -> TextLengthCategory:
+def chunk_token_budget(context_window: int, model: str | None, notes: str | None = None) -> int:
+    """Get the largest chunk that fits in a summarization call.
+
+    Args:
+        context_window (int): Context window of the model in tokens
+        model (str | None): Model whose tokenizer measures the prompt
+        notes (str | None): Manual notes included in the prompt
+
+    Returns:
+        Chunk size in tokens, at least ``MIN_CHUNK_TOKENS``
+    """
+    prompt_tokens = count_message_tokens(get_messages("", 1, notes), model)
+    return max(MIN_CHUNK_TOKENS, context_window - prompt_tokens - SUMMARY_RESPONSE_TOKENS)
+
+
+def _categorize_token_count(token_count: int) -> TextLengthCategory:
     """Categorize text by length.
 
     Args:
-        text_length (int): Length of text in characters
+        token_count (int): Length of text in tokens
 
     Returns:
         TextLengthCategory: Category based on text length
     """
-    if text_length < 2000:
+    if token_count < 500:
         return TextLengthCategory.VERY_SHORT
-    elif text_length < 8000:
+    elif token_count < 2000:
         return TextLengthCategory.SHORT
-    elif text_length < 20000:
+    elif token_count < 5000:
         return TextLengthCategory.MEDIUM
-    elif text_length < 50000:
+    elif token_count < 12500:
         return TextLengthCategory.LONG
     else:
         return TextLengthCategory.VERY_LONG
@@ -2,19 +2,47 @@
 
 This agent takes a text chunk and summarization parameters to generate
 a focused summary using AI services.
+
+By default the prompt of every chunk of a job starts with the same system
+prompt, instructions and notes, and only ends with the section number and
+content. Ollama keeps the evaluated prompt of each parallel slot in its KV
+cache, so this shared prefix is only evaluated once per slot instead of once
+per chunk.
 """
 
+from collections.abc import Callable
+from enum import Enum
 from typing import Self
 
 from pydantic import BaseModel, Field, model_validator
 
-from .ai_client import generate_with_messages
+from video_notes.models.usage import LLMUsage
+
+from .ai_client import generate_with_messages, generate_with_messages_async
+
+
+class PromptLayout(Enum):
+    """Order of the parts of a chunk summarization prompt."""
+
+    # Section number first, then instructions, notes and content
+    SECTION_FIRST = "section_first"
+    # Instructions and notes first, identical for every chunk, then section and content
+    SHARED_PREFIX = "shared_prefix"
+
+
+# Extraction instructions shared by every chunk
+INSTRUCTIONS = """Extract and summarize the most important information. Focus on:
+- Key concepts and main ideas
+- Important facts, data points, or statistics
+- Actionable insights or practical takeaways
+- Notable quotes or examples"""
 
 
 def get_messages(
     content: str,
     chunk_number: int,
     notes: str | None = None,
+    layout: PromptLayout = PromptLayout.SHARED_PREFIX,
 ) -> list[dict[str, str]]:
     """Generate messages for chunk summarization.
 
@@ -22,18 +50,12 @@ def get_messages(
         content: The text content to summarize.
         chunk_number: The section number for context.
         notes: Optional manual notes to guide the summary.
+        layout: Order of the prompt parts, see ``PromptLayout``.
 
     Returns:
         List of message dictionaries for AI client.
     """
-    base_prompt = f"""This is section {chunk_number} of a longer transcript.
-
-Extract and summarize the most important information. Focus on:
-- Key concepts and main ideas
-- Important facts, data points, or statistics
-- Actionable insights or practical takeaways
-- Notable quotes or examples"""
-
+    notes_guidance = None
     if notes:
         notes_guidance = (
             "A user has provided the following notes to guide the summary. "
@@ -42,15 +64,22 @@ Extract and summarize the most important information. Focus on:
             "\n\n"
             f"USER NOTES:\n{notes}"
         )
-        user_content = "\n\n".join(
-            [
-                base_prompt,
-                notes_guidance,
-                f"Content to summarize:\n{content}",
-            ]
-        )
+
+    if layout == PromptLayout.SECTION_FIRST:
+        parts = [
+            f"This is section {chunk_number} of a longer transcript.",
+            INSTRUCTIONS,
+            notes_guidance,
+            f"Content to summarize:\n{content}",
+        ]
     else:
-        user_content = f"{base_prompt}\n\nContent to summarize:\n{content}"
+        parts = [
+            "You will be given one section of a longer transcript.",
+            INSTRUCTIONS,
+            notes_guidance,
+            f"Content to summarize (section {chunk_number}):\n{content}",
+        ]
+    user_content = "\n\n".join(part for part in parts if part)
 
     system_content = """You are an expert at creating concise, well-structured summaries.
 
@@ -107,6 +136,9 @@ class ChunkSummary(BaseModel):
     word_count: int = Field(
         default=0, description="Word count of the generated summary (auto-calculated)"
     )
+    usage: LLMUsage | None = Field(
+        default=None, description="Tokens and durations reported for the generation call"
+    )
 
     @model_validator(mode="after")
     def calculate_word_count(self) -> Self:
@@ -123,6 +155,8 @@ def summarize_chunk(
     chunk_index: int,
     model: str = "gemma3:12b",
     notes: str | None = None,
+    on_token: Callable[[str], None] | None = None,
+    layout: PromptLayout = PromptLayout.SHARED_PREFIX,
 ) -> ChunkSummary:
     """Summarize a single text chunk using AI service.
 
@@ -134,45 +168,137 @@ def summarize_chunk(
         chunk_index: Index of the chunk in the sequence
         model: Ollama model name to use for generation
         notes: Optional manual notes to guide the summary.
+        on_token: Optional callback receiving the summary text as it streams in.
+        layout: Order of the prompt parts.
 
     Returns:
         ChunkSummary with the generated summary and metadata
     """
     # Validate input
     if not chunk_content.strip():
-        return ChunkSummary(
-            summary="",
-            chunk_index=chunk_index,
-            success=False,
-            error_message="Empty chunk content provided",
-        )
+        return _empty_chunk_summary(chunk_index)
 
     # Create messages for AI service
-    messages = get_messages(chunk_content, chunk_index + 1, notes=notes)
+    messages = get_messages(chunk_content, chunk_index + 1, notes=notes, layout=layout)
+
+    usages: list[LLMUsage] = []
 
     try:
         # Generate summary using AI client
-        summary_text = generate_with_messages(messages=messages, model=model)
+        summary_text = generate_with_messages(
+            messages=messages,
+            model=model,
+            stage="summarize",
+            on_token=on_token,
+            on_usage=usages.append,
+        )
+        return _build_chunk_summary(summary_text, chunk_index, usages)
 
-        if summary_text is None or not summary_text.strip():
-            return ChunkSummary(
-                summary="",
-                chunk_index=chunk_index,
-                success=False,
-                error_message="AI client returned no response or empty response",
-            )
+    except Exception as e:
+        return _failed_chunk_summary(chunk_index, e)
 
-        return ChunkSummary(
-            summary=summary_text.strip(),
-            chunk_index=chunk_index,
-            success=True,
-            error_message=None,
+
+async def summarize_chunk_async(
+    chunk_content: str,
+    chunk_index: int,
+    model: str = "gemma3:12b",
+    notes: str | None = None,
+    layout: PromptLayout = PromptLayout.SHARED_PREFIX,
+) -> ChunkSummary:
+    """Summarize a single text chunk using the asyncio AI client.
+
+    Async counterpart of ``summarize_chunk`` with the same contract.
+
+    Args:
+        chunk_content: The text content to summarize
+        chunk_index: Index of the chunk in the sequence
+        model: Ollama model name to use for generation
+        notes: Optional manual notes to guide the summary.
+        layout: Order of the prompt parts.
+
+    Returns:
+        ChunkSummary with the generated summary and metadata
+    """
+    if not chunk_content.strip():
+        return _empty_chunk_summary(chunk_index)
+
+    messages = get_messages(chunk_content, chunk_index + 1, notes=notes, layout=layout)
+
+    usages: list[LLMUsage] = []
+
+    try:
+        summary_text = await generate_with_messages_async(
+            messages=messages, model=model, stage="summarize", on_usage=usages.append
         )
+        return _build_chunk_summary(summary_text, chunk_index, usages)
 
     except Exception as e:
+        return _failed_chunk_summary(chunk_index, e)
+
+
+def _build_chunk_summary(
+    summary_text: str | None, chunk_index: int, usages: list[LLMUsage]
+) -> ChunkSummary:
+    """Build the chunk summary for a generated response.
+
+    Args:
+        summary_text: Text returned by the AI client, if any.
+        chunk_index: Index of the chunk in the sequence
+        usages: Usage reported for the generation call, empty if it failed.
+
+    Returns:
+        ChunkSummary marked as failed when the response is empty.
+    """
+    usage = usages[-1] if usages else None
+
+    if summary_text is None or not summary_text.strip():
         return ChunkSummary(
             summary="",
             chunk_index=chunk_index,
             success=False,
-            error_message=f"Summarization failed: {str(e)}",
+            error_message="AI client returned no response or empty response",
+            usage=usage,
         )
+
+    return ChunkSummary(
+        summary=summary_text.strip(),
+        chunk_index=chunk_index,
+        success=True,
+        error_message=None,
+        usage=usage,
+    )
+
+
+def _empty_chunk_summary(chunk_index: int) -> ChunkSummary:
+    """Build the failed chunk summary returned for empty content.
+
+    Args:
+        chunk_index: Index of the chunk in the sequence
+
+    Returns:
+        ChunkSummary describing the empty input.
+    """
+    return ChunkSummary(
+        summary="",
+        chunk_index=chunk_index,
+        success=False,
+        error_message="Empty chunk content provided",
+    )
+
+
+def _failed_chunk_summary(chunk_index: int, error: Exception) -> ChunkSummary:
+    """Build the failed chunk summary returned when generation raises.
+
+    Args:
+        chunk_index: Index of the chunk in the sequence
+        error: Exception raised during summarization
+
+    Returns:
+        ChunkSummary describing the failure.
+    """
+    return ChunkSummary(
+        summary="",
+        chunk_index=chunk_index,
+        success=False,
+        error_message=f"Summarization failed: {str(error)}",
+    )
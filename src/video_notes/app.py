@@ -1,22 +1,109 @@
 """A Streamlit application for taking notes from YouTube videos."""
 
+from collections.abc import Callable
+from typing import Any
+
 import streamlit as st
 
-from video_notes.agents import (
-    compute_chunk_parameters,
-    generate_final_markdown,
-)
+from video_notes.agents import generate_final_markdown
 from video_notes.services import get_available_models
+from video_notes.services.checkpoint import get_checkpoint_store
+from video_notes.services.metrics import metrics_from_env
+from video_notes.services.progress import (
+    PipelineStage,
+    ProgressEvent,
+    ProgressReporter,
+    ProgressSink,
+    ProgressStatus,
+    TimingRecorder,
+    UsageRecorder,
+    combine_sinks,
+)
+from video_notes.services.residency import get_model_residency
 from video_notes.services.video import validate_youtube_url
 from video_notes.services.workflow import (
-    create_direct_summary,
-    create_hierarchical_summary,
+    VideoData,
+    create_summary,
     extract_video_data,
+    record_job_usage,
+    wait_for_model,
 )
 
 # Define a default model for summarization
 DEFAULT_MODEL = "gemma3:12b"
 
+# Number of chunk summaries requested from Ollama concurrently
+DEFAULT_MAX_WORKERS = 4
+
+
+def stream_to_placeholder() -> Callable[[str], None]:
+    """Create a callback that renders streamed text progressively.
+
+    Returns:
+        Callback appending each received piece of text to an empty placeholder.
+    """
+    placeholder = st.empty()
+    parts: list[str] = []
+
+    def on_token(token: str) -> None:
+        parts.append(token)
+        placeholder.markdown("".join(parts))
+
+    return on_token
+
+
+class StreamlitProgressSink:
+    """Render workflow progress events as Streamlit status containers.
+
+    Each pipeline stage gets its own expandable status box, updated as the
+    stage reports progress. Events must be emitted from the Streamlit script
+    thread, which the workflow guarantees.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the sink without any open status container."""
+        self.containers: dict[PipelineStage, Any] = {}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """Render a progress event.
+
+        Args:
+            event: The event to render.
+        """
+        if event.stage == PipelineStage.JOB:
+            self._render_job_event(event)
+            return
+
+        if event.status == ProgressStatus.STARTED:
+            self.containers[event.stage] = st.status(event.message, expanded=False)
+            return
+
+        container = self.containers.get(event.stage)
+        if container is None:
+            container = self.containers[event.stage] = st.status(event.message, expanded=False)
+
+        if event.status == ProgressStatus.UPDATE:
+            container.write(event.message)
+        elif event.status == ProgressStatus.WARNING:
+            container.warning(event.message)
+        elif event.status == ProgressStatus.FAILED:
+            container.error(event.message)
+            container.update(state="error", expanded=True)
+        elif event.status == ProgressStatus.COMPLETED:
+            container.update(label=event.message, state="complete")
+
+    def _render_job_event(self, event: ProgressEvent) -> None:
+        """Render the start and outcome of a whole processing job.
+
+        Args:
+            event: A job stage event.
+        """
+        if event.status == ProgressStatus.COMPLETED:
+            st.balloons()
+            st.success(event.message)
+        elif event.status == ProgressStatus.FAILED:
+            st.error(event.message)
+
 
 def process_video_url(youtube_url: str, manual_notes: str, model: str) -> str | None:
     """Processes a YouTube URL to generate summarized notes.
@@ -33,35 +120,66 @@ def process_video_url(youtube_url: str, manual_notes: str, model: str) -> str |
     Returns:
         The generated markdown notes as a string, or None if processing fails.
     """
-    with st.spinner("Step 1: Fetching video data and transcript..."):
-        video_data = extract_video_data(youtube_url)
+    metrics = metrics_from_env()
+    recorder = TimingRecorder()
+    usage_recorder = UsageRecorder()
+    recorders = combine_sinks(recorder, usage_recorder, metrics)
+    progress = combine_sinks(StreamlitProgressSink(), recorders)
+
+    # Job events only feed the recorders, the page reports the outcome itself
+    with ProgressReporter(recorders).stage(PipelineStage.JOB, f"Processing {youtube_url}") as job:
+        video_data, final_notes = generate_notes(youtube_url, manual_notes, model, progress)
+        if final_notes is None:
+            job.fail("Failed to generate notes")
+
+    # The job timing is only known once its stage has ended
+    record_job_usage(
+        youtube_url,
+        model,
+        video_data.video_info if video_data else None,
+        final_notes is not None,
+        recorder.timings,
+        usage_recorder.usages,
+    )
+    return final_notes
+
+
+def generate_notes(
+    youtube_url: str, manual_notes: str, model: str, progress: ProgressSink
+) -> tuple[VideoData | None, str | None]:
+    """Fetch, summarize and format the notes of a video.
+
+    Args:
+        youtube_url: The URL of the YouTube video.
+        manual_notes: Optional manual notes to include in the final output.
+        model: The model to use for summarization.
+        progress: Sink receiving the progress events of each step.
+
+    Returns:
+        Tuple of (video data if it was fetched, generated markdown notes or None
+        if processing fails).
+    """
+    with get_model_residency().job(model) as warm_up:
+        video_data = extract_video_data(youtube_url, progress=progress)
         if not video_data or not video_data.transcript_text:
             st.error("Could not retrieve video transcript. Please check the URL.")
-            return None
-
-    with st.spinner("Step 2: Analyzing transcript for summarization..."):
-        chunk_params = compute_chunk_parameters(video_data.transcript_text)
-
-    with st.spinner("Step 3: Generating summary..."):
-        if chunk_params.should_use_hierarchical:
-            with st.spinner("Step 3: Generating hierarchical summary..."):
-                summary_text = create_hierarchical_summary(
-                    transcript_text=video_data.transcript_text,
-                    chunk_params=chunk_params,
-                    model=model,
-                    notes=manual_notes,
-                )
-        else:
-            with st.spinner("Step 3: Generating direct summary..."):
-                summary_text = create_direct_summary(
-                    transcript_text=video_data.transcript_text,
-                    model=model,
-                    notes=manual_notes,
-                )
+            return video_data, None
+
+        wait_for_model(model, warm_up, progress=progress)
+        summary_text = create_summary(
+            transcript_text=video_data.transcript_text,
+            model=model,
+            notes=manual_notes,
+            max_workers=DEFAULT_MAX_WORKERS,
+            on_token=stream_to_placeholder(),
+            progress=progress,
+            checkpoints=get_checkpoint_store(),
+            video_id=video_data.video_info.video_id,
+        )
 
-        if not summary_text:
-            st.error("Failed to generate summary.")
-            return None
+    if not summary_text:
+        st.error("Failed to generate summary.")
+        return video_data, None
 
     with st.spinner("Step 4: Finalizing markdown..."):
         final_notes = generate_final_markdown(
@@ -73,7 +191,7 @@ def process_video_url(youtube_url: str, manual_notes: str, model: str) -> str |
             duration=video_data.video_info.duration_formatted,
         )
 
-    return final_notes
+    return video_data, final_notes
 
 
 def main() -> None:
@@ -99,6 +217,11 @@ def main() -> None:
             index=default_index,
         )
 
+        # Load the model while the user pastes a URL, once per selection
+        if st.session_state.get("preloaded_model") != selected_model:
+            get_model_residency().preload(selected_model)
+            st.session_state.preloaded_model = selected_model
+
     youtube_url = st.text_input("YouTube Video URL")
     manual_notes = st.text_area("Manual Notes")
 
@@ -0,0 +1,330 @@
+"""Command line interface for batch processing of YouTube videos.
+
+Every processed URL is reported as one JSON object per line on stdout, so the
+output can be piped into other tools. The exit code is 0 when every video was
+processed, 1 when at least one failed and 2 on usage errors.
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TextIO
+
+import click
+from loguru import logger
+
+from video_notes.models import ProcessingConfig, ProcessingResult
+from video_notes.services.metrics import serve_metrics
+from video_notes.services.progress import ProgressEvent, ProgressSink, combine_sinks
+from video_notes.services.usage import get_usage_ledger
+
+DEFAULT_MODEL = "gemma3:12b"
+
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+_output_lock = threading.Lock()
+
+
+def emit(event: str, **fields: Any) -> None:
+    """Write a JSON-lines record to stdout.
+
+    Args:
+        event: Name of the event.
+        **fields: Additional fields of the record.
+    """
+    record = {"event": event, "timestamp": time.time(), **fields}
+    with _output_lock:
+        click.echo(json.dumps(record, ensure_ascii=False))
+
+
+def read_urls(urls: tuple[str, ...], url_file: TextIO | None) -> list[str]:
+    """Collect URLs from arguments, a file and stdin.
+
+    Blank lines and lines starting with ``#`` are ignored. Standard input is
+    read when ``-`` is given as an argument or when no URL was provided and
+    stdin is not a terminal.
+
+    Args:
+        urls: URLs given as command arguments.
+        url_file: Optional file with one URL per line.
+
+    Returns:
+        URLs in the order they were provided.
+    """
+    lines: list[str] = [url for url in urls if url != "-"]
+
+    if url_file is not None:
+        lines.extend(url_file)
+
+    if "-" in urls or (not lines and not sys.stdin.isatty()):
+        lines.extend(sys.stdin)
+
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+def progress_sink(url: str) -> ProgressSink:
+    """Create a sink writing the progress events of a job as JSON lines.
+
+    Args:
+        url: URL of the video being processed, added to every record.
+
+    Returns:
+        Sink emitting a ``progress`` record for each event.
+    """
+
+    def _emit_progress(event: ProgressEvent) -> None:
+        emit("progress", url=url, **event.model_dump(mode="json"))
+
+    return _emit_progress
+
+
+def process_url(
+    config: ProcessingConfig,
+    show_progress: bool = False,
+    metrics: ProgressSink | None = None,
+) -> ProcessingResult:
+    """Process a single URL and report its start and outcome.
+
+    Args:
+        config: Processing configuration for the URL.
+        show_progress: Whether to emit the progress events of the workflow.
+        metrics: Optional sink recording the job in the service metrics.
+
+    Returns:
+        ProcessingResult of the video, failed if the URL is invalid or processing raised.
+    """
+    # yt-dlp and Ollama take a second to import, only pay for it when processing
+    from video_notes.services.video import validate_youtube_url
+    from video_notes.services.workflow import process_video
+
+    started_at = time.monotonic()
+    emit("started", url=config.youtube_url)
+
+    if not validate_youtube_url(config.youtube_url):
+        result = ProcessingResult(success=False, error_message="Invalid YouTube URL")
+    else:
+        try:
+            progress = progress_sink(config.youtube_url) if show_progress else None
+            result = process_video(config, progress=combine_sinks(metrics, progress))
+        except Exception as e:
+            logger.opt(exception=True).debug(f"Processing failed for {config.youtube_url}")
+            result = ProcessingResult(success=False, error_message=str(e))
+
+    emit(
+        "finished",
+        url=config.youtube_url,
+        duration=round(time.monotonic() - started_at, 3),
+        **result.model_dump(),
+    )
+    return result
+
+
+def _configure_logging(ctx: click.Context, param: click.Parameter, verbose: bool) -> None:
+    """Log to stderr, with debug messages if ``--verbose`` was given.
+
+    The group always configures logging; a command only switches to debug
+    logging, so that ``--verbose`` works before or after the command name.
+
+    Args:
+        ctx: Context of the group or command being parsed.
+        param: The ``--verbose`` option.
+        verbose: Whether the flag was given.
+    """
+    if verbose or ctx.parent is None:
+        logger.remove()
+        logger.add(sys.stderr, level="DEBUG" if verbose else "WARNING")
+
+
+verbose_option = click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    expose_value=False,
+    callback=_configure_logging,
+    help="Log detailed progress to stderr.",
+)
+
+
+@click.group()
+@verbose_option
+def cli() -> None:
+    """Download and summarize YouTube video transcripts using Ollama."""
+
+
+@cli.command()
+@verbose_option
+def info() -> None:
+    """List the models available on the Ollama server."""
+    from video_notes.services.ollama import get_available_models
+
+    models = get_available_models()
+    if not models:
+        click.echo("❌ Could not connect to Ollama or no model is installed.", err=True)
+        sys.exit(EXIT_FAILURE)
+
+    for model in models:
+        click.echo(model)
+
+
+@cli.command()
+@verbose_option
+@click.option(
+    "--days",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Only include LLM calls from the last N days.",
+)
+def usage(days: float | None) -> None:
+    """Report token throughput, cold loads and cost per video hour of each model.
+
+    One ``model_usage`` JSON line is written per model recorded in the usage ledger.
+    Requests that only preload a model are reported as ``preloads``, not as calls.
+    """
+    since = time.time() - days * 86400 if days is not None else None
+    try:
+        ledger = get_usage_ledger()
+        model_stats = ledger.model_stats(since=since) if ledger else None
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"❌ Could not read the usage ledger: {e}", err=True)
+        sys.exit(EXIT_FAILURE)
+
+    if model_stats is None:
+        click.echo("❌ The usage ledger is disabled (VIDEO_NOTES_USAGE_LEDGER=0).", err=True)
+        sys.exit(EXIT_FAILURE)
+
+    for stats in model_stats:
+        emit(
+            "model_usage",
+            **stats.model_dump(),
+            cold_load_rate=stats.cold_load_rate,
+            server_seconds_per_video_hour=stats.server_seconds_per_video_hour,
+        )
+
+
+@cli.command()
+@verbose_option
+@click.argument("urls", nargs=-1)
+@click.option(
+    "--file",
+    "-f",
+    "url_file",
+    type=click.File("r"),
+    help="File with one URL per line ('-' for stdin).",
+)
+@click.option("--model", "-m", default=DEFAULT_MODEL, show_default=True, help="Ollama model.")
+@click.option(
+    "--output-folder",
+    "-o",
+    default=".",
+    show_default=True,
+    type=click.Path(file_okay=False),
+    help="Directory where summaries are written.",
+)
+@click.option("--notes", "-n", default=None, help="Manual notes to guide every summary.")
+@click.option("--save-transcript", is_flag=True, help="Also save the raw transcripts.")
+@click.option(
+    "--summary-file",
+    default=None,
+    help="Summary file name in the output folder, for a single URL.",
+)
+@click.option(
+    "--transcript-file",
+    default=None,
+    help="Transcript file name in the output folder, for a single URL; saves the transcript.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of videos processed concurrently.",
+)
+@click.option(
+    "--max-workers",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of chunk summaries requested concurrently per video.",
+)
+@click.option(
+    "--progress",
+    "show_progress",
+    is_flag=True,
+    help="Emit a JSON line for every workflow progress event.",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(min=0, max=65535),
+    envvar="VIDEO_NOTES_METRICS_PORT",
+    help="Serve Prometheus metrics on this port while processing.",
+)
+def process(
+    urls: tuple[str, ...],
+    url_file: TextIO | None,
+    model: str,
+    output_folder: str,
+    notes: str | None,
+    save_transcript: bool,
+    summary_file: str | None,
+    transcript_file: str | None,
+    jobs: int,
+    max_workers: int,
+    show_progress: bool,
+    metrics_port: int | None,
+) -> None:
+    """Process one or more YouTube videos into markdown summaries.
+
+    URLs are read from the arguments, from --file and from stdin.
+    """
+    video_urls = read_urls(urls, url_file)
+    if not video_urls:
+        raise click.UsageError("No URL provided.")
+    if (summary_file or transcript_file) and len(video_urls) > 1:
+        raise click.UsageError("--summary-file and --transcript-file need a single URL.")
+
+    configs = [
+        ProcessingConfig(
+            youtube_url=url,
+            model=model,
+            output_folder=output_folder,
+            save_transcript=save_transcript or transcript_file is not None,
+            notes=notes,
+            max_workers=max_workers,
+            summary_file=summary_file,
+            transcript_file=transcript_file,
+        )
+        for url in video_urls
+    ]
+
+    metrics = None
+    if metrics_port is not None:
+        try:
+            metrics = serve_metrics(metrics_port)
+        except OSError as e:
+            raise click.ClickException(f"Cannot serve metrics on port {metrics_port}: {e}") from e
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="video-job") as executor:
+        results = list(
+            executor.map(
+                partial(process_url, show_progress=show_progress, metrics=metrics), configs
+            )
+        )
+
+    failed = sum(1 for result in results if not result.success)
+    emit("summary", total=len(configs), succeeded=len(configs) - failed, failed=failed)
+    sys.exit(EXIT_FAILURE if failed else EXIT_SUCCESS)
+
+
+def main() -> None:
+    """Run the command line interface."""
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,49 @@ This package contains all the data structures and configuration classes
 used throughout the video notes processing system.
 """
 
-from .processing import ProcessingConfig, ProcessingResult
-from .text import TextChunk, TextChunker, TranscriptAnalyzer
-from .video import VideoInfo
+from typing import TYPE_CHECKING
+
+from video_notes.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .processing import (
+        ChunkTiming,
+        ProcessingConfig,
+        ProcessingResult,
+        ProcessingTimings,
+        StageTiming,
+    )
+    from .text import ChunkSpan, TextChunk, TextChunker, TranscriptAnalyzer
+    from .usage import LLMUsage, UsageSummary
+    from .video import VideoInfo
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={
+        ".processing": (
+            "ChunkTiming",
+            "ProcessingConfig",
+            "ProcessingResult",
+            "ProcessingTimings",
+            "StageTiming",
+        ),
+        ".text": ("ChunkSpan", "TextChunk", "TextChunker", "TranscriptAnalyzer"),
+        ".usage": ("LLMUsage", "UsageSummary"),
+        ".video": ("VideoInfo",),
+    },
+)
 
 __all__ = [
     "VideoInfo",
     "ProcessingConfig",
     "ProcessingResult",
+    "ProcessingTimings",
+    "StageTiming",
+    "ChunkTiming",
+    "ChunkSpan",
     "TextChunk",
     "TextChunker",
     "TranscriptAnalyzer",
+    "LLMUsage",
+    "UsageSummary",
 ]
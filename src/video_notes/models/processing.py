@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from .usage import UsageSummary
+
 
 class SummaryConfig(BaseModel):
     """Configuration for text summarization.
@@ -31,6 +33,10 @@ class ProcessingConfig(BaseModel):
         output_folder (str): The directory where output files should be saved.
         save_transcript (bool): Whether to save the transcript file (defaults to False).
         notes (str | None): Manual notes to guide the summarization process.
+        max_workers (int): Maximum number of chunk summaries requested concurrently.
+        summary_file (str | None): Summary file name, generated from the video title when None.
+        transcript_file (str | None): Transcript file name, generated from the video
+            title when None.
     """
 
     youtube_url: str
@@ -38,6 +44,72 @@ class ProcessingConfig(BaseModel):
     output_folder: str = Field(default=".")
     save_transcript: bool = Field(default=False)
     notes: str | None = Field(default=None)
+    max_workers: int = Field(default=4, ge=1)
+    summary_file: str | None = Field(default=None)
+    transcript_file: str | None = Field(default=None)
+
+
+class StageTiming(BaseModel):
+    """Wall time spent in one stage of the processing workflow.
+
+    Attributes:
+        stage (str): Name of the pipeline stage
+        elapsed (float): Seconds spent in the stage
+        success (bool): Whether the stage completed
+        steps (dict[str, float]): Seconds spent in individual steps of the stage,
+            such as the metadata and transcript downloads, which may overlap
+    """
+
+    stage: str
+    elapsed: float
+    success: bool = Field(default=True)
+    steps: dict[str, float] = Field(default_factory=dict)
+
+
+class ChunkTiming(BaseModel):
+    """Wall time spent summarizing one chunk.
+
+    Attributes:
+        chunk_index (int): Index of the chunk in the transcript
+        elapsed (float | None): Seconds spent summarizing the chunk, if known
+        characters (int): Size of the chunk in characters
+        tokens (int | None): Size of the chunk in tokens
+        success (bool): Whether the chunk was summarized
+    """
+
+    chunk_index: int
+    elapsed: float | None = Field(default=None)
+    characters: int = Field(default=0)
+    tokens: int | None = Field(default=None)
+    success: bool = Field(default=True)
+
+
+class ProcessingTimings(BaseModel):
+    """Per-stage and per-chunk timings of a processing run.
+
+    Attributes:
+        total (float | None): Seconds spent on the whole job
+        stages (list[StageTiming]): Timings of the stages, in the order they ended
+        chunks (list[ChunkTiming]): Timings of the summarized chunks, by chunk index
+    """
+
+    total: float | None = Field(default=None)
+    stages: list[StageTiming] = Field(default_factory=list)
+    chunks: list[ChunkTiming] = Field(default_factory=list)
+
+    def stage_elapsed(self, stage: str) -> float | None:
+        """Get the time spent in a stage.
+
+        Args:
+            stage: Name of the pipeline stage.
+
+        Returns:
+            Seconds spent in the stage, or None if it did not run.
+        """
+        for timing in self.stages:
+            if timing.stage == stage:
+                return timing.elapsed
+        return None
 
 
 class ProcessingResult(BaseModel):
@@ -51,9 +123,13 @@ class ProcessingResult(BaseModel):
         transcript_file (str | None): Path to the generated transcript file
         summary_file (str | None): Path to the generated summary file
         error_message (str | None): Error description if operation failed
+        timings (ProcessingTimings | None): Time spent per stage and per chunk
+        usage (UsageSummary | None): Tokens and server time used by the LLM calls
     """
 
     success: bool
     transcript_file: str | None = Field(default=None)
     summary_file: str | None = Field(default=None)
     error_message: str | None = Field(default=None)
+    timings: ProcessingTimings | None = Field(default=None)
+    usage: UsageSummary | None = Field(default=None)
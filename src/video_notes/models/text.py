@@ -1,9 +1,70 @@
 """Text processing models for transcript handling."""
 
 import re
+from collections.abc import Iterator
+from typing import NamedTuple
 
 from pydantic import BaseModel
 
+from video_notes.utils.tokenizer import DEFAULT_CHARS_PER_TOKEN, Tokenizer
+
+# Places where a chunk may end, from the most to the least preferred:
+# sentence endings, paragraph breaks and single line breaks, each with the
+# characters any match must contain
+BOUNDARY_PATTERNS = (
+    (re.compile(r"[.!?]\s+"), ".!?"),
+    (re.compile(r"\n\s*\n"), "\n"),
+    (re.compile(r"\n"), "\n"),
+)
+
+# Number of characters at the end of a chunk searched first for a boundary
+BOUNDARY_SEARCH_WINDOW = 256
+
+
+def _find_last_match_end(
+    pattern: re.Pattern[str], text: str, search_start: int, max_end: int
+) -> int | None:
+    """Find the end of the last match of a pattern in ``text[search_start:max_end]``.
+
+    Boundaries are usually close to the end of the window, so its tail is
+    searched first and the whole window is only scanned when the tail holds
+    no match.
+
+    Args:
+        pattern: Boundary pattern.
+        text: The full text being chunked.
+        search_start: Position to start searching for boundaries.
+        max_end: Maximum position to consider.
+
+    Returns:
+        End position of the last match, or None if the window has none.
+    """
+    tail_start = max(search_start, max_end - BOUNDARY_SEARCH_WINDOW)
+    last_match = _last_match(pattern, text, tail_start, max_end)
+
+    if last_match is None and tail_start > search_start:
+        last_match = _last_match(pattern, text, search_start, max_end)
+
+    return last_match.end() if last_match is not None else None
+
+
+def _last_match(pattern: re.Pattern[str], text: str, start: int, end: int) -> re.Match[str] | None:
+    """Get the last match of a pattern in ``text[start:end]`` without slicing the text.
+
+    Args:
+        pattern: Pattern to search.
+        text: The full text.
+        start: Position where the search starts.
+        end: Position treated as the end of the text.
+
+    Returns:
+        The last match, or None if there is none.
+    """
+    last_match = None
+    for match in pattern.finditer(text, start, end):
+        last_match = match
+    return last_match
+
 
 class TextChunk(BaseModel):
     """Represents a chunk of text with metadata.
@@ -33,6 +94,87 @@ class TextChunk(BaseModel):
         return len(self.content)
 
 
+class ChunkSpan(NamedTuple):
+    """A chunk referencing the transcript by offsets instead of holding a copy.
+
+    Every span of a transcript shares the same string, so overlapping chunks
+    do not duplicate text and a span costs a small tuple. The text is only
+    materialized when ``content`` is read, typically when the prompt is built.
+
+    Attributes:
+        text: The full transcript the span points into
+        start_position: Starting character position in original text
+        end_position: Ending character position in original text
+        chunk_index: Sequential index of this chunk
+    """
+
+    text: str
+    start_position: int
+    end_position: int
+    chunk_index: int
+
+    def __repr__(self) -> str:
+        """Describe the span without printing the whole transcript.
+
+        Returns:
+            Representation with the span offsets and index.
+        """
+        return (
+            f"ChunkSpan(start_position={self.start_position}, "
+            f"end_position={self.end_position}, chunk_index={self.chunk_index})"
+        )
+
+    @property
+    def content(self) -> str:
+        """Get the text of the chunk, without surrounding whitespace.
+
+        Returns:
+            A new string with the chunk content.
+        """
+        return self.text[self.start_position : self.end_position].strip()
+
+    @property
+    def length(self) -> int:
+        """Get the character length of the chunk.
+
+        Returns:
+            Number of characters in the chunk content.
+        """
+        start, end = _strip_bounds(self.text, self.start_position, self.end_position)
+        return end - start
+
+    def to_text_chunk(self) -> TextChunk:
+        """Materialize the span as a standalone TextChunk.
+
+        Returns:
+            TextChunk with a copy of the chunk content.
+        """
+        return TextChunk(
+            content=self.content,
+            start_position=self.start_position,
+            end_position=self.end_position,
+            chunk_index=self.chunk_index,
+        )
+
+
+def _strip_bounds(text: str, start: int, end: int) -> tuple[int, int]:
+    """Narrow a range of text to exclude surrounding whitespace, without copying it.
+
+    Args:
+        text: The full text.
+        start: Start of the range.
+        end: End of the range.
+
+    Returns:
+        Start and end of the range once stripped, equal if it is blank.
+    """
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
 class TextChunker:
     """Text chunking utility for breaking large text into manageable pieces.
 
@@ -40,15 +182,26 @@ class TextChunker:
     chunks with configurable size and overlap for processing by AI models.
     """
 
-    def __init__(self, chunk_size: int = 4000, overlap: int = 200) -> None:
+    def __init__(
+        self,
+        chunk_size: int = 4000,
+        overlap: int = 200,
+        tokenizer: Tokenizer | None = None,
+        chars_per_token: float | None = None,
+    ) -> None:
         """Initialize text chunker with size and overlap parameters.
 
         Args:
             chunk_size: Maximum number of tokens per chunk.
             overlap: Number of tokens to overlap between chunks.
+            tokenizer: Tokenizer of the target model, defaults to 4 characters per token.
+            chars_per_token: Fixed characters per token used instead of measuring
+                the text, to reproduce the chunks of an earlier run.
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer
+        self.fixed_chars_per_token = chars_per_token
 
     def chunk_text(self, text: str) -> list[TextChunk]:
         """Split text into overlapping chunks based on tokens.
@@ -59,15 +212,42 @@ class TextChunker:
         Returns:
             List of TextChunk objects representing the split text.
         """
-        if not text.strip():
-            return []
+        return list(self.iter_chunks(text))
 
-        # Estimate characters per token (rough approximation: 4 chars per token)
-        chars_per_token = 4
-        max_chars = self.chunk_size * chars_per_token
-        overlap_chars = self.overlap * chars_per_token
+    def iter_chunks(self, text: str) -> Iterator[TextChunk]:
+        """Lazily split text into overlapping chunks based on tokens.
+
+        Chunks are yielded as soon as their boundary is found, so consumers can
+        start processing the first chunk before the rest of the text is split.
+
+        Args:
+            text: Input text to be chunked.
+
+        Yields:
+            TextChunk objects in text order.
+        """
+        for span in self.iter_spans(text):
+            yield span.to_text_chunk()
+
+    def iter_spans(self, text: str) -> Iterator[ChunkSpan]:
+        """Lazily split text into overlapping chunks without copying their text.
+
+        Same chunks as ``iter_chunks``, as views into ``text``.
+
+        Args:
+            text: Input text to be chunked.
+
+        Yields:
+            ChunkSpan objects in text order.
+        """
+        if not text or text.isspace():
+            return
+
+        # Cut on characters, using the average token density of this text
+        chars_per_token = self.chars_per_token(text)
+        max_chars = max(1, int(self.chunk_size * chars_per_token))
+        overlap_chars = int(self.overlap * chars_per_token)
 
-        chunks = []
         start = 0
         chunk_index = 0
 
@@ -83,17 +263,16 @@ class TextChunker:
                 if sentence_end > start:
                     end = sentence_end
 
-            # Extract chunk content
-            chunk_content = text[start:end].strip()
+            # Skip chunks holding only whitespace
+            content_start, content_end = _strip_bounds(text, start, end)
 
-            if chunk_content:
-                chunk = TextChunk(
-                    content=chunk_content,
+            if content_start < content_end:
+                yield ChunkSpan(
+                    text=text,
                     start_position=start,
                     end_position=end,
                     chunk_index=chunk_index,
                 )
-                chunks.append(chunk)
                 chunk_index += 1
 
             # Calculate next start position with overlap
@@ -104,11 +283,14 @@ class TextChunker:
             next_start = max(end - overlap_chars, start + 1)
             start = next_start
 
-        return chunks
-
     def _find_sentence_boundary(self, text: str, search_start: int, max_end: int) -> int:
         """Find a good sentence boundary for chunking.
 
+        Sentence endings are preferred, then paragraph breaks, then single line
+        breaks. The search works on offsets into the full text without copying
+        the window, and in the usual case only scans the last few hundred
+        characters of the chunk.
+
         Args:
             text: The full text being chunked.
             search_start: Position to start searching for boundaries.
@@ -117,32 +299,13 @@ class TextChunker:
         Returns:
             Position of sentence boundary, or max_end if none found.
         """
-        # Look for sentence endings: ., !, ?
-        sentence_pattern = r"[.!?]\s+"
-
-        # Search backwards from max_end to find the last sentence ending
-        search_text = text[search_start:max_end]
-        matches = list(re.finditer(sentence_pattern, search_text))
-
-        if matches:
-            # Return position after the last sentence ending found
-            last_match = matches[-1]
-            return search_start + last_match.end()
-
-        # If no sentence ending found, look for other boundaries
-        # Try paragraph breaks first
-        paragraph_pattern = r"\n\s*\n"
-        matches = list(re.finditer(paragraph_pattern, search_text))
-        if matches:
-            last_match = matches[-1]
-            return search_start + last_match.end()
-
-        # Try single line breaks
-        line_pattern = r"\n"
-        matches = list(re.finditer(line_pattern, search_text))
-        if matches:
-            last_match = matches[-1]
-            return search_start + last_match.end()
+        for pattern, required_chars in BOUNDARY_PATTERNS:
+            # str.find is much cheaper than a regex scan, skip windows that cannot match
+            if all(text.find(char, search_start, max_end) < 0 for char in required_chars):
+                continue
+            boundary = _find_last_match_end(pattern, text, search_start, max_end)
+            if boundary is not None:
+                return boundary
 
         # No good boundary found, return max_end
         return max_end
@@ -156,8 +319,27 @@ class TextChunker:
         Returns:
             Estimated token count.
         """
-        # Rough estimation: ~4 characters per token
-        return len(text) // 4
+        if self.tokenizer is None:
+            # Rough estimation: ~4 characters per token
+            return int(len(text) // DEFAULT_CHARS_PER_TOKEN)
+        return self.tokenizer.count_tokens(text)
+
+    def chars_per_token(self, text: str) -> float:
+        """Measure the average number of characters per token of a text.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Characters per token for the chunker's tokenizer.
+        """
+        if self.fixed_chars_per_token is not None:
+            return self.fixed_chars_per_token
+
+        tokens = self.estimate_tokens(text)
+        if self.tokenizer is None or tokens <= 0:
+            return DEFAULT_CHARS_PER_TOKEN
+        return len(text) / tokens
 
 
 class TranscriptAnalyzer:
@@ -0,0 +1,168 @@
+"""Token and throughput accounting models for LLM calls."""
+
+import time
+from collections.abc import Iterable
+
+from pydantic import BaseModel, Field
+
+# Model load time above which a call is counted as a cold start
+COLD_LOAD_SECONDS = 0.5
+
+# Stage of the requests that only load a model, without a prompt to answer
+LOAD_STAGE = "load"
+
+
+class LLMUsage(BaseModel):
+    """Token counts and durations reported by Ollama for one chat call.
+
+    Durations are converted from the nanoseconds reported by Ollama to seconds.
+    Responses served from the response cache are recorded with ``cached`` set
+    and no tokens or durations.
+
+    Attributes:
+        model (str): Ollama model that served the call
+        stage (str | None): Pipeline stage that made the call
+        prompt_tokens (int): Number of prompt tokens evaluated
+        completion_tokens (int): Number of tokens generated
+        load_duration (float): Seconds spent loading the model
+        prompt_eval_duration (float): Seconds spent evaluating the prompt
+        eval_duration (float): Seconds spent generating the response
+        total_duration (float): Seconds spent on the whole call by the server
+        cached (bool): Whether the response came from the response cache
+        timestamp (float): Unix time at which the call finished
+    """
+
+    model: str
+    stage: str | None = Field(default=None)
+    prompt_tokens: int = Field(default=0, ge=0)
+    completion_tokens: int = Field(default=0, ge=0)
+    load_duration: float = Field(default=0.0, ge=0)
+    prompt_eval_duration: float = Field(default=0.0, ge=0)
+    eval_duration: float = Field(default=0.0, ge=0)
+    total_duration: float = Field(default=0.0, ge=0)
+    cached: bool = Field(default=False)
+    timestamp: float = Field(default_factory=time.time)
+
+    @property
+    def cold_load(self) -> bool:
+        """Check whether the model had to be loaded for this call.
+
+        Returns:
+            True when the load took at least ``COLD_LOAD_SECONDS``.
+        """
+        return self.load_duration >= COLD_LOAD_SECONDS
+
+    @property
+    def preload(self) -> bool:
+        """Check whether the request only loaded the model.
+
+        Returns:
+            True for requests of the ``LOAD_STAGE``, which are not chat calls.
+        """
+        return self.stage == LOAD_STAGE
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Get the generation speed of the call.
+
+        Returns:
+            Generated tokens per second, or None without generation time.
+        """
+        return _rate(self.completion_tokens, self.eval_duration)
+
+    @property
+    def prompt_tokens_per_second(self) -> float | None:
+        """Get the prompt evaluation speed of the call.
+
+        Returns:
+            Prompt tokens per second, or None without evaluation time.
+        """
+        return _rate(self.prompt_tokens, self.prompt_eval_duration)
+
+
+class UsageSummary(BaseModel):
+    """Token counts and durations aggregated over several LLM calls.
+
+    Requests that only load a model are counted in ``preloads`` rather than as
+    calls, their time still counts in the durations.
+
+    Attributes:
+        calls (int): Number of chat calls, including cached ones
+        cached_calls (int): Number of calls served from the response cache
+        cold_loads (int): Number of calls that had to load the model
+        preloads (int): Number of requests that only loaded the model
+        prompt_tokens (int): Total prompt tokens evaluated
+        completion_tokens (int): Total tokens generated
+        load_duration (float): Total seconds spent loading models
+        prompt_eval_duration (float): Total seconds spent evaluating prompts
+        eval_duration (float): Total seconds spent generating
+        total_duration (float): Total seconds spent by the server on the calls
+    """
+
+    calls: int = Field(default=0)
+    cached_calls: int = Field(default=0)
+    cold_loads: int = Field(default=0)
+    preloads: int = Field(default=0)
+    prompt_tokens: int = Field(default=0)
+    completion_tokens: int = Field(default=0)
+    load_duration: float = Field(default=0.0)
+    prompt_eval_duration: float = Field(default=0.0)
+    eval_duration: float = Field(default=0.0)
+    total_duration: float = Field(default=0.0)
+
+    @classmethod
+    def from_usages(cls, usages: Iterable[LLMUsage]) -> "UsageSummary":
+        """Aggregate the usage of several calls.
+
+        Args:
+            usages: Usage of each call.
+
+        Returns:
+            UsageSummary with the totals of the calls.
+        """
+        summary = cls()
+        for usage in usages:
+            if usage.preload:
+                summary.preloads += 1
+            else:
+                summary.calls += 1
+                summary.cached_calls += usage.cached
+                summary.cold_loads += usage.cold_load
+            summary.prompt_tokens += usage.prompt_tokens
+            summary.completion_tokens += usage.completion_tokens
+            summary.load_duration += usage.load_duration
+            summary.prompt_eval_duration += usage.prompt_eval_duration
+            summary.eval_duration += usage.eval_duration
+            summary.total_duration += usage.total_duration
+        return summary
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Get the average generation speed.
+
+        Returns:
+            Generated tokens per second of generation time, or None if unknown.
+        """
+        return _rate(self.completion_tokens, self.eval_duration)
+
+    @property
+    def prompt_tokens_per_second(self) -> float | None:
+        """Get the average prompt evaluation speed.
+
+        Returns:
+            Prompt tokens per second of evaluation time, or None if unknown.
+        """
+        return _rate(self.prompt_tokens, self.prompt_eval_duration)
+
+
+def _rate(tokens: int, seconds: float) -> float | None:
+    """Divide a token count by a duration.
+
+    Args:
+        tokens: Number of tokens.
+        seconds: Duration in seconds.
+
+    Returns:
+        Tokens per second, or None when the duration is zero.
+    """
+    return tokens / seconds if seconds > 0 else None
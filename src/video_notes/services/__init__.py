@@ -1,25 +1,104 @@
 """Services for video notes processing."""
 
-from .ollama import get_available_models
-from .prompt_builder import PromptBuilder
-from .video import (
-    extract_video_id,
-    extract_video_info,
-    format_video_info_display,
-    get_transcript_content,
-    get_video_metadata_summary,
-    validate_youtube_url,
+from typing import TYPE_CHECKING
+
+from video_notes.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .checkpoint import CheckpointStore, JobCheckpoint, get_checkpoint_store
+    from .metrics import PipelineMetrics, get_metrics, metrics_from_env, serve_metrics
+    from .ollama import get_available_models, load_model, unload_model
+    from .progress import (
+        PipelineStage,
+        ProgressEvent,
+        ProgressReporter,
+        ProgressSink,
+        ProgressStatus,
+        TimingRecorder,
+        UsageRecorder,
+        combine_sinks,
+        log_sink,
+        null_sink,
+    )
+    from .prompt_builder import PromptBuilder
+    from .residency import ModelResidency, get_model_residency
+    from .usage import ModelUsageStats, UsageLedger, get_usage_ledger
+    from .video import (
+        extract_video_id,
+        extract_video_info,
+        format_video_info_display,
+        get_transcript_content,
+        get_video_metadata_summary,
+        validate_youtube_url,
+    )
+    from .workflow import process_video, process_video_async
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={
+        ".checkpoint": ("CheckpointStore", "JobCheckpoint", "get_checkpoint_store"),
+        ".metrics": ("PipelineMetrics", "get_metrics", "metrics_from_env", "serve_metrics"),
+        ".ollama": ("get_available_models", "load_model", "unload_model"),
+        ".progress": (
+            "PipelineStage",
+            "ProgressEvent",
+            "ProgressReporter",
+            "ProgressSink",
+            "ProgressStatus",
+            "TimingRecorder",
+            "UsageRecorder",
+            "combine_sinks",
+            "log_sink",
+            "null_sink",
+        ),
+        ".prompt_builder": ("PromptBuilder",),
+        ".residency": ("ModelResidency", "get_model_residency"),
+        ".usage": ("ModelUsageStats", "UsageLedger", "get_usage_ledger"),
+        ".video": (
+            "extract_video_id",
+            "extract_video_info",
+            "format_video_info_display",
+            "get_transcript_content",
+            "get_video_metadata_summary",
+            "validate_youtube_url",
+        ),
+        ".workflow": ("process_video", "process_video_async"),
+    },
 )
-from .workflow import process_video
 
 __all__ = [
+    "CheckpointStore",
+    "JobCheckpoint",
+    "ModelResidency",
+    "ModelUsageStats",
+    "PipelineMetrics",
+    "PipelineStage",
+    "ProgressEvent",
+    "ProgressReporter",
+    "ProgressSink",
+    "ProgressStatus",
     "PromptBuilder",
+    "TimingRecorder",
+    "UsageLedger",
+    "UsageRecorder",
+    "combine_sinks",
     "extract_video_id",
     "extract_video_info",
     "format_video_info_display",
     "get_available_models",
+    "get_checkpoint_store",
+    "get_metrics",
+    "get_model_residency",
     "get_transcript_content",
+    "get_usage_ledger",
     "get_video_metadata_summary",
+    "load_model",
+    "log_sink",
+    "metrics_from_env",
+    "null_sink",
     "process_video",
+    "process_video_async",
+    "serve_metrics",
+    "unload_model",
     "validate_youtube_url",
 ]
@@ -0,0 +1,345 @@
+"""Checkpoints of hierarchical summarization jobs.
+
+Chunk summaries are persisted as soon as they complete, so that a job
+interrupted by an Ollama restart or a lost Streamlit session resumes from the
+chunks already summarized instead of starting over. Checkpoints are stored in
+a SQLite file next to the caches, removed once the job's summaries have been
+combined, and expire after a week otherwise.
+
+Set ``VIDEO_NOTES_CHECKPOINTS=0`` to disable checkpoints.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from pydantic import ValidationError
+
+from video_notes.agents import ChunkParameters, ChunkSummary
+from video_notes.models import ChunkSpan, TextChunk
+from video_notes.utils.cache import default_cache_dir
+
+# Seconds after which an abandoned checkpoint is removed
+CHECKPOINT_TTL = 7 * 24 * 60 * 60
+
+# Version of the database layout, older checkpoint files are discarded
+SCHEMA_VERSION = 2
+
+_store: "CheckpointStore | None" = None
+_store_lock = threading.Lock()
+
+
+def checkpoint_job_id(
+    video_id: str,
+    model: str,
+    notes: str | None,
+    transcript_text: str,
+) -> str:
+    """Identify a summarization job whose chunk summaries can be reused.
+
+    Only inputs that do not change between runs are covered: the chunking
+    depends on the context window Ollama reports and on the tokenizer
+    calibration, so it is stored in the checkpoint instead.
+
+    Args:
+        video_id: YouTube video ID.
+        model: AI model used for summarization.
+        notes: Manual notes guiding the summaries.
+        transcript_text: Transcript being summarized, in case it changed.
+
+    Returns:
+        Hex-encoded SHA-256 of the job inputs.
+    """
+    job = {
+        "video_id": video_id,
+        "model": model,
+        "notes": hashlib.sha256((notes or "").encode("utf-8")).hexdigest(),
+        "transcript": hashlib.sha256(transcript_text.encode("utf-8")).hexdigest(),
+    }
+    return hashlib.sha256(json.dumps(job, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class JobCheckpoint:
+    """Completed chunk summaries of one job."""
+
+    def __init__(
+        self,
+        store: "CheckpointStore",
+        job_id: str,
+        chunk_params: ChunkParameters | None = None,
+        chars_per_token: float | None = None,
+        chunks: dict[int, tuple[int, int, ChunkSummary]] | None = None,
+    ) -> None:
+        """Wrap the checkpoint of a job loaded from the store.
+
+        Args:
+            store: Store persisting the checkpoint.
+            job_id: Identifier of the job.
+            chunk_params: Chunking parameters the job was started with, if started.
+            chars_per_token: Characters per token the job was chunked with, if started.
+            chunks: Start position, end position and summary of each completed chunk.
+        """
+        self.store = store
+        self.job_id = job_id
+        self.chunk_params = chunk_params
+        self.chars_per_token = chars_per_token
+        self._chunks = chunks if chunks is not None else {}
+
+    @property
+    def completed(self) -> int:
+        """Get the number of chunks already summarized.
+
+        Returns:
+            Number of checkpointed chunk summaries.
+        """
+        return len(self._chunks)
+
+    @property
+    def started(self) -> bool:
+        """Check whether an earlier run recorded how the job is chunked.
+
+        Returns:
+            True if the chunking parameters of the job are known.
+        """
+        return self.chunk_params is not None and self.chars_per_token is not None
+
+    def begin(self, chunk_params: ChunkParameters, chars_per_token: float) -> None:
+        """Record how the job is chunked, unless it was started before.
+
+        Args:
+            chunk_params: Chunking parameters of the job.
+            chars_per_token: Characters per token used to size the chunks.
+        """
+        if not self.started:
+            self.chunk_params = chunk_params
+            self.chars_per_token = chars_per_token
+            self.store._save_job(self.job_id, chunk_params, chars_per_token)
+
+    def restore(self, chunk: TextChunk | ChunkSpan) -> ChunkSummary | None:
+        """Get the checkpointed summary of a chunk.
+
+        Args:
+            chunk: Chunk about to be summarized.
+
+        Returns:
+            The saved summary, or None if the chunk was not completed or its
+            boundaries differ from the checkpointed one.
+        """
+        saved = self._chunks.get(chunk.chunk_index)
+        if saved is None:
+            return None
+
+        start_position, end_position, summary = saved
+        if (start_position, end_position) != (chunk.start_position, chunk.end_position):
+            return None
+        return summary
+
+    def save(self, chunk: TextChunk | ChunkSpan, summary: ChunkSummary) -> None:
+        """Persist the summary of a completed chunk.
+
+        Failed summaries are not saved, so they are retried on resume.
+
+        Args:
+            chunk: Chunk that was summarized.
+            summary: Summary of the chunk.
+        """
+        if not summary.success:
+            return
+
+        # Tokens spent on a restored chunk belong to the run that produced it
+        saved = summary.model_copy(update={"usage": None})
+        self._chunks[chunk.chunk_index] = (chunk.start_position, chunk.end_position, saved)
+        self.store._save_chunk(self.job_id, chunk, saved)
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the job no longer needs it."""
+        self._chunks.clear()
+        self.chunk_params = None
+        self.chars_per_token = None
+        self.store._delete_job(self.job_id)
+
+
+class CheckpointStore:
+    """SQLite store of job checkpoints.
+
+    Storage errors are logged and ignored: a job whose checkpoint cannot be
+    read or written simply runs without one.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = CHECKPOINT_TTL) -> None:
+        """Open or create a checkpoint file and remove expired checkpoints.
+
+        Args:
+            path: Path of the SQLite database file.
+            ttl: Seconds after which an unfinished checkpoint is removed.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version != SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS chunks")
+                self._connection.execute("DROP TABLE IF EXISTS jobs")
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, "
+                "chunk_params TEXT NOT NULL, "
+                "chars_per_token REAL NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "job_id TEXT NOT NULL, "
+                "chunk_index INTEGER NOT NULL, "
+                "start_position INTEGER NOT NULL, "
+                "end_position INTEGER NOT NULL, "
+                "summary TEXT NOT NULL, "
+                "PRIMARY KEY (job_id, chunk_index))"
+            )
+            self._purge_expired()
+
+    def job(self, job_id: str) -> JobCheckpoint:
+        """Load the checkpoint of a job.
+
+        Args:
+            job_id: Identifier of the job, see ``checkpoint_job_id``.
+
+        Returns:
+            The job checkpoint, empty if the job was never started or its
+            checkpoint cannot be read.
+        """
+        try:
+            with self._lock:
+                job_row = self._connection.execute(
+                    "SELECT chunk_params, chars_per_token FROM jobs WHERE job_id = ?", (job_id,)
+                ).fetchone()
+                chunk_rows = self._connection.execute(
+                    "SELECT chunk_index, start_position, end_position, summary FROM chunks "
+                    "WHERE job_id = ?",
+                    (job_id,),
+                ).fetchall()
+        except sqlite3.Error:
+            logger.opt(exception=True).warning(f"Could not read checkpoint store {self.path}.")
+            return JobCheckpoint(self, job_id)
+
+        if job_row is None:
+            return JobCheckpoint(self, job_id)
+
+        try:
+            chunk_params = ChunkParameters.model_validate_json(job_row[0])
+            chunks = {
+                chunk_index: (start, end, ChunkSummary.model_validate_json(summary))
+                for chunk_index, start, end, summary in chunk_rows
+            }
+        except ValidationError:
+            logger.opt(exception=True).warning(f"Discarding corrupted checkpoint {job_id}.")
+            self._delete_job(job_id)
+            return JobCheckpoint(self, job_id)
+
+        return JobCheckpoint(self, job_id, chunk_params, job_row[1], chunks)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _save_job(self, job_id: str, chunk_params: ChunkParameters, chars_per_token: float) -> None:
+        """Record a started job.
+
+        Args:
+            job_id: Identifier of the job.
+            chunk_params: Chunking parameters of the job.
+            chars_per_token: Characters per token used to size the chunks.
+        """
+        self._write(
+            "INSERT OR REPLACE INTO jobs (job_id, chunk_params, chars_per_token, updated_at) "
+            "VALUES (?, ?, ?, ?)",
+            (job_id, chunk_params.model_dump_json(), chars_per_token, time.time()),
+        )
+
+    def _save_chunk(self, job_id: str, chunk: TextChunk | ChunkSpan, summary: ChunkSummary) -> None:
+        """Record a completed chunk summary.
+
+        Args:
+            job_id: Identifier of the job.
+            chunk: Chunk that was summarized.
+            summary: Summary of the chunk.
+        """
+        self._write(
+            "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+            (
+                job_id,
+                chunk.chunk_index,
+                chunk.start_position,
+                chunk.end_position,
+                summary.model_dump_json(),
+            ),
+        )
+        self._write("UPDATE jobs SET updated_at = ? WHERE job_id = ?", (time.time(), job_id))
+
+    def _delete_job(self, job_id: str) -> None:
+        """Remove a job and its chunk summaries.
+
+        Args:
+            job_id: Identifier of the job.
+        """
+        self._write("DELETE FROM chunks WHERE job_id = ?", (job_id,))
+        self._write("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def _write(self, statement: str, parameters: tuple[Any, ...]) -> None:
+        """Run a write statement, logging storage errors.
+
+        Args:
+            statement: SQL statement.
+            parameters: Statement parameters.
+        """
+        try:
+            with self._lock:
+                self._connection.execute(statement, parameters)
+        except sqlite3.Error:
+            logger.opt(exception=True).warning(f"Could not write to checkpoint store {self.path}.")
+
+    def _purge_expired(self) -> None:
+        """Remove the checkpoints of jobs not updated within the TTL."""
+        expired_before = time.time() - self.ttl
+        self._connection.execute(
+            "DELETE FROM chunks WHERE job_id IN (SELECT job_id FROM jobs WHERE updated_at < ?)",
+            (expired_before,),
+        )
+        self._connection.execute("DELETE FROM jobs WHERE updated_at < ?", (expired_before,))
+
+
+def get_checkpoint_store() -> CheckpointStore | None:
+    """Get the shared checkpoint store.
+
+    Returns:
+        The store, created on first use, or None when disabled with
+        ``VIDEO_NOTES_CHECKPOINTS=0`` or when it cannot be opened.
+    """
+    global _store
+
+    if os.environ.get("VIDEO_NOTES_CHECKPOINTS", "1") == "0":
+        return None
+
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = CheckpointStore(default_cache_dir() / "checkpoints.sqlite3")
+            except (OSError, sqlite3.Error):
+                logger.opt(exception=True).warning("Could not open the checkpoint store.")
+                return None
+        return _store
@@ -0,0 +1,377 @@
+"""Prometheus metrics for the video processing service.
+
+``PipelineMetrics`` is a progress sink turning workflow events into counters,
+gauges and histograms: jobs started, finished and in flight, stage and chunk
+latencies, and the LLM calls, tokens and model loads reported by Ollama. The
+metrics are served in the Prometheus text format from a small HTTP thread::
+
+    metrics = serve_metrics(9108)
+    process_video(config, progress=metrics)
+
+The Streamlit app and the command line interface start the server when
+``VIDEO_NOTES_METRICS_PORT`` is set.
+"""
+
+import math
+import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loguru import logger
+
+from video_notes.models import LLMUsage
+from video_notes.services.progress import PipelineStage, ProgressEvent, ProgressStatus
+
+DEFAULT_HOST = "127.0.0.1"
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Name, type and help text of every exported metric
+METRICS = {
+    "video_notes_jobs_started_total": ("counter", "Video processing jobs started."),
+    "video_notes_jobs_finished_total": ("counter", "Video processing jobs finished, by outcome."),
+    "video_notes_jobs_in_flight": ("gauge", "Video processing jobs currently running."),
+    "video_notes_stage_duration_seconds": ("histogram", "Wall time of pipeline stages."),
+    "video_notes_chunk_duration_seconds": ("histogram", "Wall time of chunk summarizations."),
+    "video_notes_llm_calls_total": ("counter", "LLM chat calls, by model, stage and cache use."),
+    "video_notes_llm_preloads_total": ("counter", "Requests that only loaded a model."),
+    "video_notes_llm_prompt_tokens_total": ("counter", "Prompt tokens evaluated by Ollama."),
+    "video_notes_llm_completion_tokens_total": ("counter", "Tokens generated by Ollama."),
+    "video_notes_llm_server_seconds_total": (
+        "counter",
+        "Seconds spent by Ollama on chat calls and preloads.",
+    ),
+    "video_notes_llm_model_loads_total": (
+        "counter",
+        "Preloads and chat calls that had to load the model.",
+    ),
+    "video_notes_llm_load_seconds_total": ("counter", "Seconds spent by Ollama loading models."),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+_metrics: "PipelineMetrics | None" = None
+_server: "MetricsServer | None" = None
+_metrics_lock = threading.Lock()
+
+
+class _Histogram:
+    """Cumulative bucket counts, sum and count of observed values."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram.
+
+        Args:
+            value: Observed value.
+        """
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.buckets[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class PipelineMetrics:
+    """Thread-safe registry of the service metrics, fed by progress events."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics with zero jobs."""
+        self._lock = threading.Lock()
+        self._values: dict[str, dict[Labels, float]] = {
+            "video_notes_jobs_started_total": {(): 0.0},
+            "video_notes_jobs_in_flight": {(): 0.0},
+        }
+        self._histograms: dict[str, dict[Labels, _Histogram]] = {}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """Update the metrics from a progress event.
+
+        Args:
+            event: The event to record.
+        """
+        with self._lock:
+            for usage in event.usage:
+                self._record_usage(usage)
+
+            if event.stage == PipelineStage.JOB:
+                self._record_job(event)
+
+            if event.elapsed is None:
+                return
+            if event.chunk_index is not None:
+                self._observe("video_notes_chunk_duration_seconds", {}, event.elapsed)
+            elif event.status in (ProgressStatus.COMPLETED, ProgressStatus.FAILED):
+                self._observe(
+                    "video_notes_stage_duration_seconds",
+                    {"stage": event.stage.value, "outcome": _outcome(event)},
+                    event.elapsed,
+                )
+
+    def render(self) -> str:
+        """Format the metrics in the Prometheus text exposition format.
+
+        Returns:
+            Text of a ``/metrics`` response.
+        """
+        with self._lock:
+            return "".join(f"{line}\n" for line in self._lines())
+
+    def _record_job(self, event: ProgressEvent) -> None:
+        """Count a job start or end.
+
+        Args:
+            event: A job stage event.
+        """
+        if event.status == ProgressStatus.STARTED:
+            self._add("video_notes_jobs_started_total", {}, 1)
+            self._add("video_notes_jobs_in_flight", {}, 1)
+        elif event.status in (ProgressStatus.COMPLETED, ProgressStatus.FAILED):
+            self._add("video_notes_jobs_finished_total", {"outcome": _outcome(event)}, 1)
+            self._add("video_notes_jobs_in_flight", {}, -1)
+
+    def _record_usage(self, usage: LLMUsage) -> None:
+        """Count an LLM call and the tokens and time it used.
+
+        Preloads are counted apart from the chat calls, only their time is
+        added to the call totals.
+
+        Args:
+            usage: Usage reported for the call.
+        """
+        model = {"model": usage.model}
+        if usage.preload:
+            self._add("video_notes_llm_preloads_total", model, 1)
+        else:
+            self._add(
+                "video_notes_llm_calls_total",
+                {**model, "stage": usage.stage or "", "cached": str(usage.cached).lower()},
+                1,
+            )
+        if usage.cached:
+            return
+
+        self._add("video_notes_llm_prompt_tokens_total", model, usage.prompt_tokens)
+        self._add("video_notes_llm_completion_tokens_total", model, usage.completion_tokens)
+        self._add("video_notes_llm_server_seconds_total", model, usage.total_duration)
+        self._add("video_notes_llm_load_seconds_total", model, usage.load_duration)
+        self._add("video_notes_llm_model_loads_total", model, int(usage.cold_load))
+
+    def _add(self, name: str, labels: dict[str, str], amount: float) -> None:
+        """Add an amount to a counter or gauge.
+
+        Args:
+            name: Metric name.
+            labels: Label values of the series.
+            amount: Amount to add, negative to decrease a gauge.
+        """
+        series = self._values.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0.0) + amount
+
+    def _observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        """Add a value to a histogram.
+
+        Args:
+            name: Metric name.
+            labels: Label values of the series.
+            value: Observed value.
+        """
+        series = self._histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series.setdefault(key, _Histogram()).observe(value)
+
+    def _lines(self) -> Iterator[str]:
+        """Generate the exposition lines of every metric with samples.
+
+        Yields:
+            HELP, TYPE and sample lines.
+        """
+        for name, (metric_type, help_text) in METRICS.items():
+            values = self._values.get(name, {})
+            histograms = self._histograms.get(name, {})
+            if not values and not histograms:
+                continue
+
+            yield f"# HELP {name} {help_text}"
+            yield f"# TYPE {name} {metric_type}"
+
+            for labels, value in sorted(values.items()):
+                yield f"{name}{_format_labels(labels)} {_format_value(value)}"
+
+            for labels, histogram in sorted(histograms.items()):
+                for bound, count in zip(LATENCY_BUCKETS, histogram.buckets, strict=True):
+                    bucket_labels = (*labels, ("le", _format_value(bound)))
+                    yield f"{name}_bucket{_format_labels(bucket_labels)} {count}"
+                yield f"{name}_bucket{_format_labels((*labels, ('le', '+Inf')))} {histogram.count}"
+                yield f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}"
+                yield f"{name}_count{_format_labels(labels)} {histogram.count}"
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """HTTP server exposing metrics on ``/metrics``."""
+
+    daemon_threads = True
+
+    def __init__(self, metrics: PipelineMetrics, host: str, port: int) -> None:
+        """Bind the server.
+
+        Args:
+            metrics: Metrics to expose.
+            host: Interface to listen on.
+            port: Port to listen on, 0 for any free port.
+        """
+        super().__init__((host, port), _MetricsRequestHandler)
+        self.metrics = metrics
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Answer scrapes of the metrics endpoint."""
+
+    server: MetricsServer
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        """Send the metrics, or 404 for any other path."""
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        content = self.server.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - base signature
+        """Log scrapes at debug level instead of writing them to stderr.
+
+        Args:
+            format: Format string of the message.
+            *args: Values formatted into the message.
+        """
+        logger.debug("Metrics endpoint: {}", format % args)
+
+
+def get_metrics() -> PipelineMetrics:
+    """Get the metrics shared by every job of the process.
+
+    Returns:
+        The shared PipelineMetrics, created on first use.
+    """
+    global _metrics
+
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = PipelineMetrics()
+        return _metrics
+
+
+def serve_metrics(port: int, host: str = DEFAULT_HOST) -> PipelineMetrics:
+    """Serve the shared metrics from a background thread.
+
+    The server is started once per process; later calls return the same
+    metrics without starting another one.
+
+    Args:
+        port: Port to listen on.
+        host: Interface to listen on.
+
+    Returns:
+        The shared metrics, to be used as a progress sink.
+    """
+    global _server
+
+    metrics = get_metrics()
+
+    with _metrics_lock:
+        if _server is None:
+            _server = MetricsServer(metrics, host, port)
+            threading.Thread(
+                target=_server.serve_forever, name="metrics-server", daemon=True
+            ).start()
+            logger.info(f"Serving metrics on http://{host}:{_server.server_address[1]}/metrics")
+
+    return metrics
+
+
+def metrics_from_env() -> PipelineMetrics | None:
+    """Serve the shared metrics if ``VIDEO_NOTES_METRICS_PORT`` is set.
+
+    The interface defaults to localhost and can be changed with
+    ``VIDEO_NOTES_METRICS_HOST``, for instance to ``0.0.0.0`` in a container.
+
+    Returns:
+        The shared metrics, or None when metrics are disabled or cannot be served.
+    """
+    port = os.environ.get("VIDEO_NOTES_METRICS_PORT")
+    if not port:
+        return None
+
+    try:
+        return serve_metrics(int(port), os.environ.get("VIDEO_NOTES_METRICS_HOST", DEFAULT_HOST))
+    except (OSError, ValueError):
+        logger.opt(exception=True).warning(f"Could not serve metrics on port {port}.")
+        return None
+
+
+def _outcome(event: ProgressEvent) -> str:
+    """Get the outcome label of a completed or failed event.
+
+    Args:
+        event: A completed or failed event.
+
+    Returns:
+        ``success`` or ``failure``.
+    """
+    return "success" if event.status == ProgressStatus.COMPLETED else "failure"
+
+
+def _format_labels(labels: Labels) -> str:
+    """Format label pairs for an exposition line.
+
+    Args:
+        labels: Label names and values.
+
+    Returns:
+        Labels in braces, or an empty string without labels.
+    """
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value.
+
+    Args:
+        value: Raw label value.
+
+    Returns:
+        Value with backslashes, quotes and newlines escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value.
+
+    Args:
+        value: Sample value.
+
+    Returns:
+        Integers without a fractional part, other values in shortest form.
+    """
+    if math.isfinite(value) and value == int(value):
+        return str(int(value))
+    return repr(value)
@@ -1,6 +1,13 @@
 """Service for interacting with the Ollama API."""
 
-import ollama
+from video_notes.agents.ai_client import (
+    generation_options,
+    get_client,
+    get_settings,
+    usage_from_response,
+)
+from video_notes.models import LLMUsage
+from video_notes.models.usage import LOAD_STAGE
 
 
 def get_available_models() -> list[str]:
@@ -10,8 +17,41 @@ def get_available_models() -> list[str]:
         A list of model names available locally.
     """
     try:
-        response = ollama.Client().list()
+        response = get_client("models").list()
         models = response.models
         return [model.model for model in models]
     except Exception:
         return []
+
+
+def load_model(model: str) -> LLMUsage:
+    """Load a model into memory without generating anything.
+
+    The model stays loaded for the configured ``keep_alive``, renewed by
+    every later request. The request carries the same options as generation
+    requests, since Ollama reloads a model whose ``num_ctx`` changes. Returns
+    quickly if the model is already loaded.
+
+    Args:
+        model: Ollama model name.
+
+    Returns:
+        LLMUsage of the load request, whose ``load_duration`` tells whether the
+        model had to be loaded.
+    """
+    response = get_client("load").chat(
+        model=model,
+        messages=[],
+        options=generation_options(model),
+        keep_alive=get_settings().keep_alive,
+    )
+    return usage_from_response(response, model, LOAD_STAGE)
+
+
+def unload_model(model: str) -> None:
+    """Ask Ollama to free the memory of a loaded model.
+
+    Args:
+        model: Ollama model name.
+    """
+    get_client("models").chat(model=model, messages=[], keep_alive=0)
@@ -0,0 +1,323 @@
+"""Structured progress reporting for the video processing workflow.
+
+Workflow steps describe what they are doing by emitting ProgressEvent objects
+to a sink, which is any callable accepting an event. The Streamlit app, the
+command line interface and metrics exporters each provide their own sink, so
+the workflow itself does not depend on any user interface.
+
+Events are emitted from the thread that called the workflow function, even
+when chunks are summarized by a pool of worker threads.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from video_notes.models import (
+    ChunkTiming,
+    LLMUsage,
+    ProcessingTimings,
+    StageTiming,
+    UsageSummary,
+)
+
+
+class PipelineStage(Enum):
+    """Stages of the video processing pipeline."""
+
+    JOB = "job"
+    FETCH = "fetch"
+    LOAD = "load"
+    ANALYZE = "analyze"
+    SUMMARIZE = "summarize"
+    COMBINE = "combine"
+    FINALIZE = "finalize"
+    SAVE = "save"
+
+
+class ProgressStatus(Enum):
+    """Kinds of progress events."""
+
+    STARTED = "started"
+    UPDATE = "update"
+    WARNING = "warning"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ProgressEvent(BaseModel):
+    """A single progress notification emitted by the workflow.
+
+    Attributes:
+        stage (PipelineStage): Pipeline stage the event belongs to
+        status (ProgressStatus): Kind of event
+        message (str): Human readable description of the event
+        chunk_index (int | None): Index of the chunk the event refers to
+        total_chunks (int | None): Total number of chunks in the job
+        elapsed (float | None): Seconds spent in the stage or chunk
+        tokens (int | None): Number of tokens involved in the step
+        details (dict[str, Any]): Additional stage-specific values
+        usage (list[LLMUsage]): LLM calls made by the step the event reports
+        timestamp (float): Unix time at which the event was created
+    """
+
+    stage: PipelineStage
+    status: ProgressStatus
+    message: str
+    chunk_index: int | None = Field(default=None)
+    total_chunks: int | None = Field(default=None)
+    elapsed: float | None = Field(default=None)
+    tokens: int | None = Field(default=None)
+    details: dict[str, Any] = Field(default_factory=dict)
+    usage: list[LLMUsage] = Field(default_factory=list)
+    timestamp: float = Field(default_factory=time.time)
+
+
+ProgressSink = Callable[[ProgressEvent], None]
+
+
+def null_sink(event: ProgressEvent) -> None:
+    """Discard a progress event.
+
+    Args:
+        event: The event to ignore.
+    """
+
+
+def log_sink(event: ProgressEvent) -> None:
+    """Write a progress event to the application log.
+
+    Args:
+        event: The event to log.
+    """
+    level = {
+        ProgressStatus.WARNING: "WARNING",
+        ProgressStatus.FAILED: "ERROR",
+    }.get(event.status, "INFO")
+    logger.log(level, f"[{event.stage.value}] {event.message.strip()}")
+
+
+def combine_sinks(*sinks: ProgressSink | None) -> ProgressSink:
+    """Create a sink forwarding every event to several sinks.
+
+    Args:
+        *sinks: Sinks to forward events to, None entries are skipped.
+
+    Returns:
+        A sink calling each given sink in order.
+    """
+    active_sinks = [sink for sink in sinks if sink is not None]
+
+    def _combined(event: ProgressEvent) -> None:
+        for sink in active_sinks:
+            sink(event)
+
+    return _combined
+
+
+class TimingRecorder:
+    """Sink collecting the stage and chunk timings carried by progress events.
+
+    Stage timings come from completed and failed stage events, step timings
+    from the ``timings`` entry of update details, and chunk timings from the
+    per-chunk summarize events.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self._total: float | None = None
+        self._stages: list[StageTiming] = []
+        self._steps: dict[PipelineStage, dict[str, float]] = {}
+        self._chunks: dict[int, ChunkTiming] = {}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """Record the timing carried by an event, if any.
+
+        Args:
+            event: The event to record.
+        """
+        if event.chunk_index is not None and event.stage == PipelineStage.SUMMARIZE:
+            self._chunks[event.chunk_index] = ChunkTiming(
+                chunk_index=event.chunk_index,
+                elapsed=event.elapsed,
+                characters=event.details.get("characters", 0),
+                tokens=event.tokens,
+                success=event.status != ProgressStatus.WARNING,
+            )
+        elif event.status == ProgressStatus.UPDATE and "timings" in event.details:
+            self._steps.setdefault(event.stage, {}).update(event.details["timings"])
+        elif event.status in (ProgressStatus.COMPLETED, ProgressStatus.FAILED):
+            if event.elapsed is None:
+                return
+            if event.stage == PipelineStage.JOB:
+                self._total = event.elapsed
+                return
+            self._stages.append(
+                StageTiming(
+                    stage=event.stage.value,
+                    elapsed=event.elapsed,
+                    success=event.status == ProgressStatus.COMPLETED,
+                    steps=self._steps.pop(event.stage, {}),
+                )
+            )
+
+    @property
+    def timings(self) -> ProcessingTimings:
+        """Get the timings recorded so far.
+
+        Returns:
+            ProcessingTimings with chunks ordered by index.
+        """
+        return ProcessingTimings(
+            total=self._total,
+            stages=list(self._stages),
+            chunks=[self._chunks[index] for index in sorted(self._chunks)],
+        )
+
+
+class UsageRecorder:
+    """Sink collecting the LLM usage carried by progress events."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.usages: list[LLMUsage] = []
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """Record the LLM calls reported by an event.
+
+        Args:
+            event: The event to record.
+        """
+        self.usages.extend(event.usage)
+
+    @property
+    def summary(self) -> UsageSummary:
+        """Get the totals of the calls recorded so far.
+
+        Returns:
+            UsageSummary of the recorded calls.
+        """
+        return UsageSummary.from_usages(self.usages)
+
+
+class StageTracker:
+    """Handle of a running stage, used to report updates and failures."""
+
+    def __init__(self, reporter: "ProgressReporter", stage: PipelineStage) -> None:
+        """Start tracking a stage.
+
+        Args:
+            reporter: Reporter used to emit the stage events.
+            stage: Stage being tracked.
+        """
+        self.reporter = reporter
+        self.stage = stage
+        self.started_at = time.monotonic()
+        self.failed = False
+
+    @property
+    def elapsed(self) -> float:
+        """Get the time spent in the stage so far.
+
+        Returns:
+            Seconds elapsed since the stage started.
+        """
+        return time.monotonic() - self.started_at
+
+    def update(self, message: str, **fields: Any) -> None:
+        """Report progress within the stage.
+
+        Args:
+            message: Description of the progress.
+            **fields: Additional ProgressEvent fields.
+        """
+        self.reporter.emit(self.stage, ProgressStatus.UPDATE, message, **fields)
+
+    def warning(self, message: str, **fields: Any) -> None:
+        """Report a recoverable problem within the stage.
+
+        Args:
+            message: Description of the problem.
+            **fields: Additional ProgressEvent fields.
+        """
+        self.reporter.emit(self.stage, ProgressStatus.WARNING, message, **fields)
+
+    def fail(self, message: str, **fields: Any) -> None:
+        """Report that the stage failed.
+
+        Args:
+            message: Description of the failure.
+            **fields: Additional ProgressEvent fields.
+        """
+        self.failed = True
+        self.reporter.emit(
+            self.stage, ProgressStatus.FAILED, message, elapsed=self.elapsed, **fields
+        )
+
+
+class ProgressReporter:
+    """Emit progress events to a sink, shielding the workflow from sink errors."""
+
+    def __init__(self, sink: ProgressSink | None = None) -> None:
+        """Initialize the reporter.
+
+        Args:
+            sink: Sink receiving the events, events are discarded if None.
+        """
+        self.sink = sink or null_sink
+
+    def emit(
+        self, stage: PipelineStage, status: ProgressStatus, message: str, **fields: Any
+    ) -> None:
+        """Build an event and send it to the sink.
+
+        Args:
+            stage: Pipeline stage the event belongs to.
+            status: Kind of event.
+            message: Human readable description of the event.
+            **fields: Additional ProgressEvent fields.
+        """
+        event = ProgressEvent(stage=stage, status=status, message=message, **fields)
+        try:
+            self.sink(event)
+        except Exception:
+            logger.opt(exception=True).warning("Progress sink failed to handle an event.")
+
+    @contextmanager
+    def stage(
+        self, stage: PipelineStage, message: str, completed_message: str | None = None
+    ) -> Iterator[StageTracker]:
+        """Track a stage, emitting its start and completion events.
+
+        A failure is reported if the block raises, or if ``fail`` was called
+        on the tracker, in which case no completion event is emitted.
+
+        Args:
+            stage: Stage being run.
+            message: Description of the stage, used for the started event.
+            completed_message: Description used for the completed event.
+
+        Yields:
+            StageTracker to report updates and failures within the stage.
+        """
+        tracker = StageTracker(self, stage)
+        self.emit(stage, ProgressStatus.STARTED, message)
+
+        try:
+            yield tracker
+        except Exception as e:
+            tracker.fail(f"{message} failed: {e}")
+            raise
+
+        if not tracker.failed:
+            self.emit(
+                stage,
+                ProgressStatus.COMPLETED,
+                completed_message or message,
+                elapsed=tracker.elapsed,
+            )
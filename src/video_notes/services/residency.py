@@ -0,0 +1,161 @@
+"""Keep the models of pending jobs loaded in Ollama.
+
+Loading a model from disk takes seconds to tens of seconds, and is otherwise
+paid by the first chunk of a job. ``ModelResidency`` loads the model in the
+background as soon as a job is queued, while its transcript is downloaded,
+and tracks the jobs pending for each model. Once the last one ends, the model
+can be unloaded after a grace period instead of waiting for Ollama's
+``keep_alive`` to expire::
+
+    residency = get_model_residency()
+    with residency.job("gemma3:12b") as warm_up:
+        ...
+        load_usage = warm_up.result()
+
+Set ``VIDEO_NOTES_UNLOAD_AFTER`` to the number of idle seconds after which
+models are unloaded; by default they stay loaded for ``VIDEO_NOTES_KEEP_ALIVE``.
+"""
+
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from loguru import logger
+
+from video_notes.models import LLMUsage
+from video_notes.services.ollama import load_model, unload_model
+
+_residency: "ModelResidency | None" = None
+_residency_lock = threading.Lock()
+
+
+class ModelResidency:
+    """Thread-safe registry of the jobs pending for each model."""
+
+    def __init__(self, unload_after: float | None = None) -> None:
+        """Initialize the registry without pending jobs.
+
+        Args:
+            unload_after: Idle seconds after which a model without pending jobs
+                is unloaded, None to leave it to Ollama's ``keep_alive``.
+        """
+        self.unload_after = unload_after
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-residency")
+        self._loads: dict[str, Future[LLMUsage]] = {}
+        self._pending: dict[str, int] = {}
+        self._unload_timers: dict[str, threading.Timer] = {}
+
+    def preload(self, model: str) -> Future[LLMUsage]:
+        """Load a model in the background, unless it is already being loaded.
+
+        Args:
+            model: Ollama model name.
+
+        Returns:
+            Future resolving to the usage of the load request.
+        """
+        with self._lock:
+            future = self._loads.get(model)
+            if future is None or future.done():
+                future = self._loads[model] = self._executor.submit(load_model, model)
+            return future
+
+    def acquire(self, model: str) -> Future[LLMUsage]:
+        """Register a pending job and start loading its model.
+
+        Args:
+            model: Ollama model used by the job.
+
+        Returns:
+            Future resolving to the usage of the load request.
+        """
+        with self._lock:
+            self._pending[model] = self._pending.get(model, 0) + 1
+            timer = self._unload_timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+        return self.preload(model)
+
+    def release(self, model: str) -> None:
+        """Unregister a finished job, scheduling the unload of an idle model.
+
+        Args:
+            model: Ollama model used by the job.
+        """
+        with self._lock:
+            remaining = self._pending.get(model, 0) - 1
+            if remaining > 0:
+                self._pending[model] = remaining
+                return
+
+            self._pending.pop(model, None)
+            if self.unload_after is None:
+                return
+
+            timer = threading.Timer(self.unload_after, self._unload_if_idle, (model,))
+            timer.daemon = True
+            self._unload_timers[model] = timer
+        timer.start()
+
+    @contextmanager
+    def job(self, model: str) -> Iterator[Future[LLMUsage]]:
+        """Keep a model loaded for the duration of a ``with`` block.
+
+        Args:
+            model: Ollama model used by the job.
+
+        Yields:
+            Future resolving to the usage of the load request.
+        """
+        future = self.acquire(model)
+        try:
+            yield future
+        finally:
+            self.release(model)
+
+    def pending(self, model: str) -> int:
+        """Get the number of jobs pending for a model.
+
+        Args:
+            model: Ollama model name.
+
+        Returns:
+            Number of registered jobs not yet released.
+        """
+        with self._lock:
+            return self._pending.get(model, 0)
+
+    def _unload_if_idle(self, model: str) -> None:
+        """Unload a model unless a job was queued for it in the meantime.
+
+        Args:
+            model: Ollama model name.
+        """
+        with self._lock:
+            if self._pending.get(model):
+                return
+            self._unload_timers.pop(model, None)
+
+        try:
+            unload_model(model)
+            logger.info(f"Unloaded idle model {model}")
+        except Exception:
+            logger.opt(exception=True).warning(f"Could not unload model {model}.")
+
+
+def get_model_residency() -> ModelResidency:
+    """Get the residency registry shared by every job of the process.
+
+    Returns:
+        The shared ModelResidency, created on first use.
+    """
+    global _residency
+
+    with _residency_lock:
+        if _residency is None:
+            unload_after = os.environ.get("VIDEO_NOTES_UNLOAD_AFTER")
+            _residency = ModelResidency(float(unload_after) if unload_after else None)
+        return _residency
@@ -0,0 +1,276 @@
+"""Persistent ledger of LLM usage for capacity planning.
+
+Every processed video is recorded in a SQLite file next to the caches, with
+the token counts and durations Ollama reported for each of its chat calls.
+The ledger answers questions such as how fast each model generates, how often
+it has to be loaded from disk and how much server time a video hour costs.
+
+Set ``VIDEO_NOTES_USAGE_LEDGER=0`` to disable recording.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from video_notes.models.usage import COLD_LOAD_SECONDS, LOAD_STAGE, LLMUsage
+from video_notes.utils.cache import default_cache_dir
+
+_ledger: "UsageLedger | None" = None
+_ledger_lock = threading.Lock()
+
+
+class ModelUsageStats(BaseModel):
+    """Usage of one model across all recorded jobs.
+
+    Requests that only load the model are counted in ``preloads``, not as
+    calls, so they do not dilute the cold load rate. Their time still counts
+    in ``server_seconds``.
+
+    Attributes:
+        model (str): Ollama model name
+        jobs (int): Number of jobs that called the model
+        calls (int): Number of chat calls, including cached ones
+        cached_calls (int): Number of calls served from the response cache
+        cold_loads (int): Number of calls that had to load the model
+        preloads (int): Number of requests that only loaded the model
+        prompt_tokens (int): Total prompt tokens evaluated
+        completion_tokens (int): Total tokens generated
+        server_seconds (float): Total seconds spent by Ollama on the calls
+        video_hours (float): Hours of video processed with the model
+        tokens_per_second (float | None): Average generation speed
+        prompt_tokens_per_second (float | None): Average prompt evaluation speed
+    """
+
+    model: str
+    jobs: int
+    calls: int
+    cached_calls: int
+    cold_loads: int
+    preloads: int
+    prompt_tokens: int
+    completion_tokens: int
+    server_seconds: float
+    video_hours: float
+    tokens_per_second: float | None = Field(default=None)
+    prompt_tokens_per_second: float | None = Field(default=None)
+
+    @property
+    def cold_load_rate(self) -> float | None:
+        """Get the fraction of uncached calls that had to load the model.
+
+        Returns:
+            Cold loads per uncached call, or None without uncached calls.
+        """
+        uncached_calls = self.calls - self.cached_calls
+        return self.cold_loads / uncached_calls if uncached_calls else None
+
+    @property
+    def server_seconds_per_video_hour(self) -> float | None:
+        """Get the Ollama time needed to summarize one hour of video.
+
+        Returns:
+            Server seconds per video hour, or None when no video length is known.
+        """
+        return self.server_seconds / self.video_hours if self.video_hours else None
+
+
+class UsageLedger:
+    """Append-only record of jobs and their LLM calls in a SQLite file.
+
+    Storage errors are logged and ignored so that the ledger never interrupts
+    processing.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open or create a ledger file.
+
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, "
+                "recorded_at REAL NOT NULL, "
+                "video_id TEXT, "
+                "model TEXT NOT NULL, "
+                "video_seconds REAL, "
+                "success INTEGER NOT NULL, "
+                "elapsed REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS calls ("
+                "job_id TEXT NOT NULL, "
+                "model TEXT NOT NULL, "
+                "stage TEXT, "
+                "prompt_tokens INTEGER NOT NULL, "
+                "completion_tokens INTEGER NOT NULL, "
+                "load_duration REAL NOT NULL, "
+                "prompt_eval_duration REAL NOT NULL, "
+                "eval_duration REAL NOT NULL, "
+                "total_duration REAL NOT NULL, "
+                "cached INTEGER NOT NULL, "
+                "timestamp REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS calls_model ON calls (model)")
+
+    def record_job(
+        self,
+        job_id: str,
+        model: str,
+        usages: Iterable[LLMUsage],
+        video_id: str | None = None,
+        video_seconds: float | None = None,
+        success: bool = True,
+        elapsed: float | None = None,
+    ) -> None:
+        """Record a processed video and its LLM calls.
+
+        Args:
+            job_id: Unique identifier of the job.
+            model: Model requested for the job.
+            usages: Usage of each chat call made by the job.
+            video_id: YouTube video ID, if known.
+            video_seconds: Length of the video in seconds, if known.
+            success: Whether the job succeeded.
+            elapsed: Wall time of the job in seconds.
+        """
+        rows = [
+            (
+                job_id,
+                usage.model,
+                usage.stage,
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.load_duration,
+                usage.prompt_eval_duration,
+                usage.eval_duration,
+                usage.total_duration,
+                int(usage.cached),
+                usage.timestamp,
+            )
+            for usage in usages
+        ]
+
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN")
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO jobs "
+                    "(job_id, recorded_at, video_id, model, video_seconds, success, elapsed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, time.time(), video_id, model, video_seconds, int(success), elapsed),
+                )
+                self._connection.executemany(
+                    "INSERT INTO calls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                self._connection.execute("COMMIT")
+        except sqlite3.Error:
+            logger.opt(exception=True).warning(f"Could not write to usage ledger {self.path}.")
+            try:
+                self._connection.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+
+    def model_stats(self, since: float | None = None) -> list[ModelUsageStats]:
+        """Aggregate the recorded usage per model.
+
+        Args:
+            since: Only include calls made after this Unix time, all calls if None.
+
+        Returns:
+            Usage statistics of each model, ordered by model name.
+        """
+        with self._lock:
+            call_rows = self._connection.execute(
+                "SELECT model, COUNT(DISTINCT job_id), SUM(stage IS NOT ?), "
+                "SUM(cached AND stage IS NOT ?), SUM(load_duration >= ? AND stage IS NOT ?), "
+                "SUM(stage IS ?), SUM(prompt_tokens), SUM(completion_tokens), "
+                "SUM(total_duration), SUM(eval_duration), SUM(prompt_eval_duration) "
+                "FROM calls WHERE timestamp >= ? GROUP BY model ORDER BY model",
+                (
+                    LOAD_STAGE,
+                    LOAD_STAGE,
+                    COLD_LOAD_SECONDS,
+                    LOAD_STAGE,
+                    LOAD_STAGE,
+                    since or 0.0,
+                ),
+            ).fetchall()
+            video_rows = dict(
+                self._connection.execute(
+                    "SELECT calls.model, SUM(jobs.video_seconds) FROM jobs "
+                    "JOIN (SELECT DISTINCT job_id, model FROM calls WHERE timestamp >= ?) AS calls "
+                    "ON calls.job_id = jobs.job_id GROUP BY calls.model",
+                    (since or 0.0,),
+                ).fetchall()
+            )
+
+        return [
+            ModelUsageStats(
+                model=model,
+                jobs=jobs,
+                calls=calls,
+                cached_calls=cached_calls,
+                cold_loads=cold_loads,
+                preloads=preloads,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                server_seconds=server_seconds,
+                video_hours=(video_rows.get(model) or 0.0) / 3600,
+                tokens_per_second=completion_tokens / eval_seconds if eval_seconds else None,
+                prompt_tokens_per_second=(
+                    prompt_tokens / prompt_eval_seconds if prompt_eval_seconds else None
+                ),
+            )
+            for (
+                model,
+                jobs,
+                calls,
+                cached_calls,
+                cold_loads,
+                preloads,
+                prompt_tokens,
+                completion_tokens,
+                server_seconds,
+                eval_seconds,
+                prompt_eval_seconds,
+            ) in call_rows
+        ]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def get_usage_ledger() -> UsageLedger | None:
+    """Get the shared usage ledger.
+
+    Returns:
+        The ledger, created on first use, or None when disabled with
+        ``VIDEO_NOTES_USAGE_LEDGER=0``.
+    """
+    global _ledger
+
+    if os.environ.get("VIDEO_NOTES_USAGE_LEDGER", "1") == "0":
+        return None
+
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = UsageLedger(default_cache_dir() / "usage.sqlite3")
+        return _ledger
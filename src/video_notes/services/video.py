@@ -1,12 +1,44 @@
 """Video service for extracting video information and downloading transcripts."""
 
+import os
 import re
+import sqlite3
+import threading
+from collections.abc import Mapping
+from typing import Any, TypedDict
 
 import yt_dlp
 from loguru import logger
 from youtube_transcript_api import YouTubeTranscriptApi
 
 from video_notes.models.video import VideoInfo
+from video_notes.utils.cache import DiskCache, default_cache_dir
+
+# Transcripts of published videos rarely change, keep them for a month
+TRANSCRIPT_CACHE_TTL = 30 * 24 * 3600
+TRANSCRIPT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Metadata is served fresh for a week, then stale while it is refreshed in the background
+VIDEO_INFO_CACHE_TTL = 7 * 24 * 3600
+VIDEO_INFO_STALE_TTL = 90 * 24 * 3600
+VIDEO_INFO_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class VideoMetadata(TypedDict):
+    """Video metadata extracted by yt-dlp, as stored in the metadata cache."""
+
+    title: str | None
+    description: str | None
+    author: str | None
+    view_count: int | None
+    length: int | None
+    publish_date: str | None
+
+
+_transcript_cache: DiskCache | None = None
+_video_info_cache: DiskCache | None = None
+_revalidating: set[str] = set()
+_cache_lock = threading.Lock()
 
 
 def extract_video_id(url: str) -> str | None:
@@ -31,11 +63,16 @@ def extract_video_id(url: str) -> str | None:
     return None
 
 
-def extract_video_info(url: str) -> VideoInfo:
+def extract_video_info(url: str, use_cache: bool = True) -> VideoInfo:
     """Extract video information from YouTube URL.
 
+    Extracted metadata is cached on disk by video ID. Fresh entries are returned
+    directly; stale ones are returned immediately while a background thread
+    refreshes them (stale-while-revalidate).
+
     Args:
         url: YouTube video URL.
+        use_cache: Whether to read from and write to the metadata cache.
 
     Returns:
         VideoInfo object with extracted information.
@@ -51,6 +88,103 @@ def extract_video_info(url: str) -> VideoInfo:
         # with the URL, as the function is not designed to fail here.
         return video_info
 
+    cache = _open_video_info_cache() if use_cache else None
+    if cache is not None:
+        entry = cache.lookup(video_id)
+        if entry is not None and entry.age <= VIDEO_INFO_CACHE_TTL + VIDEO_INFO_STALE_TTL:
+            if entry.age > VIDEO_INFO_CACHE_TTL:
+                _revalidate_video_info(url, video_id)
+            return _video_info_from_metadata(url, video_id, entry.value)
+
+    metadata = _fetch_video_metadata(url)
+    if metadata is None:
+        return video_info
+
+    if cache is not None:
+        cache.set(video_id, metadata)
+
+    return _video_info_from_metadata(url, video_id, metadata)
+
+
+def _video_info_from_metadata(url: str, video_id: str, metadata: Mapping[str, Any]) -> VideoInfo:
+    """Build the VideoInfo of a video from its metadata.
+
+    Args:
+        url: YouTube video URL.
+        video_id: YouTube video ID.
+        metadata: Extracted or cached metadata fields.
+
+    Returns:
+        VideoInfo with the URL, ID and metadata.
+    """
+    return VideoInfo.model_validate({**metadata, "url": url, "video_id": video_id})
+
+
+def _open_video_info_cache() -> DiskCache | None:
+    """Get the metadata cache, or None when it cannot be opened.
+
+    Returns:
+        The shared metadata cache, or None if its file cannot be created, in
+        which case metadata is extracted without caching.
+    """
+    try:
+        return get_video_info_cache()
+    except (OSError, sqlite3.Error):
+        logger.opt(exception=True).warning("Could not open the video metadata cache.")
+        return None
+
+
+def get_video_info_cache() -> DiskCache:
+    """Get the shared on-disk video metadata cache.
+
+    Returns:
+        The metadata cache, created on first use.
+    """
+    global _video_info_cache
+
+    with _cache_lock:
+        if _video_info_cache is None:
+            _video_info_cache = DiskCache(
+                default_cache_dir() / "video_info.sqlite3",
+                max_bytes=VIDEO_INFO_CACHE_MAX_BYTES,
+            )
+        return _video_info_cache
+
+
+def _revalidate_video_info(url: str, video_id: str) -> None:
+    """Refresh cached metadata in a background thread.
+
+    Args:
+        url: YouTube video URL.
+        video_id: YouTube video ID used as cache key.
+    """
+    with _cache_lock:
+        if video_id in _revalidating:
+            return
+        _revalidating.add(video_id)
+
+    def _refresh() -> None:
+        try:
+            metadata = _fetch_video_metadata(url)
+            cache = _open_video_info_cache()
+            if metadata is not None and cache is not None:
+                cache.set(video_id, metadata)
+        finally:
+            with _cache_lock:
+                _revalidating.discard(video_id)
+
+    threading.Thread(target=_refresh, name=f"revalidate-{video_id}", daemon=True).start()
+
+
+def _fetch_video_metadata(url: str) -> VideoMetadata | None:
+    """Extract video metadata with yt-dlp.
+
+    Args:
+        url: YouTube video URL.
+
+    Returns:
+        VideoInfo fields, or None if extraction failed.
+    """
     try:
         # Use yt-dlp to extract comprehensive metadata
         ydl_opts = {
@@ -63,36 +197,53 @@ def extract_video_info(url: str) -> VideoInfo:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
 
-            if info:
-                # Extract available metadata
-                video_info.title = info.get("title")
-                video_info.description = info.get("description")
-                video_info.author = info.get("uploader") or info.get("channel")
-                video_info.view_count = info.get("view_count")
-                video_info.length = info.get("duration")  # in seconds
-
-                # Format publish date if available
-                upload_date = info.get("upload_date")
-                if upload_date:
-                    # Convert YYYYMMDD to YYYY-MM-DD
-                    try:
-                        formatted_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-                        video_info.publish_date = formatted_date
-                    except (ValueError, IndexError):
-                        video_info.publish_date = upload_date
+            if not info:
+                return None
+
+            # Extract available metadata
+            metadata: VideoMetadata = {
+                "title": info.get("title"),
+                "description": info.get("description"),
+                "author": info.get("uploader") or info.get("channel"),
+                "view_count": info.get("view_count"),
+                "length": info.get("duration"),  # in seconds
+                "publish_date": None,
+            }
+
+            # Format publish date if available
+            upload_date = info.get("upload_date")
+            if upload_date:
+                # Convert YYYYMMDD to YYYY-MM-DD
+                try:
+                    formatted_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
+                    metadata["publish_date"] = formatted_date
+                except (ValueError, IndexError):
+                    metadata["publish_date"] = upload_date
+
+            return metadata
 
     except Exception:
-        # Log the warning but don't fail, as the function can return partial info.
+        # Log the warning but don't fail, as the caller can return partial info.
         logger.opt(exception=True).warning("Could not extract full video metadata.")
+        return None
 
-    return video_info
 
-
-def get_transcript_content(video_info: VideoInfo) -> str | None:
+def get_transcript_content(
+    video_info: VideoInfo,
+    use_cache: bool = True,
+    offline: bool | None = None,
+) -> str | None:
     """Download transcript content using youtube-transcript-api.
 
+    Transcripts are served from a persistent cache keyed by video ID, language
+    and transcript kind (manual or generated), so processing a video again
+    does not touch the network.
+
     Args:
         video_info: Video information.
+        use_cache: Whether to read from and write to the transcript cache.
+        offline: Only serve cached transcripts, ignoring their age. Defaults to
+            the ``VIDEO_NOTES_OFFLINE`` environment variable.
 
     Returns:
         Transcript content or None if failed.
@@ -100,52 +251,171 @@ def get_transcript_content(video_info: VideoInfo) -> str | None:
     if not video_info.video_id:
         raise ValueError("Cannot get transcript without a video ID.")
 
+    if offline is None:
+        offline = os.environ.get("VIDEO_NOTES_OFFLINE", "0") == "1"
+
+    if use_cache or offline:
+        cached_content = _get_cached_transcript(video_info.video_id, ignore_ttl=offline)
+        if cached_content is not None:
+            return cached_content
+
+    if offline:
+        raise ValueError(f"No cached transcript for video {video_info.video_id} in offline mode")
+
     try:
-        # Try to get transcript in English first, then any available language
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_info.video_id)
+        content, language_code, is_generated = _download_transcript(video_info.video_id)
+    except Exception as e:
+        raise ValueError(f"Error downloading transcript: {e}") from e
+
+    if use_cache and content:
+        _store_transcript(video_info.video_id, language_code, is_generated, content)
+
+    return content
+
+
+def get_transcript_cache() -> DiskCache:
+    """Get the shared on-disk transcript cache.
+
+    Returns:
+        The transcript cache, created on first use.
+    """
+    global _transcript_cache
+
+    with _cache_lock:
+        if _transcript_cache is None:
+            _transcript_cache = DiskCache(
+                default_cache_dir() / "transcripts.sqlite3",
+                max_bytes=TRANSCRIPT_CACHE_MAX_BYTES,
+                ttl=TRANSCRIPT_CACHE_TTL,
+            )
+        return _transcript_cache
+
+
+def _open_transcript_cache() -> DiskCache | None:
+    """Get the transcript cache, or None when it cannot be opened.
+
+    Returns:
+        The shared transcript cache, or None if its file cannot be created, in
+        which case transcripts are downloaded without caching.
+    """
+    try:
+        return get_transcript_cache()
+    except (OSError, sqlite3.Error):
+        logger.opt(exception=True).warning("Could not open the transcript cache.")
+        return None
+
+
+def _get_cached_transcript(video_id: str, ignore_ttl: bool = False) -> str | None:
+    """Get the cached transcript selected for a video.
+
+    Args:
+        video_id: YouTube video ID.
+        ignore_ttl: Whether to return expired transcripts as well.
+
+    Returns:
+        Cached transcript content or None if not cached.
+    """
+    cache = _open_transcript_cache()
+    if cache is None:
+        return None
+
+    selection = cache.get(f"transcript:{video_id}", ignore_ttl=ignore_ttl)
+    if not selection:
+        return None
+
+    content = cache.get(
+        _transcript_key(video_id, selection["language_code"], selection["is_generated"]),
+        ignore_ttl=ignore_ttl,
+    )
+    return str(content) if content is not None else None
 
-        # Try to find English transcript first
-        transcript = None
+
+def _store_transcript(video_id: str, language_code: str, is_generated: bool, content: str) -> None:
+    """Store a downloaded transcript and remember it as the video's selection.
+
+    Args:
+        video_id: YouTube video ID.
+        language_code: Language code of the transcript.
+        is_generated: Whether the transcript was generated automatically.
+        content: Transcript content.
+    """
+    cache = _open_transcript_cache()
+    if cache is None:
+        return
+
+    cache.set(_transcript_key(video_id, language_code, is_generated), content)
+    cache.set(
+        f"transcript:{video_id}",
+        {"language_code": language_code, "is_generated": is_generated},
+    )
+
+
+def _transcript_key(video_id: str, language_code: str, is_generated: bool) -> str:
+    """Build the cache key of a transcript.
+
+    Args:
+        video_id: YouTube video ID.
+        language_code: Language code of the transcript.
+        is_generated: Whether the transcript was generated automatically.
+
+    Returns:
+        Cache key for the transcript content.
+    """
+    kind = "generated" if is_generated else "manual"
+    return f"transcript:{video_id}:{language_code}:{kind}"
+
+
+def _download_transcript(video_id: str) -> tuple[str, str, bool]:
+    """Download the preferred transcript of a video.
+
+    Args:
+        video_id: YouTube video ID.
+
+    Returns:
+        Tuple of (content, language_code, is_generated).
+    """
+    # Try to get transcript in English first, then any available language
+    transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+
+    # Try to find English transcript first
+    transcript = None
+    try:
+        transcript = transcript_list.find_transcript(["en"])
+    except Exception:
+        # If English not available, get any available transcript
         try:
-            transcript = transcript_list.find_transcript(["en"])
+            transcript = transcript_list.find_transcript(
+                transcript_list._manually_created_transcripts.keys()
+            )
         except Exception:
-            # If English not available, get any available transcript
+            # If no manual transcripts, try generated ones
             try:
-                transcript = transcript_list.find_transcript(
-                    transcript_list._manually_created_transcripts.keys()
+                transcript = transcript_list.find_generated_transcript(
+                    transcript_list._generated_transcripts.keys()
                 )
             except Exception:
-                # If no manual transcripts, try generated ones
-                try:
-                    transcript = transcript_list.find_generated_transcript(
-                        transcript_list._generated_transcripts.keys()
-                    )
-                except Exception:
-                    # Log the warning and continue; will be handled by the check below.
-                    logger.opt(exception=True).warning("Could not find a specific transcript type.")
+                # Log the warning and continue; will be handled by the check below.
+                logger.opt(exception=True).warning("Could not find a specific transcript type.")
 
-        if not transcript:
-            raise ValueError(f"No transcripts available for video {video_info.video_id}")
+    if not transcript:
+        raise ValueError(f"No transcripts available for video {video_id}")
 
-        # Fetch the transcript data
-        transcript_data = transcript.fetch()
+    # Fetch the transcript data
+    transcript_data = transcript.fetch()
 
-        # Combine all transcript text
-        content_parts = []
-        for entry in transcript_data:
-            if isinstance(entry, dict):
-                content_parts.append(entry.get("text", ""))
-            else:
-                # Handle object with attributes
-                text = getattr(entry, "text", "")
-                content_parts.append(text)
+    # Combine all transcript text
+    content_parts = []
+    for entry in transcript_data:
+        if isinstance(entry, dict):
+            content_parts.append(entry.get("text", ""))
+        else:
+            # Handle object with attributes
+            text = getattr(entry, "text", "")
+            content_parts.append(text)
 
-        content = " ".join(content_parts)
+    content = " ".join(content_parts)
 
-        return content.strip()
-
-    except Exception as e:
-        raise ValueError(f"Error downloading transcript: {e}") from e
+    return content.strip(), transcript.language_code, transcript.is_generated
 
 
 def validate_youtube_url(url: str) -> bool:
@@ -3,29 +3,76 @@
 This module provides a clear, step-by-step workflow for processing YouTube videos
 into AI-generated summaries. Each function has a single responsibility and the
 overall flow is easy to follow and understand.
+
+Steps report what they are doing through progress events sent to an optional
+sink (see ``video_notes.services.progress``), so the workflow runs the same way
+in the Streamlit app, on the command line or in a worker process.
 """
 
+import asyncio
+import time
+import uuid
+from collections.abc import Callable, Iterable, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import Any, TypeVar
 
-import streamlit as st
+from loguru import logger
 from pydantic import BaseModel
 
 from video_notes.agents import (
     ChunkParameters,
+    ChunkSummary,
+    CombinedSummary,
     combine_relevant_chunks,
+    combine_relevant_chunks_async,
     compute_chunk_parameters,
     generate_filename_from_video_info,
     generate_final_markdown,
     summarize_chunk,
+    summarize_chunk_async,
 )
 from video_notes.models import (
+    ChunkSpan,
+    LLMUsage,
     ProcessingConfig,
     ProcessingResult,
+    ProcessingTimings,
+    TextChunk,
     TextChunker,
     VideoInfo,
 )
-from video_notes.services.video import extract_video_info, get_transcript_content
+from video_notes.services.checkpoint import (
+    CheckpointStore,
+    JobCheckpoint,
+    checkpoint_job_id,
+    get_checkpoint_store,
+)
+from video_notes.services.progress import (
+    PipelineStage,
+    ProgressReporter,
+    ProgressSink,
+    ProgressStatus,
+    StageTracker,
+    TimingRecorder,
+    UsageRecorder,
+    combine_sinks,
+)
+from video_notes.services.residency import get_model_residency
+from video_notes.services.usage import get_usage_ledger
+from video_notes.services.video import (
+    extract_video_id,
+    extract_video_info,
+    get_transcript_content,
+)
 from video_notes.utils import write_text_file
+from video_notes.utils.tokenizer import count_tokens, get_tokenizer
+
+# Seconds to wait for each of the concurrent video data fetches
+METADATA_TIMEOUT = 30.0
+TRANSCRIPT_TIMEOUT = 60.0
+
+T = TypeVar("T")
 
 
 class VideoData(BaseModel):
@@ -54,176 +101,760 @@ class ContentResult(BaseModel):
     transcript_filename: str
 
 
-def extract_video_data(youtube_url: str) -> VideoData | None:
+def extract_video_data(
+    youtube_url: str,
+    metadata_timeout: float = METADATA_TIMEOUT,
+    transcript_timeout: float = TRANSCRIPT_TIMEOUT,
+    progress: ProgressSink | None = None,
+) -> VideoData | None:
     """Extract video information and download transcript.
 
+    The transcript only needs the video ID, which is parsed from the URL, so
+    the yt-dlp metadata extraction and the transcript download run
+    concurrently. A metadata failure or timeout falls back to the bare video
+    ID without delaying the transcript.
+
     Args:
         youtube_url: YouTube video URL to process.
-        verbose: Whether to print detailed progress information.
+        metadata_timeout: Seconds to wait for the video metadata.
+        transcript_timeout: Seconds to wait for the transcript.
+        progress: Optional sink receiving progress events.
 
     Returns:
         VideoData with video info and transcript, or None if failed.
     """
-    with st.spinner("🔄 Step 1: Downloading transcript to memory..."):
-        # Extract video information
-        video_info = extract_video_info(youtube_url)
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.FETCH, "🔄 Step 1: Downloading transcript to memory..."
+    ) as tracker:
+        video_id = extract_video_id(youtube_url)
 
-        if not video_info.video_id:
-            st.error("❌ Failed to extract video ID from URL")
+        if not video_id:
+            tracker.fail("❌ Failed to extract video ID from URL")
             return None
 
-        # Get transcript content
-        transcript_content = get_transcript_content(video_info)
+        fallback_info = VideoInfo(url=youtube_url, video_id=video_id)
+        metadata_deadline = time.monotonic() + metadata_timeout
 
-        if not transcript_content:
-            st.error("❌ Failed to download transcript")
-            return None
+        step_timings: dict[str, float] = {}
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="video-data")
+        try:
+            metadata_future = executor.submit(_timed_call, extract_video_info, youtube_url)
+            transcript_future = executor.submit(_timed_call, get_transcript_content, fallback_info)
+
+            try:
+                transcript_content, step_timings["transcript"] = transcript_future.result(
+                    timeout=transcript_timeout
+                )
+            except Exception as e:
+                tracker.fail(f"❌ Failed to download transcript: {_describe_error(e)}")
+                return None
+
+            if not transcript_content:
+                tracker.fail("❌ Failed to download transcript")
+                return None
+
+            try:
+                video_info, step_timings["metadata"] = metadata_future.result(
+                    timeout=max(0.0, metadata_deadline - time.monotonic())
+                )
+            except Exception as e:
+                tracker.warning(
+                    f"   • Using video ID only, metadata unavailable: {_describe_error(e)}"
+                )
+                video_info = fallback_info
+        finally:
+            # Do not wait for a slow metadata extraction that is no longer needed
+            executor.shutdown(wait=False, cancel_futures=True)
 
-    st.success(f"✅ Downloaded transcript ({len(transcript_content)} characters)")
+        _report_video_data(tracker, transcript_content, step_timings)
 
     return VideoData(video_info=video_info, transcript_text=transcript_content)
 
 
+def wait_for_model(
+    model: str, warm_up: Future[LLMUsage], progress: ProgressSink | None = None
+) -> None:
+    """Wait for the model of a job to be loaded, reporting the load stage.
+
+    The model is preloaded when the job is queued, so by the time the
+    transcript is downloaded the wait is usually short or nothing.
+
+    Args:
+        model: AI model used by the job.
+        warm_up: Preload of the model, see ``ModelResidency.job``.
+        progress: Optional sink receiving progress events.
+    """
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.LOAD, f"🔥 Loading {model}...", completed_message=f"✅ {model} ready"
+    ) as tracker:
+        try:
+            load_usage = warm_up.result()
+        except Exception as e:
+            # Not fatal, the first request of the job loads the model instead
+            tracker.warning(f"   • Could not preload the model: {_describe_error(e)}")
+        else:
+            _report_model_load(tracker, load_usage)
+
+
+def _timed_call(function: Callable[..., T], *args: Any) -> tuple[T, float]:
+    """Call a function and measure how long it took.
+
+    Args:
+        function: Function to call.
+        *args: Arguments passed to the function.
+
+    Returns:
+        Tuple of (function result, seconds spent).
+    """
+    started_at = time.monotonic()
+    result = function(*args)
+    return result, time.monotonic() - started_at
+
+
+def _describe_error(error: BaseException) -> str:
+    """Describe an error raised while fetching video data.
+
+    Args:
+        error: Exception raised by a fetch or its timeout.
+
+    Returns:
+        Human readable description of the error.
+    """
+    if isinstance(error, TimeoutError):
+        return "timed out"
+    return str(error)
+
+
+def _report_video_data(
+    tracker: StageTracker, transcript_content: str, step_timings: dict[str, float]
+) -> None:
+    """Report the downloaded transcript.
+
+    Args:
+        tracker: Tracker of the fetch stage.
+        transcript_content: Downloaded transcript text.
+        step_timings: Seconds spent downloading the transcript and the metadata.
+    """
+    tracker.update(
+        f"✅ Downloaded transcript ({len(transcript_content)} characters)",
+        details={"characters": len(transcript_content), "timings": step_timings},
+    )
+
+
+def summarize_chunks(
+    chunks: Iterable[TextChunk | ChunkSpan],
+    model: str,
+    notes: str | None = None,
+    max_workers: int = 1,
+    progress: ProgressSink | None = None,
+    checkpoint: JobCheckpoint | None = None,
+) -> list[ChunkSummary]:
+    """Summarize chunks concurrently with a bounded pool of workers.
+
+    Requests are fanned out to at most ``max_workers`` threads so that an Ollama
+    server running with ``OLLAMA_NUM_PARALLEL > 1`` can serve them in parallel.
+    Chunks are pulled from ``chunks`` only when a worker is free, so a lazy
+    iterator such as ``TextChunker.iter_spans`` overlaps chunking with
+    inference. Progress is reported from the calling thread as each chunk
+    completes.
+
+    With a checkpoint, chunks summarized by an earlier run of the job are
+    restored instead of being sent to the model, and every new summary is
+    saved as soon as it completes.
+
+    Args:
+        chunks (Iterable[TextChunk | ChunkSpan]): Chunks to summarize, possibly lazily produced.
+        model (str): AI model to use for summarization.
+        notes (str | None): Manual notes for focused summary.
+        max_workers (int): Maximum number of concurrent summarization requests.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+        checkpoint (JobCheckpoint | None): Optional checkpoint of the job.
+
+    Returns:
+        Chunk summaries ordered by chunk index, including failed ones.
+    """
+    reporter = ProgressReporter(progress)
+    total_chunks = len(chunks) if isinstance(chunks, Sized) else None
+    max_workers = max(1, max_workers)
+    results: dict[int, ChunkSummary] = {}
+    pending: dict[Future[tuple[ChunkSummary, float]], TextChunk | ChunkSpan] = {}
+
+    def _collect(done: Iterable[Future[tuple[ChunkSummary, float]]]) -> None:
+        # Sinks may not be thread-safe, so report from the calling thread
+        for future in done:
+            chunk = pending.pop(future)
+            try:
+                summary_result, elapsed = future.result()
+            except Exception as e:
+                summary_result, elapsed = _failed_chunk_summary(chunk, e), None
+
+            if checkpoint is not None:
+                checkpoint.save(chunk, summary_result)
+            _report_chunk_summary(reporter, chunk, summary_result, total_chunks, elapsed, model)
+            results[chunk.chunk_index] = summary_result
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="chunk-summarizer"
+    ) as executor:
+        for chunk in chunks:
+            restored = checkpoint.restore(chunk) if checkpoint is not None else None
+            if restored is not None:
+                _report_chunk_summary(
+                    reporter, chunk, restored, total_chunks, None, model, resumed=True
+                )
+                results[chunk.chunk_index] = restored
+                continue
+
+            if len(pending) >= max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(done)
+            pending[executor.submit(_timed_summarize_chunk, chunk, model, notes)] = chunk
+
+        _collect(list(as_completed(pending)))
+
+    return [results[index] for index in sorted(results)]
+
+
+def _timed_summarize_chunk(
+    chunk: TextChunk | ChunkSpan, model: str, notes: str | None
+) -> tuple[ChunkSummary, float]:
+    """Summarize a chunk and measure how long it took.
+
+    Args:
+        chunk (TextChunk | ChunkSpan): Chunk to summarize.
+        model (str): AI model to use for summarization.
+        notes (str | None): Manual notes for focused summary.
+
+    Returns:
+        Tuple of (chunk summary, seconds spent).
+    """
+    started_at = time.monotonic()
+    summary_result = summarize_chunk(
+        chunk_content=chunk.content,
+        chunk_index=chunk.chunk_index,
+        model=model,
+        notes=notes,
+    )
+    return summary_result, time.monotonic() - started_at
+
+
+def _failed_chunk_summary(chunk: TextChunk | ChunkSpan, error: Exception) -> ChunkSummary:
+    """Build the summary recorded for a chunk whose worker raised.
+
+    Args:
+        chunk (TextChunk | ChunkSpan): Chunk that failed.
+        error (Exception): Exception raised while summarizing it.
+
+    Returns:
+        Failed ChunkSummary for the chunk.
+    """
+    return ChunkSummary(
+        summary="",
+        chunk_index=chunk.chunk_index,
+        success=False,
+        error_message=f"Summarization failed: {str(error)}",
+    )
+
+
+def _report_chunk_summary(
+    reporter: ProgressReporter,
+    chunk: TextChunk | ChunkSpan,
+    summary_result: ChunkSummary,
+    total_chunks: int | None,
+    elapsed: float | None,
+    model: str,
+    resumed: bool = False,
+) -> None:
+    """Report the outcome of a single chunk summarization.
+
+    Args:
+        reporter (ProgressReporter): Reporter receiving the event.
+        chunk (TextChunk | ChunkSpan): Chunk that was summarized.
+        summary_result (ChunkSummary): Result of the chunk summarization.
+        total_chunks (int | None): Total number of chunks in the job, if known.
+        elapsed (float | None): Seconds spent summarizing the chunk, if known.
+        model (str): AI model used, whose tokenizer measures the chunk.
+        resumed (bool): Whether the summary was restored from a checkpoint.
+    """
+    position = f"{summary_result.chunk_index + 1}"
+    if total_chunks is not None:
+        position += f"/{total_chunks}"
+
+    content = chunk.content
+    fields = {
+        "chunk_index": summary_result.chunk_index,
+        "total_chunks": total_chunks,
+        "elapsed": elapsed,
+        "tokens": count_tokens(content, model),
+        "usage": [summary_result.usage] if summary_result.usage else [],
+    }
+
+    if resumed:
+        reporter.emit(
+            PipelineStage.SUMMARIZE,
+            ProgressStatus.UPDATE,
+            f"   • Restored chunk {position} from checkpoint ({summary_result.word_count} words)",
+            details={
+                "characters": len(content),
+                "word_count": summary_result.word_count,
+                "resumed": True,
+            },
+            **fields,
+        )
+    elif summary_result.success:
+        reporter.emit(
+            PipelineStage.SUMMARIZE,
+            ProgressStatus.UPDATE,
+            f"   • Summarized chunk {position} ({summary_result.word_count} words)",
+            details={"characters": len(content), "word_count": summary_result.word_count},
+            **fields,
+        )
+    else:
+        reporter.emit(
+            PipelineStage.SUMMARIZE,
+            ProgressStatus.WARNING,
+            f"   • Failed to summarize chunk {position}: {summary_result.error_message}",
+            details={"characters": len(content)},
+            **fields,
+        )
+
+
+def _report_combined_summary(
+    tracker: StageTracker, combined_result: CombinedSummary, chunk_summaries: list[str]
+) -> str:
+    """Report the combine step and pick the final summary text.
+
+    Args:
+        tracker (StageTracker): Tracker of the combine stage.
+        combined_result (CombinedSummary): Result of combining the chunk summaries.
+        chunk_summaries (list[str]): Successful chunk summaries, used as fallback.
+
+    Returns:
+        The combined summary, or the chunk summaries joined with newlines.
+    """
+    if combined_result.summary:
+        tracker.update(
+            f"   • Combined summary created ({combined_result.chunks_processed} chunks processed"
+            f" in {combined_result.reduce_levels} levels)",
+            details={"reduce_levels": combined_result.reduce_levels},
+            usage=combined_result.usage,
+        )
+        return combined_result.summary
+    else:
+        tracker.warning(
+            "   • Using fallback: joining summaries with newlines", usage=combined_result.usage
+        )
+        # Fallback: join summaries with newlines
+        return "\n\n".join(chunk_summaries)
+
+
 def create_hierarchical_summary(
     transcript_text: str,
     chunk_params: ChunkParameters,
     model: str,
     notes: str | None = None,
+    max_workers: int = 1,
+    on_token: Callable[[str], None] | None = None,
+    progress: ProgressSink | None = None,
+    checkpoint: JobCheckpoint | None = None,
 ) -> str | None:
     """Create summary using hierarchical chunking strategy for long content.
 
+    With a checkpoint, the chunks summarized by an interrupted run of the same
+    job are reused and the checkpoint is removed once the summaries have been
+    combined.
+
     Args:
         transcript_text (str): Raw transcript text to summarize.
         chunk_params (ChunkParameters): Chunking parameters from analysis.
         model (str): AI model to use for summarization.
         notes (str | None): Manual notes for focused summary.
+        max_workers (int): Maximum number of chunks summarized concurrently.
+        on_token (Callable[[str], None] | None): Optional callback receiving the
+            combined summary as it streams in.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+        checkpoint (JobCheckpoint | None): Optional checkpoint of the job.
 
     Returns:
         Generated summary content, or None if failed.
     """
-    with st.spinner("📄 Step 3a: Creating and summarizing chunks..."):
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.SUMMARIZE, "📄 Step 3a: Creating and summarizing chunks..."
+    ) as tracker:
         # Create text chunker with computed parameters
-        chunker = TextChunker(
-            chunk_size=chunk_params.chunk_size, overlap=chunk_params.chunk_overlap
+        _report_resumed_job(tracker, checkpoint)
+        chunker = _create_chunker(transcript_text, chunk_params, model, checkpoint)
+
+        # Split text lazily into views of the transcript so the first chunk is
+        # summarized right away, and summarize chunks concurrently, keeping the
+        # original order
+        summary_results = summarize_chunks(
+            chunker.iter_spans(transcript_text),
+            model=model,
+            notes=notes,
+            max_workers=max_workers,
+            progress=progress,
+            checkpoint=checkpoint,
+        )
+        tracker.update(
+            f"   • Processed {len(summary_results)} chunks", total_chunks=len(summary_results)
         )
 
-        # Split text into chunks
-        chunks = chunker.chunk_text(transcript_text)
-        st.write(f"   • Created {len(chunks)} chunks")
-
-        # Summarize each chunk
-        chunk_summaries = []
-        for chunk in chunks:
-            summary_result = summarize_chunk(
-                chunk_content=chunk.content,
-                chunk_index=chunk.chunk_index,
-                model=model,
-                notes=notes,
-            )
-
-            if summary_result.success:
-                chunk_summaries.append(summary_result.summary)
-                st.write(
-                    f"   • Summarized chunk {chunk.chunk_index + 1} "
-                    f"({summary_result.word_count} words)"
-                )
-            else:
-                st.warning(
-                    f"   • Failed to summarize chunk {chunk.chunk_index + 1}: "
-                    f"{summary_result.error_message}"
-                )
+        chunk_summaries = [
+            summary_result.summary for summary_result in summary_results if summary_result.success
+        ]
 
         if not chunk_summaries:
-            st.error("❌ Failed to summarize any chunks")
+            tracker.fail("❌ Failed to summarize any chunks")
             return None
 
-    with st.spinner(f"🔗 Step 3b: Combining {len(chunk_summaries)} chunk summaries..."):
+    with reporter.stage(
+        PipelineStage.COMBINE,
+        f"🔗 Step 3b: Combining {len(chunk_summaries)} chunk summaries...",
+    ) as tracker:
         # Combine chunk summaries
         combined_result = combine_relevant_chunks(
             chunk_summaries=chunk_summaries,
             model=model,
             notes=notes,
+            on_token=on_token,
+            max_workers=max_workers,
         )
 
-        if combined_result.summary:
-            st.write(
-                f"   • Combined summary created ({combined_result.chunks_processed} "
-                f"chunks processed)"
-            )
-            return combined_result.summary
-        else:
-            st.info("   • Using fallback: joining summaries with newlines")
-            # Fallback: join summaries with newlines
-            return "\n\n".join(chunk_summaries)
+        summary = _report_combined_summary(tracker, combined_result, chunk_summaries)
+
+    if checkpoint is not None:
+        checkpoint.clear()
+    return summary
+
+
+def _create_chunker(
+    transcript_text: str,
+    chunk_params: ChunkParameters,
+    model: str,
+    checkpoint: JobCheckpoint | None,
+) -> TextChunker:
+    """Create the chunker of a hierarchical summary.
+
+    A resumed job reuses the characters per token it was first chunked with,
+    so that its chunks keep the boundaries of the checkpointed summaries.
 
+    Args:
+        transcript_text (str): Raw transcript text to summarize.
+        chunk_params (ChunkParameters): Chunking parameters from analysis.
+        model (str): AI model to use for summarization.
+        checkpoint (JobCheckpoint | None): Optional checkpoint of the job.
 
-def create_direct_summary(transcript_text: str, model: str, notes: str | None = None) -> str | None:
+    Returns:
+        TextChunker for the transcript.
+    """
+    chunker = TextChunker(
+        chunk_size=chunk_params.chunk_size,
+        overlap=chunk_params.chunk_overlap,
+        tokenizer=get_tokenizer(model),
+        chars_per_token=checkpoint.chars_per_token if checkpoint is not None else None,
+    )
+    if checkpoint is not None:
+        checkpoint.begin(chunk_params, chunker.chars_per_token(transcript_text))
+    return chunker
+
+
+def _report_resumed_job(tracker: StageTracker, checkpoint: JobCheckpoint | None) -> None:
+    """Report the chunks a resumed job does not need to summarize again.
+
+    Args:
+        tracker (StageTracker): Tracker of the summarize stage.
+        checkpoint (JobCheckpoint | None): Optional checkpoint of the job.
+    """
+    if checkpoint is not None and checkpoint.completed:
+        tracker.update(
+            f"   • Resuming from checkpoint ({checkpoint.completed} chunks already summarized)",
+            details={"resumed_chunks": checkpoint.completed},
+        )
+
+
+def create_direct_summary(
+    transcript_text: str,
+    model: str,
+    notes: str | None = None,
+    on_token: Callable[[str], None] | None = None,
+    progress: ProgressSink | None = None,
+) -> str | None:
     """Create summary directly for short content without chunking.
 
     Args:
         transcript_text: Raw transcript text to summarize.
         model: AI model to use for summarization.
         notes: Manual notes for focused summary.
+        on_token: Optional callback receiving the summary as it streams in.
+        progress: Optional sink receiving progress events.
 
     Returns:
         Generated summary content, or None if failed.
     """
-    with st.spinner("📝 Step 3: Summarizing short text directly..."):
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.SUMMARIZE, "📝 Step 3: Summarizing short text directly..."
+    ) as tracker:
         # Summarize directly without chunking
         summary_result = summarize_chunk(
             chunk_content=transcript_text,
             chunk_index=0,
             model=model,
             notes=notes,
+            on_token=on_token,
+        )
+
+        return _report_direct_summary(tracker, summary_result)
+
+
+def _report_direct_summary(tracker: StageTracker, summary_result: ChunkSummary) -> str | None:
+    """Report the outcome of a direct summarization.
+
+    Args:
+        tracker: Tracker of the summarize stage.
+        summary_result: Result of summarizing the whole transcript.
+
+    Returns:
+        Generated summary content, or None if failed.
+    """
+    usage = [summary_result.usage] if summary_result.usage else []
+
+    if summary_result.success:
+        tracker.update(
+            f"   • Direct summary created ({summary_result.word_count} words)", usage=usage
+        )
+        return summary_result.summary
+    else:
+        tracker.fail(f"   • Failed to create summary: {summary_result.error_message}", usage=usage)
+        return None
+
+
+def create_summary(
+    transcript_text: str,
+    model: str,
+    notes: str | None = None,
+    max_workers: int = 1,
+    on_token: Callable[[str], None] | None = None,
+    progress: ProgressSink | None = None,
+    checkpoints: CheckpointStore | None = None,
+    video_id: str | None = None,
+) -> str | None:
+    """Analyze a transcript and summarize it with the appropriate strategy.
+
+    Args:
+        transcript_text: Raw transcript text to summarize.
+        model: AI model to use for summarization.
+        notes: Manual notes for focused summary.
+        max_workers: Maximum number of chunks summarized concurrently.
+        on_token: Optional callback receiving the final summary as it streams in.
+        progress: Optional sink receiving progress events.
+        checkpoints: Optional store checkpointing hierarchical summaries.
+        video_id: YouTube video ID, required to checkpoint the summary.
+
+    Returns:
+        Generated summary content, or None if failed.
+    """
+    checkpoint = _job_checkpoint(checkpoints, video_id, model, notes, transcript_text)
+    chunk_params = _analyze_transcript(
+        transcript_text, model, notes, ProgressReporter(progress), checkpoint
+    )
+
+    # Step 3: Generate summary using appropriate strategy
+    if chunk_params.should_use_hierarchical:
+        return create_hierarchical_summary(
+            transcript_text=transcript_text,
+            chunk_params=chunk_params,
+            model=model,
+            notes=notes,
+            max_workers=max_workers,
+            on_token=on_token,
+            progress=progress,
+            checkpoint=checkpoint,
+        )
+    else:
+        return create_direct_summary(
+            transcript_text=transcript_text,
+            model=model,
+            notes=notes,
+            on_token=on_token,
+            progress=progress,
         )
 
-        if summary_result.success:
-            st.write(f"   • Direct summary created ({summary_result.word_count} words)")
-            return summary_result.summary
-        else:
-            st.error(f"   • Failed to create summary: {summary_result.error_message}")
-            return None
+
+def _job_checkpoint(
+    checkpoints: CheckpointStore | None,
+    video_id: str | None,
+    model: str,
+    notes: str | None,
+    transcript_text: str,
+) -> JobCheckpoint | None:
+    """Load the checkpoint of a hierarchical summarization job.
+
+    Args:
+        checkpoints: Optional store checkpointing hierarchical summaries.
+        video_id: YouTube video ID, if known.
+        model: AI model used for summarization.
+        notes: Manual notes for focused summary.
+        transcript_text: Raw transcript text to summarize.
+
+    Returns:
+        The job checkpoint, or None without a store or a video ID.
+    """
+    if checkpoints is None or not video_id:
+        return None
+
+    job_id = checkpoint_job_id(video_id, model, notes, transcript_text)
+    return checkpoints.job(job_id)
+
+
+ANALYZE_MESSAGE = "🔄 Step 2: Analyzing content and generating summary..."
+
+
+def _analyze_transcript(
+    transcript_text: str,
+    model: str,
+    notes: str | None,
+    reporter: ProgressReporter,
+    checkpoint: JobCheckpoint | None = None,
+) -> ChunkParameters:
+    """Compute the chunking strategy of a transcript.
+
+    A job resumed from a checkpoint keeps the chunking it was started with,
+    even if the context window or tokenizer calibration changed since.
+
+    Args:
+        transcript_text: Raw transcript text to analyze.
+        model: AI model the transcript will be summarized with.
+        notes: Manual notes included in every summarization prompt.
+        reporter: Reporter receiving the progress events.
+        checkpoint: Optional checkpoint of the job.
+
+    Returns:
+        ChunkParameters for the transcript.
+    """
+    with reporter.stage(PipelineStage.ANALYZE, ANALYZE_MESSAGE) as tracker:
+        chunk_params = _chunk_parameters(transcript_text, model, notes, checkpoint)
+        _report_chunk_parameters(tracker, chunk_params)
+
+    return chunk_params
+
+
+async def _analyze_transcript_async(
+    transcript_text: str,
+    model: str,
+    notes: str | None,
+    reporter: ProgressReporter,
+    checkpoint: JobCheckpoint | None = None,
+) -> ChunkParameters:
+    """Compute the chunking strategy of a transcript without blocking the loop.
+
+    Reading the context window of the model and counting tokens run in a
+    worker thread.
+
+    Args:
+        transcript_text: Raw transcript text to analyze.
+        model: AI model the transcript will be summarized with.
+        notes: Manual notes included in every summarization prompt.
+        reporter: Reporter receiving the progress events.
+        checkpoint: Optional checkpoint of the job.
+
+    Returns:
+        ChunkParameters for the transcript.
+    """
+    with reporter.stage(PipelineStage.ANALYZE, ANALYZE_MESSAGE) as tracker:
+        chunk_params = await asyncio.to_thread(
+            _chunk_parameters, transcript_text, model, notes, checkpoint
+        )
+        _report_chunk_parameters(tracker, chunk_params)
+
+    return chunk_params
+
+
+def _chunk_parameters(
+    transcript_text: str, model: str, notes: str | None, checkpoint: JobCheckpoint | None
+) -> ChunkParameters:
+    """Get the chunking parameters of a job, from its checkpoint if it was started.
+
+    Args:
+        transcript_text: Raw transcript text to analyze.
+        model: AI model the transcript will be summarized with.
+        notes: Manual notes included in every summarization prompt.
+        checkpoint: Optional checkpoint of the job.
+
+    Returns:
+        ChunkParameters for the transcript.
+    """
+    if checkpoint is not None and checkpoint.chunk_params is not None:
+        return checkpoint.chunk_params
+    return compute_chunk_parameters(transcript_text, model=model, notes=notes)
+
+
+def _report_chunk_parameters(tracker: StageTracker, chunk_params: ChunkParameters) -> None:
+    """Report the summarization strategy chosen for a transcript.
+
+    Args:
+        tracker: Tracker of the analyze stage.
+        chunk_params: Chunking parameters of the transcript.
+    """
+    tracker.update(
+        f"   • Using {'hierarchical' if chunk_params.should_use_hierarchical else 'direct'} "
+        f"summarization ({chunk_params.category.value} transcript, "
+        f"{chunk_params.context_window}-token context)",
+        details=chunk_params.model_dump(mode="json"),
+    )
 
 
 def generate_content_files(
     summary_content: str,
     video_info: VideoInfo,
+    progress: ProgressSink | None = None,
 ) -> ContentResult | None:
     """Generate filenames and create final markdown content.
 
     Args:
         summary_content: Generated summary content.
         video_info: Video metadata.
+        progress: Optional sink receiving progress events.
 
     Returns:
         ContentResult with final content and filenames, or None if failed.
     """
-    st.write("📂 Step 4: Generating filenames...")
+    reporter = ProgressReporter(progress)
 
-    # Generate appropriate filenames
-    filename_result = generate_filename_from_video_info(
-        video_info=video_info,
-        include_date=False,
-    )
+    with reporter.stage(PipelineStage.FINALIZE, "📂 Step 4: Generating filenames...") as tracker:
+        # Generate appropriate filenames
+        filename_result = generate_filename_from_video_info(
+            video_info=video_info,
+            include_date=False,
+        )
 
-    st.write(f"   • Summary file: {filename_result.summary_filename}")
-    st.write(f"   • Transcript file: {filename_result.transcript_filename}")
+        tracker.update(f"   • Summary file: {filename_result.summary_filename}")
+        tracker.update(f"   • Transcript file: {filename_result.transcript_filename}")
 
-    st.write("📋 Step 5: Creating final markdown...")
+        tracker.update("📋 Step 5: Creating final markdown...")
 
-    # Generate final markdown with metadata
-    markdown_content = generate_final_markdown(
-        summary_content=summary_content,
-        video_title=video_info.title,
-        author=video_info.author,
-        video_url=video_info.url,
-        duration=video_info.duration_formatted,
-        publish_date=video_info.publish_date,
-    )
+        # Generate final markdown with metadata
+        markdown_content = generate_final_markdown(
+            summary_content=summary_content,
+            video_title=video_info.title,
+            author=video_info.author,
+            video_url=video_info.url,
+            duration=video_info.duration_formatted,
+            publish_date=video_info.publish_date,
+        )
 
-    if not markdown_content:
-        st.error("   • Failed to create markdown: No content generated")
-        return None
+        if not markdown_content:
+            tracker.fail("   • Failed to create markdown: No content generated")
+            return None
 
     return ContentResult(
         summary_content=markdown_content,
@@ -237,6 +868,7 @@ def save_output_files(
     transcript_text: str,
     output_folder: str = ".",
     save_transcript: bool = False,
+    progress: ProgressSink | None = None,
 ) -> tuple[bool, str | None]:
     """Save the generated content and transcript to files.
 
@@ -245,88 +877,259 @@ def save_output_files(
         transcript_text: Raw transcript text to save.
         output_folder: Directory where output files should be saved.
         save_transcript: Whether to save the transcript file.
+        progress: Optional sink receiving progress events.
 
     Returns:
         Tuple of (success, error_message).
     """
-    with st.spinner("🔄 Step 6: Saving files..."):
-        output_path = Path(output_folder)
-        summary_path = output_path / content_result.summary_filename
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.SAVE,
+        "🔄 Step 6: Saving files...",
+        completed_message="✅ Files saved successfully!",
+    ) as tracker:
+        error_message = _write_output_files(
+            content_result, transcript_text, output_folder, save_transcript
+        )
+        if error_message:
+            tracker.fail(error_message)
+            return False, error_message
 
-        # Save transcript file only if requested
-        if save_transcript:
-            transcript_path = output_path / content_result.transcript_filename
-            transcript_success = write_text_file(str(transcript_path), transcript_text)
+    return True, None
 
-            if not transcript_success:
-                st.error(f"Failed to save transcript file: {transcript_path}")
-                return (
-                    False,
-                    f"Failed to save transcript file: {transcript_path}",
-                )
 
-        # Save summary file
-        summary_success = write_text_file(str(summary_path), content_result.summary_content)
+async def save_output_files_async(
+    content_result: ContentResult,
+    transcript_text: str,
+    output_folder: str = ".",
+    save_transcript: bool = False,
+    progress: ProgressSink | None = None,
+) -> tuple[bool, str | None]:
+    """Save the generated content and transcript to files in a worker thread.
 
-        if not summary_success:
-            st.error(f"Failed to save summary file: {summary_path}")
-            return False, f"Failed to save summary file: {summary_path}"
+    Args:
+        content_result: Generated content and filenames.
+        transcript_text: Raw transcript text to save.
+        output_folder: Directory where output files should be saved.
+        save_transcript: Whether to save the transcript file.
+        progress: Optional sink receiving progress events.
 
-    st.success("✅ Files saved successfully!")
+    Returns:
+        Tuple of (success, error_message).
+    """
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.SAVE,
+        "🔄 Step 6: Saving files...",
+        completed_message="✅ Files saved successfully!",
+    ) as tracker:
+        error_message = await asyncio.to_thread(
+            _write_output_files, content_result, transcript_text, output_folder, save_transcript
+        )
+        if error_message:
+            tracker.fail(error_message)
+            return False, error_message
 
     return True, None
 
 
-def process_video(config: ProcessingConfig) -> ProcessingResult:
+def _write_output_files(
+    content_result: ContentResult,
+    transcript_text: str,
+    output_folder: str,
+    save_transcript: bool,
+) -> str | None:
+    """Write the summary file and, if requested, the transcript file.
+
+    Args:
+        content_result: Generated content and filenames.
+        transcript_text: Raw transcript text to save.
+        output_folder: Directory where output files should be saved.
+        save_transcript: Whether to save the transcript file.
+
+    Returns:
+        Error message of the first file that could not be written, None on success.
+    """
+    output_path = Path(output_folder)
+    summary_path = output_path / content_result.summary_filename
+
+    # Save transcript file only if requested
+    if save_transcript:
+        transcript_path = output_path / content_result.transcript_filename
+        if not write_text_file(str(transcript_path), transcript_text):
+            return f"Failed to save transcript file: {transcript_path}"
+
+    # Save summary file
+    if not write_text_file(str(summary_path), content_result.summary_content):
+        return f"Failed to save summary file: {summary_path}"
+
+    return None
+
+
+def process_video(
+    config: ProcessingConfig, progress: ProgressSink | None = None
+) -> ProcessingResult:
     """Process YouTube video through the complete workflow.
 
     Args:
         config (ProcessingConfig): Processing configuration object.
+        progress (ProgressSink | None): Optional sink receiving progress events.
 
     Returns:
-        ProcessingResult with processing status and file paths.
+        ProcessingResult with processing status, file paths and timings.
     """
-    # Step 1: Extract video data
-    video_data = extract_video_data(config.youtube_url)
-    if not video_data:
-        return ProcessingResult(
-            success=False,
-            error_message="Failed to extract video information or download transcript",
-        )
+    recorder = TimingRecorder()
+    usage_recorder = UsageRecorder()
+    progress = combine_sinks(recorder, usage_recorder, progress)
+    reporter = ProgressReporter(progress)
+
+    with (
+        reporter.stage(
+            PipelineStage.JOB,
+            f"Processing {config.youtube_url}",
+            completed_message="🎉 Processing complete!",
+        ) as tracker,
+        get_model_residency().job(config.model) as warm_up,
+    ):
+        # Step 1: Extract video data, while the model loads
+        video_data = extract_video_data(config.youtube_url, progress=progress)
+        if not video_data:
+            result = _failed_result(
+                tracker, "Failed to extract video information or download transcript"
+            )
+        else:
+            wait_for_model(config.model, warm_up, progress=progress)
+
+            # Steps 2 and 3: Analyze content and generate summary
+            summary_content = create_summary(
+                transcript_text=video_data.transcript_text,
+                model=config.model,
+                notes=config.notes,
+                max_workers=config.max_workers,
+                progress=progress,
+                checkpoints=get_checkpoint_store(),
+                video_id=video_data.video_info.video_id,
+            )
 
-    # Step 2: Analyze content
-    st.write("🔄 Step 2: Analyzing content and generating summary...")
+            # Steps 4 and 5: Generate final content and save files
+            result = _finalize_video(config, video_data, summary_content, tracker, progress)
+
+    # The job timing is only known once its stage has ended
+    result.timings = recorder.timings
+    result.usage = usage_recorder.summary
+    record_job_usage(
+        config.youtube_url,
+        config.model,
+        video_data.video_info if video_data else None,
+        result.success,
+        result.timings,
+        usage_recorder.usages,
+    )
+    return result
 
-    chunk_params = compute_chunk_parameters(video_data.transcript_text)
 
-    # Step 3: Generate summary using appropriate strategy
-    if chunk_params.should_use_hierarchical:
-        summary_content = create_hierarchical_summary(
-            transcript_text=video_data.transcript_text,
-            chunk_params=chunk_params,
-            model=config.model,
-            notes=config.notes,
-        )
-    else:
-        summary_content = create_direct_summary(
-            transcript_text=video_data.transcript_text,
-            model=config.model,
-            notes=config.notes,
+def _report_model_load(tracker: StageTracker, load_usage: LLMUsage) -> None:
+    """Report a completed model preload.
+
+    The usage of the load request goes with the event, so that the loads
+    done ahead of a job are counted like those of its chat calls.
+
+    Args:
+        tracker (StageTracker): Tracker of the load stage.
+        load_usage (LLMUsage): Usage of the load request.
+    """
+    tracker.update(
+        f"   • Model loaded in {load_usage.total_duration:.1f}s, waited {tracker.elapsed:.1f}s",
+        details={"timings": {"load": load_usage.total_duration}},
+        usage=[load_usage],
+    )
+
+
+def record_job_usage(
+    youtube_url: str,
+    model: str,
+    video_info: VideoInfo | None,
+    success: bool,
+    timings: ProcessingTimings | None,
+    usages: list[LLMUsage],
+) -> None:
+    """Add a processed video and its LLM calls to the usage ledger.
+
+    Failures are logged, a job never fails because its usage could not be recorded.
+
+    Args:
+        youtube_url (str): URL of the processed video.
+        model (str): AI model requested for the job.
+        video_info (VideoInfo | None): Video information, if it was fetched.
+        success (bool): Whether the job succeeded.
+        timings (ProcessingTimings | None): Timings of the job, with its total.
+        usages (list[LLMUsage]): Usage of each chat call made by the job.
+    """
+    try:
+        ledger = get_usage_ledger()
+        if ledger is None:
+            return
+
+        ledger.record_job(
+            job_id=uuid.uuid4().hex,
+            model=model,
+            usages=usages,
+            video_id=extract_video_id(youtube_url),
+            video_seconds=video_info.length if video_info else None,
+            success=success,
+            elapsed=timings.total if timings else None,
         )
+    except Exception:
+        logger.opt(exception=True).warning("Could not record the job in the usage ledger.")
+
+
+def _failed_result(tracker: StageTracker, error_message: str) -> ProcessingResult:
+    """Report a failed job and build its result.
+
+    Args:
+        tracker (StageTracker): Tracker of the job stage.
+        error_message (str): Description of the failure.
 
+    Returns:
+        Failed ProcessingResult.
+    """
+    tracker.fail(error_message)
+    return ProcessingResult(success=False, error_message=error_message)
+
+
+def _finalize_video(
+    config: ProcessingConfig,
+    video_data: VideoData,
+    summary_content: str | None,
+    tracker: StageTracker,
+    progress: ProgressSink | None,
+) -> ProcessingResult:
+    """Turn a generated summary into output files and a processing result.
+
+    Args:
+        config (ProcessingConfig): Processing configuration object.
+        video_data (VideoData): Video information and transcript.
+        summary_content (str | None): Generated summary, or None if it failed.
+        tracker (StageTracker): Tracker of the job stage.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+
+    Returns:
+        ProcessingResult with processing status and file paths.
+    """
     if not summary_content:
-        return ProcessingResult(success=False, error_message="Failed to generate summary content")
+        return _failed_result(tracker, "Failed to generate summary content")
 
     # Step 4: Generate final content and filenames
     content_result = generate_content_files(
         summary_content,
         video_data.video_info,
+        progress=progress,
     )
     if not content_result:
-        return ProcessingResult(
-            success=False,
-            error_message="Failed to generate final content and filenames",
-        )
+        return _failed_result(tracker, "Failed to generate final content and filenames")
+    content_result = _with_configured_filenames(config, content_result)
 
     # Step 5: Save files
     save_success, error_message = save_output_files(
@@ -334,16 +1137,91 @@ def process_video(config: ProcessingConfig) -> ProcessingResult:
         video_data.transcript_text,
         config.output_folder,
         config.save_transcript,
+        progress=progress,
     )
     if not save_success:
-        return ProcessingResult(success=False, error_message=error_message)
+        return _failed_result(tracker, error_message or "Failed to save output files")
 
-    st.balloons()
-    st.success("🎉 Processing complete!")
+    return _saved_result(config, content_result)
 
-    # Prepare full file paths for the result
-    from pathlib import Path
 
+async def _finalize_video_async(
+    config: ProcessingConfig,
+    video_data: VideoData,
+    summary_content: str | None,
+    tracker: StageTracker,
+    progress: ProgressSink | None,
+) -> ProcessingResult:
+    """Turn a generated summary into output files without blocking the loop.
+
+    Args:
+        config (ProcessingConfig): Processing configuration object.
+        video_data (VideoData): Video information and transcript.
+        summary_content (str | None): Generated summary, or None if it failed.
+        tracker (StageTracker): Tracker of the job stage.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+
+    Returns:
+        ProcessingResult with processing status and file paths.
+    """
+    if not summary_content:
+        return _failed_result(tracker, "Failed to generate summary content")
+
+    # Step 4: Generate final content and filenames, formatting only
+    content_result = generate_content_files(
+        summary_content,
+        video_data.video_info,
+        progress=progress,
+    )
+    if not content_result:
+        return _failed_result(tracker, "Failed to generate final content and filenames")
+    content_result = _with_configured_filenames(config, content_result)
+
+    # Step 5: Save files
+    save_success, error_message = await save_output_files_async(
+        content_result,
+        video_data.transcript_text,
+        config.output_folder,
+        config.save_transcript,
+        progress=progress,
+    )
+    if not save_success:
+        return _failed_result(tracker, error_message or "Failed to save output files")
+
+    return _saved_result(config, content_result)
+
+
+def _with_configured_filenames(
+    config: ProcessingConfig, content_result: ContentResult
+) -> ContentResult:
+    """Use the file names requested in the configuration instead of the generated ones.
+
+    Args:
+        config (ProcessingConfig): Processing configuration object.
+        content_result (ContentResult): Generated content and filenames.
+
+    Returns:
+        ContentResult with the configured filenames.
+    """
+    return content_result.model_copy(
+        update={
+            "summary_filename": config.summary_file or content_result.summary_filename,
+            "transcript_filename": config.transcript_file or content_result.transcript_filename,
+        }
+    )
+
+
+def _saved_result(config: ProcessingConfig, content_result: ContentResult) -> ProcessingResult:
+    """Build the result of a job whose files were saved.
+
+    Args:
+        config (ProcessingConfig): Processing configuration object.
+        content_result (ContentResult): Generated content and filenames.
+
+    Returns:
+        Successful ProcessingResult with the saved file paths.
+    """
+    # Prepare full file paths for the result
     output_path = Path(config.output_folder)
     full_summary_path = output_path / content_result.summary_filename
 
@@ -357,3 +1235,381 @@ def process_video(config: ProcessingConfig) -> ProcessingResult:
         transcript_file=str(full_transcript_path) if full_transcript_path else None,
         summary_file=str(full_summary_path),
     )
+
+
+async def extract_video_data_async(
+    youtube_url: str,
+    metadata_timeout: float = METADATA_TIMEOUT,
+    transcript_timeout: float = TRANSCRIPT_TIMEOUT,
+    progress: ProgressSink | None = None,
+) -> VideoData | None:
+    """Extract video information and download transcript without blocking the loop.
+
+    The blocking yt-dlp and transcript API calls run concurrently in worker
+    threads, with the same fallback rules as ``extract_video_data``.
+
+    Args:
+        youtube_url: YouTube video URL to process.
+        metadata_timeout: Seconds to wait for the video metadata.
+        transcript_timeout: Seconds to wait for the transcript.
+        progress: Optional sink receiving progress events.
+
+    Returns:
+        VideoData with video info and transcript, or None if failed.
+    """
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.FETCH, "🔄 Step 1: Downloading transcript to memory..."
+    ) as tracker:
+        video_id = extract_video_id(youtube_url)
+
+        if not video_id:
+            tracker.fail("❌ Failed to extract video ID from URL")
+            return None
+
+        fallback_info = VideoInfo(url=youtube_url, video_id=video_id)
+
+        step_timings: dict[str, float] = {}
+
+        metadata_task = asyncio.create_task(
+            asyncio.wait_for(
+                asyncio.to_thread(_timed_call, extract_video_info, youtube_url),
+                timeout=metadata_timeout,
+            )
+        )
+
+        try:
+            transcript_content, step_timings["transcript"] = await asyncio.wait_for(
+                asyncio.to_thread(_timed_call, get_transcript_content, fallback_info),
+                timeout=transcript_timeout,
+            )
+        except Exception as e:
+            metadata_task.cancel()
+            tracker.fail(f"❌ Failed to download transcript: {_describe_error(e)}")
+            return None
+
+        if not transcript_content:
+            metadata_task.cancel()
+            tracker.fail("❌ Failed to download transcript")
+            return None
+
+        try:
+            video_info, step_timings["metadata"] = await metadata_task
+        except Exception as e:
+            tracker.warning(f"   • Using video ID only, metadata unavailable: {_describe_error(e)}")
+            video_info = fallback_info
+
+        _report_video_data(tracker, transcript_content, step_timings)
+
+    return VideoData(video_info=video_info, transcript_text=transcript_content)
+
+
+async def wait_for_model_async(
+    model: str, warm_up: Future[LLMUsage], progress: ProgressSink | None = None
+) -> None:
+    """Wait for the model of a job to be loaded without blocking the loop.
+
+    Args:
+        model: AI model used by the job.
+        warm_up: Preload of the model, see ``ModelResidency.job``.
+        progress: Optional sink receiving progress events.
+    """
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.LOAD, f"🔥 Loading {model}...", completed_message=f"✅ {model} ready"
+    ) as tracker:
+        try:
+            load_usage = await asyncio.wrap_future(warm_up)
+        except Exception as e:
+            # Not fatal, the first request of the job loads the model instead
+            tracker.warning(f"   • Could not preload the model: {_describe_error(e)}")
+        else:
+            _report_model_load(tracker, load_usage)
+
+
+async def summarize_chunks_async(
+    chunks: Iterable[TextChunk | ChunkSpan],
+    model: str,
+    notes: str | None = None,
+    max_workers: int = 1,
+    progress: ProgressSink | None = None,
+    checkpoint: JobCheckpoint | None = None,
+) -> list[ChunkSummary]:
+    """Summarize chunks on the event loop with at most ``max_workers`` in flight.
+
+    The next chunk is only pulled from ``chunks`` once a request slot is free.
+    Checkpointed chunks are restored as in ``summarize_chunks``.
+
+    Args:
+        chunks (Iterable[TextChunk | ChunkSpan]): Chunks to summarize, possibly lazily produced.
+        model (str): AI model to use for summarization.
+        notes (str | None): Manual notes for focused summary.
+        max_workers (int): Maximum number of concurrent summarization requests.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+        checkpoint (JobCheckpoint | None): Optional checkpoint of the job.
+
+    Returns:
+        Chunk summaries ordered by chunk index, including failed ones.
+    """
+    reporter = ProgressReporter(progress)
+    total_chunks = len(chunks) if isinstance(chunks, Sized) else None
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def _summarize(chunk: TextChunk | ChunkSpan) -> ChunkSummary:
+        started_at = time.monotonic()
+        try:
+            summary_result = await summarize_chunk_async(
+                chunk_content=chunk.content,
+                chunk_index=chunk.chunk_index,
+                model=model,
+                notes=notes,
+            )
+        except Exception as e:
+            summary_result = _failed_chunk_summary(chunk, e)
+        finally:
+            semaphore.release()
+        elapsed = time.monotonic() - started_at
+
+        if checkpoint is not None:
+            await asyncio.to_thread(checkpoint.save, chunk, summary_result)
+        _report_chunk_summary(reporter, chunk, summary_result, total_chunks, elapsed, model)
+        return summary_result
+
+    restored: list[ChunkSummary] = []
+    tasks = []
+    for chunk in chunks:
+        summary_result = checkpoint.restore(chunk) if checkpoint is not None else None
+        if summary_result is not None:
+            _report_chunk_summary(
+                reporter, chunk, summary_result, total_chunks, None, model, resumed=True
+            )
+            restored.append(summary_result)
+            continue
+
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(_summarize(chunk)))
+
+    summary_results = [*restored, *await asyncio.gather(*tasks)]
+    return sorted(summary_results, key=lambda summary_result: summary_result.chunk_index)
+
+
+async def create_hierarchical_summary_async(
+    transcript_text: str,
+    chunk_params: ChunkParameters,
+    model: str,
+    notes: str | None = None,
+    max_workers: int = 1,
+    progress: ProgressSink | None = None,
+    checkpoint: JobCheckpoint | None = None,
+) -> str | None:
+    """Create a hierarchical summary using the asyncio AI client.
+
+    Args:
+        transcript_text (str): Raw transcript text to summarize.
+        chunk_params (ChunkParameters): Chunking parameters from analysis.
+        model (str): AI model to use for summarization.
+        notes (str | None): Manual notes for focused summary.
+        max_workers (int): Maximum number of chunks summarized concurrently.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+        checkpoint (JobCheckpoint | None): Optional checkpoint of the job.
+
+    Returns:
+        Generated summary content, or None if failed.
+    """
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.SUMMARIZE, "📄 Step 3a: Creating and summarizing chunks..."
+    ) as tracker:
+        _report_resumed_job(tracker, checkpoint)
+        chunker = await asyncio.to_thread(
+            _create_chunker, transcript_text, chunk_params, model, checkpoint
+        )
+
+        summary_results = await summarize_chunks_async(
+            chunker.iter_spans(transcript_text),
+            model=model,
+            notes=notes,
+            max_workers=max_workers,
+            progress=progress,
+            checkpoint=checkpoint,
+        )
+        tracker.update(
+            f"   • Processed {len(summary_results)} chunks", total_chunks=len(summary_results)
+        )
+
+        chunk_summaries = [
+            summary_result.summary for summary_result in summary_results if summary_result.success
+        ]
+
+        if not chunk_summaries:
+            tracker.fail("❌ Failed to summarize any chunks")
+            return None
+
+    with reporter.stage(
+        PipelineStage.COMBINE,
+        f"🔗 Step 3b: Combining {len(chunk_summaries)} chunk summaries...",
+    ) as tracker:
+        combined_result = await combine_relevant_chunks_async(
+            chunk_summaries=chunk_summaries,
+            model=model,
+            notes=notes,
+            max_workers=max_workers,
+        )
+
+        summary = _report_combined_summary(tracker, combined_result, chunk_summaries)
+
+    if checkpoint is not None:
+        await asyncio.to_thread(checkpoint.clear)
+    return summary
+
+
+async def create_direct_summary_async(
+    transcript_text: str,
+    model: str,
+    notes: str | None = None,
+    progress: ProgressSink | None = None,
+) -> str | None:
+    """Create a direct summary using the asyncio AI client.
+
+    Args:
+        transcript_text: Raw transcript text to summarize.
+        model: AI model to use for summarization.
+        notes: Manual notes for focused summary.
+        progress: Optional sink receiving progress events.
+
+    Returns:
+        Generated summary content, or None if failed.
+    """
+    reporter = ProgressReporter(progress)
+
+    with reporter.stage(
+        PipelineStage.SUMMARIZE, "📝 Step 3: Summarizing short text directly..."
+    ) as tracker:
+        summary_result = await summarize_chunk_async(
+            chunk_content=transcript_text,
+            chunk_index=0,
+            model=model,
+            notes=notes,
+        )
+
+        return _report_direct_summary(tracker, summary_result)
+
+
+async def create_summary_async(
+    transcript_text: str,
+    model: str,
+    notes: str | None = None,
+    max_workers: int = 1,
+    progress: ProgressSink | None = None,
+    checkpoints: CheckpointStore | None = None,
+    video_id: str | None = None,
+) -> str | None:
+    """Analyze a transcript and summarize it using the asyncio AI client.
+
+    Args:
+        transcript_text: Raw transcript text to summarize.
+        model: AI model to use for summarization.
+        notes: Manual notes for focused summary.
+        max_workers: Maximum number of chunks summarized concurrently.
+        progress: Optional sink receiving progress events.
+        checkpoints: Optional store checkpointing hierarchical summaries.
+        video_id: YouTube video ID, required to checkpoint the summary.
+
+    Returns:
+        Generated summary content, or None if failed.
+    """
+    checkpoint = await asyncio.to_thread(
+        _job_checkpoint, checkpoints, video_id, model, notes, transcript_text
+    )
+    chunk_params = await _analyze_transcript_async(
+        transcript_text, model, notes, ProgressReporter(progress), checkpoint
+    )
+
+    if chunk_params.should_use_hierarchical:
+        return await create_hierarchical_summary_async(
+            transcript_text=transcript_text,
+            chunk_params=chunk_params,
+            model=model,
+            notes=notes,
+            max_workers=max_workers,
+            progress=progress,
+            checkpoint=checkpoint,
+        )
+    else:
+        return await create_direct_summary_async(
+            transcript_text=transcript_text,
+            model=model,
+            notes=notes,
+            progress=progress,
+        )
+
+
+async def process_video_async(
+    config: ProcessingConfig, progress: ProgressSink | None = None
+) -> ProcessingResult:
+    """Process YouTube video through the complete workflow on an event loop.
+
+    Async counterpart of ``process_video``: several videos can be processed
+    concurrently by gathering calls on a single event loop.
+
+    Args:
+        config (ProcessingConfig): Processing configuration object.
+        progress (ProgressSink | None): Optional sink receiving progress events.
+
+    Returns:
+        ProcessingResult with processing status, file paths and timings.
+    """
+    recorder = TimingRecorder()
+    usage_recorder = UsageRecorder()
+    progress = combine_sinks(recorder, usage_recorder, progress)
+    reporter = ProgressReporter(progress)
+
+    with (
+        reporter.stage(
+            PipelineStage.JOB,
+            f"Processing {config.youtube_url}",
+            completed_message="🎉 Processing complete!",
+        ) as tracker,
+        get_model_residency().job(config.model) as warm_up,
+    ):
+        # Step 1: Extract video data, while the model loads
+        video_data = await extract_video_data_async(config.youtube_url, progress=progress)
+        if not video_data:
+            result = _failed_result(
+                tracker, "Failed to extract video information or download transcript"
+            )
+        else:
+            await wait_for_model_async(config.model, warm_up, progress=progress)
+
+            # Steps 2 and 3: Analyze content and generate summary
+            summary_content = await create_summary_async(
+                transcript_text=video_data.transcript_text,
+                model=config.model,
+                notes=config.notes,
+                max_workers=config.max_workers,
+                progress=progress,
+                checkpoints=await asyncio.to_thread(get_checkpoint_store),
+                video_id=video_data.video_info.video_id,
+            )
+
+            # Steps 4 and 5: Generate final content and save files
+            result = await _finalize_video_async(
+                config, video_data, summary_content, tracker, progress
+            )
+
+    # The job timing is only known once its stage has ended
+    result.timings = recorder.timings
+    result.usage = usage_recorder.summary
+    await asyncio.to_thread(
+        record_job_usage,
+        config.youtube_url,
+        config.model,
+        video_data.video_info if video_data else None,
+        result.success,
+        result.timings,
+        usage_recorder.usages,
+    )
+    return result
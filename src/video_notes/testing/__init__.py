@@ -0,0 +1,25 @@
+"""Tools for benchmarking and load testing video notes without real services."""
+
+from typing import TYPE_CHECKING
+
+from video_notes.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .fake_ollama import FakeOllama, FakeOllamaSettings, FakeOllamaStats, FakeResponse
+    from .ollama_server import OllamaServer
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={
+        ".fake_ollama": ("FakeOllama", "FakeOllamaSettings", "FakeOllamaStats", "FakeResponse"),
+        ".ollama_server": ("OllamaServer",),
+    },
+)
+
+__all__ = [
+    "FakeOllama",
+    "FakeOllamaSettings",
+    "FakeOllamaStats",
+    "FakeResponse",
+    "OllamaServer",
+]
@@ -0,0 +1,684 @@
+"""Simulated Ollama backend for benchmarks and load tests.
+
+``FakeOllama`` answers the Ollama chat, model list and model details endpoints
+with deterministic text, taking as long as a real server with the configured
+latency and throughput would. It can limit the number of requests served in
+parallel, inject errors, truncate prompts longer than the context window and
+skip the evaluation of prompt prefixes kept in a simulated KV cache. Models
+are loaded on first use and unloaded once their ``keep_alive`` expires, and
+chat requests without messages load or unload a model, as with Ollama.
+
+It is plugged into the shared clients as an httpx transport, so the whole
+pipeline runs unchanged without a GPU::
+
+    from video_notes.agents import ai_client
+
+    fake = FakeOllama(tokens_per_second=50)
+    ai_client.configure(ai_client.ClientSettings(cache_enabled=False), fake.transport())
+
+or served over HTTP with ``video_notes.testing.ollama_server``.
+"""
+
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+import httpx
+from pydantic import BaseModel, Field
+
+# Words used to build generated responses
+VOCABULARY = (
+    "insight",
+    "model",
+    "data",
+    "example",
+    "result",
+    "method",
+    "approach",
+    "context",
+    "summary",
+    "detail",
+    "system",
+    "process",
+)
+
+# Number of generated words per bullet point
+WORDS_PER_LINE = 12
+
+# Seconds a model stays loaded when a request does not set keep_alive
+DEFAULT_KEEP_ALIVE = 300.0
+
+# Seconds per unit of a Go duration such as "1h30m"
+DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+class FakeOllamaSettings(BaseModel):
+    """Behaviour of the simulated Ollama server.
+
+    Attributes:
+        models (list[str]): Model names reported as installed.
+        latency (float): Fixed seconds added to every chat request.
+        load_seconds (float): Seconds needed to load a model that is not loaded.
+        prompt_tokens_per_second (float): Prompt evaluation speed, 0 for instant.
+        tokens_per_second (float): Generation speed, 0 for instant.
+        response_tokens (int): Number of tokens generated per response.
+        parallel (int): Chat requests served at once, like ``OLLAMA_NUM_PARALLEL``,
+            0 for unlimited. Other requests wait for a free slot.
+        context_length (int): Context window of the models in tokens. Longer
+            prompts are truncated, as Ollama does.
+        prefix_cache_slots (int): Prompts kept in the KV cache, one per Ollama
+            parallel slot, 0 to disable prefix caching. The prefix a prompt shares
+            with a cached one is not evaluated again.
+        parameter_count (int): Parameter count reported for the models.
+        error_rate (float): Fraction of chat requests answered with an error.
+        error_status (int): HTTP status of injected errors.
+        seed (int | None): Seed of the error injection, None for a random one.
+    """
+
+    models: list[str] = Field(default_factory=lambda: ["gemma3:12b"])
+    latency: float = Field(default=0.0, ge=0)
+    load_seconds: float = Field(default=0.0, ge=0)
+    prompt_tokens_per_second: float = Field(default=0.0, ge=0)
+    tokens_per_second: float = Field(default=0.0, ge=0)
+    response_tokens: int = Field(default=200, gt=0)
+    parallel: int = Field(default=0, ge=0)
+    context_length: int = Field(default=8192, gt=0)
+    prefix_cache_slots: int = Field(default=0, ge=0)
+    parameter_count: int = Field(default=12_000_000_000, gt=0)
+    error_rate: float = Field(default=0.0, ge=0, le=1)
+    error_status: int = Field(default=500, ge=400, le=599)
+    seed: int | None = Field(default=None)
+
+
+class FakeOllamaStats(BaseModel):
+    """Counters of the requests served by a simulated server.
+
+    Attributes:
+        requests (int): Requests received, on any endpoint
+        chat_requests (int): Chat requests received
+        errors (int): Chat requests answered with an injected error
+        truncated (int): Chat requests whose prompt exceeded the context window
+        max_in_flight (int): Highest number of chat requests generating at once
+        prompt_tokens (int): Prompt tokens of the chat requests
+        cached_prompt_tokens (int): Prompt tokens reused from the prefix cache
+        loads (int): Times a model was loaded
+        unloads (int): Times a model was unloaded on request
+    """
+
+    requests: int = 0
+    chat_requests: int = 0
+    errors: int = 0
+    truncated: int = 0
+    max_in_flight: int = 0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    loads: int = 0
+    unloads: int = 0
+
+
+class FakeResponse(NamedTuple):
+    """Response of the simulated server, independent of the HTTP layer.
+
+    A dict body is sent as one JSON document, an iterator as newline-delimited
+    JSON parts produced while generating.
+    """
+
+    status: int
+    body: dict[str, Any] | Iterator[bytes]
+
+
+class FakeOllama:
+    """In-process stand-in for the Ollama HTTP API."""
+
+    def __init__(self, settings: FakeOllamaSettings | None = None, **overrides: Any) -> None:
+        """Initialize the simulated server.
+
+        Args:
+            settings: Server behaviour, defaults to FakeOllamaSettings().
+            **overrides: FakeOllamaSettings fields overriding ``settings``.
+        """
+        base = settings or FakeOllamaSettings()
+        self.settings = base.model_copy(update=overrides) if overrides else base
+        self.stats = FakeOllamaStats()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._random = random.Random(self.settings.seed)  # noqa: S311 - not for security
+        self._cached_prompts: list[str] = []
+        self._load_lock = threading.Lock()
+        self._expires_at: dict[str, float] = {}
+        self._loaded_num_ctx: dict[str, Any] = {}
+        self._slots = (
+            threading.BoundedSemaphore(self.settings.parallel) if self.settings.parallel else None
+        )
+
+    @property
+    def requests(self) -> int:
+        """Get the number of requests received so far.
+
+        Returns:
+            Number of requests, on any endpoint.
+        """
+        return self.stats.requests
+
+    def transport(self) -> httpx.MockTransport:
+        """Create an httpx transport routing requests to this server.
+
+        Returns:
+            Transport usable by both the sync and async Ollama clients.
+        """
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer an httpx request sent by an Ollama client.
+
+        Args:
+            request: Request sent by an Ollama client.
+
+        Returns:
+            Response in the format of the Ollama API.
+        """
+        body = json.loads(request.content) if request.content else {}
+        response = self.respond(request.method, request.url.path, body)
+
+        if isinstance(response.body, dict):
+            return httpx.Response(response.status, json=response.body)
+        return httpx.Response(
+            response.status,
+            content=response.body,
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+    def respond(self, method: str, path: str, body: dict[str, Any]) -> FakeResponse:
+        """Answer an Ollama API request.
+
+        Args:
+            method: HTTP method of the request.
+            path: Path of the endpoint.
+            body: Decoded JSON body of the request.
+
+        Returns:
+            Status and body of the response.
+        """
+        with self._lock:
+            self.stats.requests += 1
+
+        if method in ("GET", "HEAD") and path == "/":
+            return FakeResponse(200, {"status": "Ollama is running"})
+        if method == "GET" and path == "/api/tags":
+            return FakeResponse(200, self.tags())
+        if method == "POST" and path == "/api/show":
+            return self.show(body)
+        if method == "POST" and path == "/api/chat":
+            return self.chat(body)
+
+        return FakeResponse(404, {"error": f"unknown endpoint {method} {path}"})
+
+    def tags(self) -> dict[str, Any]:
+        """Build the list of installed models.
+
+        Returns:
+            Body of an ``/api/tags`` response.
+        """
+        return {
+            "models": [
+                {
+                    "name": name,
+                    "model": name,
+                    "modified_at": _now(),
+                    "size": 0,
+                    "digest": hashlib.sha256(name.encode("utf-8")).hexdigest(),
+                    "details": self._details(),
+                }
+                for name in self.settings.models
+            ]
+        }
+
+    def show(self, body: dict[str, Any]) -> FakeResponse:
+        """Describe an installed model.
+
+        Args:
+            body: Body of an ``/api/show`` request.
+
+        Returns:
+            Model details, parameters and architecture information.
+        """
+        model = body.get("model") or body.get("name", "")
+        if model not in self.settings.models:
+            return FakeResponse(404, {"error": f"model '{model}' not found"})
+
+        return FakeResponse(
+            200,
+            {
+                "modelfile": f"FROM {model}",
+                "parameters": f"num_ctx {self.settings.context_length}",
+                "template": "{{ .Prompt }}",
+                "details": self._details(),
+                "model_info": {
+                    "general.architecture": "fake",
+                    "general.parameter_count": self.settings.parameter_count,
+                    "fake.context_length": self.settings.context_length,
+                },
+            },
+        )
+
+    def chat(self, body: dict[str, Any]) -> FakeResponse:
+        """Answer a chat request, streamed unless ``stream`` is false.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+
+        Returns:
+            The chat response, or an error for unknown models and injected failures.
+        """
+        model = body.get("model", "")
+        with self._lock:
+            self.stats.chat_requests += 1
+            failed = self._random.random() < self.settings.error_rate
+            if failed:
+                self.stats.errors += 1
+
+        if model not in self.settings.models:
+            return FakeResponse(404, {"error": f"model '{model}' not found, try pulling it first"})
+        if failed:
+            return FakeResponse(self.settings.error_status, {"error": "simulated server error"})
+
+        if not body.get("messages"):
+            return FakeResponse(200, self._load_or_unload(body))
+        if body.get("stream", True):
+            return FakeResponse(200, self._stream_chat(body))
+        return FakeResponse(200, self._complete_chat(body))
+
+    def _complete_chat(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Generate a complete chat response, waiting as long as generation would.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+
+        Returns:
+            Body of a non-streaming ``/api/chat`` response.
+        """
+        with self._slot():
+            started_at = time.monotonic()
+            load_seconds = self._load(body)
+            prompt_tokens = self._prompt_tokens(body)
+            prompt_seconds = self._prompt_seconds(prompt_tokens - self._cached_tokens(body))
+            generation_seconds = _seconds(
+                self.settings.response_tokens, self.settings.tokens_per_second
+            )
+            time.sleep(prompt_seconds + generation_seconds)
+
+            self._keep_loaded(body)
+            return self._final_part(
+                body,
+                content=" ".join(self._words(body)),
+                load_seconds=load_seconds,
+                prompt_tokens=prompt_tokens,
+                prompt_seconds=prompt_seconds,
+                generation_seconds=generation_seconds,
+                started_at=started_at,
+            )
+
+    def _stream_chat(self, body: dict[str, Any]) -> Iterator[bytes]:
+        """Generate a chat response as newline-delimited JSON parts.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+
+        Yields:
+            Encoded response parts, one token per part, then the final statistics.
+        """
+        with self._slot():
+            started_at = time.monotonic()
+            load_seconds = self._load(body)
+            prompt_tokens = self._prompt_tokens(body)
+            prompt_seconds = self._prompt_seconds(prompt_tokens - self._cached_tokens(body))
+            time.sleep(prompt_seconds)
+
+            token_seconds = _seconds(1, self.settings.tokens_per_second)
+            for index, word in enumerate(self._words(body)):
+                time.sleep(token_seconds)
+                part = {
+                    "model": body.get("model", ""),
+                    "created_at": _now(),
+                    "message": {
+                        "role": "assistant",
+                        "content": word if index == 0 else f" {word}",
+                    },
+                    "done": False,
+                }
+                yield json.dumps(part).encode("utf-8") + b"\n"
+
+            self._keep_loaded(body)
+            final_part = self._final_part(
+                body,
+                content="",
+                load_seconds=load_seconds,
+                prompt_tokens=prompt_tokens,
+                prompt_seconds=prompt_seconds,
+                generation_seconds=token_seconds * self.settings.response_tokens,
+                started_at=started_at,
+            )
+            yield json.dumps(final_part).encode("utf-8") + b"\n"
+
+    def _load_or_unload(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Answer a chat request without messages.
+
+        Args:
+            body: Body of an ``/api/chat`` request without messages.
+
+        Returns:
+            Final response part, with ``done_reason`` ``unload`` when ``keep_alive``
+            is 0 and ``load`` otherwise.
+        """
+        model = body.get("model", "")
+        started_at = time.monotonic()
+
+        if _keep_alive_seconds(body.get("keep_alive")) == 0:
+            with self._load_lock:
+                if self._expires_at.pop(model, 0.0) > time.monotonic():
+                    with self._lock:
+                        self.stats.unloads += 1
+            done_reason, load_seconds = "unload", 0.0
+        else:
+            done_reason, load_seconds = "load", self._load(body)
+            self._keep_loaded(body)
+
+        return {
+            "model": model,
+            "created_at": _now(),
+            "message": {"role": "assistant", "content": ""},
+            "done": True,
+            "done_reason": done_reason,
+            "total_duration": _nanoseconds(time.monotonic() - started_at),
+            "load_duration": _nanoseconds(load_seconds),
+        }
+
+    def _load(self, body: dict[str, Any]) -> float:
+        """Load the requested model unless it is still loaded with the same ``num_ctx``.
+
+        Concurrent requests for an unloaded model wait for a single load. Like
+        Ollama, a request asking for another context size reloads the model.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+
+        Returns:
+            Seconds spent loading the model, 0 when it was already loaded.
+        """
+        model = body.get("model", "")
+        num_ctx = (body.get("options") or {}).get("num_ctx")
+        with self._load_lock:
+            loaded = self._expires_at.get(model, 0.0) > time.monotonic()
+            if loaded and self._loaded_num_ctx.get(model) == num_ctx:
+                return 0.0
+
+            time.sleep(self.settings.load_seconds)
+            with self._lock:
+                self.stats.loads += 1
+            self._loaded_num_ctx[model] = num_ctx
+            self._expires_at[model] = time.monotonic() + _keep_alive_seconds(body.get("keep_alive"))
+            return self.settings.load_seconds
+
+    def _keep_loaded(self, body: dict[str, Any]) -> None:
+        """Keep the requested model loaded for the request's ``keep_alive``.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+        """
+        with self._load_lock:
+            self._expires_at[body.get("model", "")] = time.monotonic() + _keep_alive_seconds(
+                body.get("keep_alive")
+            )
+
+    def _slot(self) -> "_GenerationSlot":
+        """Reserve a generation slot for the duration of a ``with`` block.
+
+        Returns:
+            Context manager waiting for a free slot and tracking concurrency.
+        """
+        return _GenerationSlot(self)
+
+    def _prompt_tokens(self, body: dict[str, Any], count: bool = True) -> int:
+        """Count the prompt tokens of a chat request.
+
+        Prompts longer than the context window are truncated to it, as Ollama
+        does, and counted in the statistics.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+            count: Whether to add the prompt to the statistics.
+
+        Returns:
+            Prompt tokens, at 4 characters per token.
+        """
+        characters = sum(len(message.get("content", "")) for message in body.get("messages", []))
+        prompt_tokens = math.ceil(characters / 4)
+
+        num_ctx = (body.get("options") or {}).get("num_ctx") or self.settings.context_length
+        context_length = min(num_ctx, self.settings.context_length)
+        truncated = prompt_tokens > context_length
+        prompt_tokens = min(prompt_tokens, context_length)
+
+        if count:
+            with self._lock:
+                self.stats.prompt_tokens += prompt_tokens
+                self.stats.truncated += truncated
+        return prompt_tokens
+
+    def _cached_tokens(self, body: dict[str, Any]) -> int:
+        """Find how much of a prompt is already in the simulated KV cache.
+
+        The slot holding the longest common prefix is reused for the prompt,
+        otherwise the least recently used one, like llama.cpp does.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+
+        Returns:
+            Prompt tokens that do not need to be evaluated, at 4 characters per token.
+        """
+        if not self.settings.prefix_cache_slots:
+            return 0
+
+        prompt = "".join(
+            f"<{message.get('role', '')}>{message.get('content', '')}"
+            for message in body.get("messages", [])
+        )
+        with self._lock:
+            best_slot, best_length = None, 0
+            for slot, cached_prompt in enumerate(self._cached_prompts):
+                length = len(os.path.commonprefix([prompt, cached_prompt]))
+                if length > best_length:
+                    best_slot, best_length = slot, length
+
+            if best_slot is not None:
+                del self._cached_prompts[best_slot]
+            elif len(self._cached_prompts) >= self.settings.prefix_cache_slots:
+                del self._cached_prompts[0]
+            self._cached_prompts.append(prompt)
+
+            cached_tokens = min(best_length // 4, self._prompt_tokens(body, count=False))
+            self.stats.cached_prompt_tokens += cached_tokens
+            return cached_tokens
+
+    def _prompt_seconds(self, prompt_tokens: int) -> float:
+        """Get the time spent before the first generated token.
+
+        Args:
+            prompt_tokens: Number of prompt tokens to evaluate.
+
+        Returns:
+            Seconds of fixed latency plus prompt evaluation.
+        """
+        return self.settings.latency + _seconds(
+            prompt_tokens, self.settings.prompt_tokens_per_second
+        )
+
+    def _words(self, body: dict[str, Any]) -> list[str]:
+        """Generate deterministic markdown words for a request.
+
+        Args:
+            body: Body of an ``/api/chat`` request.
+
+        Returns:
+            One word per generated token, grouped in bullet points.
+        """
+        seed = int(hashlib.sha256(json.dumps(body.get("messages", [])).encode()).hexdigest(), 16)
+        words = []
+        for index in range(self.settings.response_tokens):
+            word = VOCABULARY[(seed + index) % len(VOCABULARY)]
+            if index % WORDS_PER_LINE == 0:
+                word = f"\n- {word}" if index else f"- {word}"
+            words.append(word)
+        return words
+
+    def _details(self) -> dict[str, Any]:
+        """Describe the format of the simulated models.
+
+        Returns:
+            Model details in the format of the Ollama API.
+        """
+        return {
+            "format": "gguf",
+            "family": "fake",
+            "parameter_size": f"{self.settings.parameter_count / 1e9:.1f}B",
+            "quantization_level": "Q4_K_M",
+        }
+
+    def _final_part(
+        self,
+        body: dict[str, Any],
+        content: str,
+        load_seconds: float,
+        prompt_tokens: int,
+        prompt_seconds: float,
+        generation_seconds: float,
+        started_at: float,
+    ) -> dict[str, Any]:
+        """Build the last response part, carrying the request statistics.
+
+        Args:
+            body: Body of the ``/api/chat`` request.
+            content: Generated text included in the part.
+            load_seconds: Seconds spent loading the model.
+            prompt_tokens: Number of evaluated prompt tokens.
+            prompt_seconds: Seconds spent evaluating the prompt.
+            generation_seconds: Seconds spent generating the response.
+            started_at: Monotonic time at which the request started.
+
+        Returns:
+            Final response part with durations in nanoseconds.
+        """
+        return {
+            "model": body.get("model", ""),
+            "created_at": _now(),
+            "message": {"role": "assistant", "content": content},
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": _nanoseconds(time.monotonic() - started_at),
+            "load_duration": _nanoseconds(load_seconds),
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": _nanoseconds(prompt_seconds),
+            "eval_count": self.settings.response_tokens,
+            "eval_duration": _nanoseconds(generation_seconds),
+        }
+
+
+class _GenerationSlot:
+    """Hold one of the server's generation slots while a response is produced."""
+
+    def __init__(self, server: FakeOllama) -> None:
+        """Prepare to reserve a slot.
+
+        Args:
+            server: Server whose slots are used.
+        """
+        self.server = server
+
+    def __enter__(self) -> None:
+        """Wait for a free slot and record the concurrency."""
+        if self.server._slots is not None:
+            self.server._slots.acquire()
+        with self.server._lock:
+            self.server._in_flight += 1
+            self.server.stats.max_in_flight = max(
+                self.server.stats.max_in_flight, self.server._in_flight
+            )
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release the slot.
+
+        Args:
+            *exc_info: Exception raised in the block, if any.
+        """
+        with self.server._lock:
+            self.server._in_flight -= 1
+        if self.server._slots is not None:
+            self.server._slots.release()
+
+
+def _seconds(tokens: int, tokens_per_second: float) -> float:
+    """Get the time needed to process tokens at a given speed.
+
+    Args:
+        tokens: Number of tokens.
+        tokens_per_second: Processing speed, 0 for instant.
+
+    Returns:
+        Seconds needed.
+    """
+    return tokens / tokens_per_second if tokens_per_second > 0 else 0.0
+
+
+def _keep_alive_seconds(keep_alive: str | float | None) -> float:
+    """Convert a ``keep_alive`` request value to seconds.
+
+    Args:
+        keep_alive: Number of seconds or Go duration such as ``"30m"``, negative
+            to keep the model loaded forever, None for the server default.
+
+    Returns:
+        Seconds the model stays loaded after the request.
+    """
+    if keep_alive is None:
+        return DEFAULT_KEEP_ALIVE
+    if isinstance(keep_alive, int | float):
+        seconds = float(keep_alive)
+    else:
+        try:
+            seconds = float(keep_alive)
+        except ValueError:
+            seconds = sum(
+                float(value) * DURATION_UNITS[unit]
+                for value, unit in re.findall(r"(-?[\d.]+)(ms|h|m|s)", keep_alive)
+            )
+    return math.inf if seconds < 0 else seconds
+
+
+def _nanoseconds(seconds: float) -> int:
+    """Convert seconds to the integer nanoseconds used by Ollama.
+
+    Args:
+        seconds: Duration in seconds.
+
+    Returns:
+        Duration in nanoseconds.
+    """
+    return int(seconds * 1_000_000_000)
+
+
+def _now() -> str:
+    """Get the current time in the format used by Ollama.
+
+    Returns:
+        ISO 8601 UTC timestamp.
+    """
+    return datetime.now(UTC).isoformat()
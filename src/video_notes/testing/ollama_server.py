@@ -0,0 +1,220 @@
+"""Ollama-compatible HTTP server backed by the simulated Ollama.
+
+Serves ``/api/chat``, ``/api/tags`` and ``/api/show`` over HTTP so that the
+CLI, the Streamlit app or any other Ollama client can be load tested without
+a GPU. Point the client at it with the ``OLLAMA_HOST`` environment variable::
+
+    python -m video_notes.testing.ollama_server --port 11435 --parallel 2
+    OLLAMA_HOST=http://127.0.0.1:11435 video-notes process URL
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import click
+from loguru import logger
+
+from video_notes.testing.fake_ollama import FakeOllama, FakeOllamaSettings
+
+DEFAULT_HOST = "127.0.0.1"
+
+# Different from Ollama's 11434 so that both can run side by side
+DEFAULT_PORT = 11435
+
+
+class OllamaServer(ThreadingHTTPServer):
+    """HTTP server answering Ollama API requests with a simulated Ollama."""
+
+    daemon_threads = True
+
+    def __init__(self, fake: FakeOllama, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Bind the server.
+
+        Args:
+            fake: Simulated Ollama answering the requests.
+            host: Interface to listen on.
+            port: Port to listen on, 0 for any free port.
+        """
+        super().__init__((host, port), OllamaRequestHandler)
+        self.fake = fake
+
+    @property
+    def url(self) -> str:
+        """Get the base URL of the server.
+
+        Returns:
+            URL usable as an Ollama client host.
+        """
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def start(self) -> threading.Thread:
+        """Serve requests in a background daemon thread.
+
+        Returns:
+            The thread serving requests, stopped by ``shutdown``.
+        """
+        thread = threading.Thread(target=self.serve_forever, name="ollama-server", daemon=True)
+        thread.start()
+        return thread
+
+
+class OllamaRequestHandler(BaseHTTPRequestHandler):
+    """Translate HTTP requests to calls of the simulated Ollama."""
+
+    server: OllamaServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        """Answer a GET request."""
+        self._respond()
+
+    def do_HEAD(self) -> None:  # noqa: N802 - http.server naming
+        """Answer a HEAD request."""
+        self._respond()
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        """Answer a POST request."""
+        self._respond()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - base signature
+        """Log requests at debug level instead of writing them to stderr.
+
+        Args:
+            format: Format string of the message.
+            *args: Values formatted into the message.
+        """
+        logger.debug("Fake Ollama: {}", format % args)
+
+    def _respond(self) -> None:
+        """Answer the current request, streaming generated parts as they come."""
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+
+        response = self.server.fake.respond(self.command, self.path.split("?")[0], body)
+
+        if isinstance(response.body, dict):
+            self._send_json(response.status, response.body)
+            return
+
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for part in response.body:
+            self.wfile.write(f"{len(part):x}\r\n".encode("ascii") + part + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, status: int, body: dict[str, Any]) -> None:
+        """Send a complete JSON response.
+
+        Args:
+            status: HTTP status code.
+            body: JSON document to send.
+        """
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+
+@click.command()
+@click.option("--host", default=DEFAULT_HOST, show_default=True, help="Interface to listen on.")
+@click.option("--port", default=DEFAULT_PORT, show_default=True, help="Port to listen on.")
+@click.option(
+    "--model",
+    "models",
+    multiple=True,
+    default=["gemma3:12b"],
+    show_default=True,
+    help="Model reported as installed, can be repeated.",
+)
+@click.option("--latency", default=0.0, show_default=True, help="Seconds added per chat call.")
+@click.option(
+    "--load-seconds", default=0.0, show_default=True, help="Seconds needed to load a model."
+)
+@click.option(
+    "--prompt-tokens-per-second",
+    default=0.0,
+    show_default=True,
+    help="Prompt evaluation speed, 0 for instant.",
+)
+@click.option(
+    "--tokens-per-second", default=0.0, show_default=True, help="Generation speed, 0 for instant."
+)
+@click.option("--response-tokens", default=200, show_default=True, help="Tokens per response.")
+@click.option(
+    "--parallel", default=0, show_default=True, help="Chat requests served at once, 0 for no limit."
+)
+@click.option(
+    "--context-length", default=8192, show_default=True, help="Model context window in tokens."
+)
+@click.option(
+    "--prefix-cache-slots",
+    default=0,
+    show_default=True,
+    help="Prompts kept in the simulated KV cache, 0 to disable prefix caching.",
+)
+@click.option(
+    "--error-rate", default=0.0, show_default=True, help="Fraction of chat calls that fail."
+)
+@click.option("--error-status", default=500, show_default=True, help="HTTP status of failures.")
+@click.option("--seed", type=int, help="Seed of the error injection.")
+def main(
+    host: str,
+    port: int,
+    models: tuple[str, ...],
+    latency: float,
+    load_seconds: float,
+    prompt_tokens_per_second: float,
+    tokens_per_second: float,
+    response_tokens: int,
+    parallel: int,
+    context_length: int,
+    prefix_cache_slots: int,
+    error_rate: float,
+    error_status: int,
+    seed: int | None,
+) -> None:
+    """Run an Ollama-compatible stand-in server until interrupted."""
+    settings = FakeOllamaSettings(
+        models=list(models),
+        latency=latency,
+        load_seconds=load_seconds,
+        prompt_tokens_per_second=prompt_tokens_per_second,
+        tokens_per_second=tokens_per_second,
+        response_tokens=response_tokens,
+        parallel=parallel,
+        context_length=context_length,
+        prefix_cache_slots=prefix_cache_slots,
+        error_rate=error_rate,
+        error_status=error_status,
+        seed=seed,
+    )
+    fake = FakeOllama(settings)
+
+    with OllamaServer(fake, host=host, port=port) as server:
+        click.echo(f"Fake Ollama serving {', '.join(models)} on {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    click.echo(f"Served {fake.stats.model_dump()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,64 @@
 """Utilities for video notes processing."""
 
-from .file_manager import (
-    ensure_directory_exists,
-    get_safe_filename,
-    sanitize_filename,
-    write_text_file,
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import CacheEntry, CacheStats, DiskCache, default_cache_dir
+    from .file_manager import (
+        ensure_directory_exists,
+        get_safe_filename,
+        sanitize_filename,
+        write_text_file,
+    )
+    from .tokenizer import (
+        CharRatioTokenizer,
+        HuggingFaceTokenizer,
+        Tokenizer,
+        count_message_tokens,
+        count_tokens,
+        get_tokenizer,
+        register_tokenizer,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={
+        ".cache": ("CacheEntry", "CacheStats", "DiskCache", "default_cache_dir"),
+        ".file_manager": (
+            "ensure_directory_exists",
+            "get_safe_filename",
+            "sanitize_filename",
+            "write_text_file",
+        ),
+        ".tokenizer": (
+            "CharRatioTokenizer",
+            "HuggingFaceTokenizer",
+            "Tokenizer",
+            "count_message_tokens",
+            "count_tokens",
+            "get_tokenizer",
+            "register_tokenizer",
+        ),
+    },
 )
 
 __all__ = [
+    "CacheEntry",
+    "CacheStats",
+    "CharRatioTokenizer",
+    "DiskCache",
+    "HuggingFaceTokenizer",
+    "Tokenizer",
+    "count_message_tokens",
+    "count_tokens",
+    "default_cache_dir",
     "ensure_directory_exists",
     "get_safe_filename",
+    "get_tokenizer",
+    "lazy_exports",
+    "register_tokenizer",
     "sanitize_filename",
     "write_text_file",
 ]
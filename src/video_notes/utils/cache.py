@@ -0,0 +1,273 @@
+"""Persistent key-value cache backed by SQLite.
+
+The cache stores JSON-serializable values on disk, evicts the least recently
+used entries once a size budget is exceeded and keeps hit/miss counters. It is
+safe to share between threads and tolerates being shared between processes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+
+class CacheEntry(NamedTuple):
+    """A cached value together with the time it was stored."""
+
+    value: Any
+    created_at: float
+
+    @property
+    def age(self) -> float:
+        """Get the age of the entry in seconds.
+
+        Returns:
+            Seconds elapsed since the entry was stored.
+        """
+        return time.time() - self.created_at
+
+
+class CacheStats(BaseModel):
+    """Usage counters of a disk cache.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that found no usable entry
+        entries (int): Number of stored entries
+        size_bytes (int): Total size of the stored values in bytes
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+def default_cache_dir() -> Path:
+    """Get the directory where video notes stores its caches.
+
+    Uses ``VIDEO_NOTES_CACHE_DIR`` when set, otherwise ``$XDG_CACHE_HOME/video-notes``
+    (``~/.cache/video-notes`` by default).
+
+    Returns:
+        Path of the cache directory.
+    """
+    if cache_dir := os.environ.get("VIDEO_NOTES_CACHE_DIR"):
+        return Path(cache_dir)
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base_dir / "video-notes"
+
+
+class DiskCache:
+    """Size-bounded, least-recently-used cache persisted in a SQLite file.
+
+    Storage errors are logged and treated as cache misses so that a broken
+    cache never interrupts processing.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float | None = None,
+    ) -> None:
+        """Open or create a cache file.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_bytes: Maximum total size of stored values before eviction.
+            ttl: Seconds after which entries are considered expired, None to keep forever.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+            )
+
+    def get(self, key: str, ignore_ttl: bool = False) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+            ignore_ttl: Whether to return expired entries as well.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        entry = self._lookup(key)
+
+        if entry is None or (not ignore_ttl and self.is_expired(entry)):
+            self._record(hit=False)
+            return None
+
+        self._record(hit=True)
+        return entry.value
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Get a cached entry with its age, whether or not it has expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cache entry, or None if missing.
+        """
+        entry = self._lookup(key)
+        self._record(hit=entry is not None)
+        return entry
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value and evict old entries if the cache grew too large.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value to store.
+        """
+        payload = json.dumps(value)
+        now = time.time()
+
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now),
+                )
+                self._evict()
+        except sqlite3.Error:
+            logger.opt(exception=True).warning(f"Could not write to cache {self.path}.")
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            key: Cache key.
+        """
+        try:
+            with self._lock:
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error:
+            logger.opt(exception=True).warning(f"Could not remove an entry of cache {self.path}.")
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self.hits = 0
+            self.misses = 0
+
+    def is_expired(self, entry: CacheEntry) -> bool:
+        """Check whether an entry is older than the cache TTL.
+
+        Args:
+            entry: Cache entry to check.
+
+        Returns:
+            True if the cache has a TTL and the entry is older than it.
+        """
+        return self.ttl is not None and entry.age > self.ttl
+
+    def stats(self) -> CacheStats:
+        """Get the cache usage counters.
+
+        Returns:
+            CacheStats with hit/miss counters and storage usage.
+        """
+        with self._lock:
+            entries, size_bytes = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            return CacheStats(
+                hits=self.hits, misses=self.misses, entries=entries, size_bytes=size_bytes
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Read an entry and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cache entry, or None if missing or unreadable.
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                self._connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+            return CacheEntry(value=json.loads(row[0]), created_at=row[1])
+        except (sqlite3.Error, json.JSONDecodeError):
+            logger.opt(exception=True).warning(f"Could not read from cache {self.path}.")
+            return None
+
+    def _record(self, hit: bool) -> None:
+        """Update the hit/miss counters.
+
+        Args:
+            hit: Whether the lookup was served from the cache.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the size budget is met.
+
+        Must be called with the lock held.
+        """
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total_size <= self.max_bytes:
+            return
+
+        evicted_keys = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ):
+            if total_size <= self.max_bytes:
+                break
+            evicted_keys.append((key,))
+            total_size -= size
+
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted_keys)
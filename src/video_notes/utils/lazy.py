@@ -0,0 +1,58 @@
+"""Lazy loading of package attributes (PEP 562).
+
+Package ``__init__`` modules declare their public API without importing it,
+so that importing one module of the package, such as ``video_notes.models.text``,
+does not pull in yt-dlp, Ollama or every other dependency of the package::
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        submodules=("ai_client",),
+        attributes={".chunk_sizing": ("ChunkParameters", "compute_chunk_parameters")},
+    )
+
+Each attribute is imported on first access and then stored on the package,
+so later lookups are plain attribute reads. Packages keep importing their
+exports under ``TYPE_CHECKING`` for type checkers and editors.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    submodules: Iterable[str] = (),
+    attributes: Mapping[str, Iterable[str]] | None = None,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module ``__getattr__`` and ``__dir__`` of a package with lazy exports.
+
+    Args:
+        package: Name of the package, ``__name__`` in its ``__init__``.
+        submodules: Names of submodules importable as package attributes.
+        attributes: Names exported by each module, keyed by module name
+            relative to the package (``".video"``) or absolute.
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) functions for the package.
+    """
+    submodule_names = frozenset(submodules)
+    origins = {name: module for module, names in (attributes or {}).items() for name in names}
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in submodule_names:
+            value = importlib.import_module(f".{name}", package)
+        elif name in origins:
+            value = getattr(importlib.import_module(origins[name], package), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        # Cache on the package so the next lookup does not come back here
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *submodule_names, *origins})
+
+    return __getattr__, __dir__
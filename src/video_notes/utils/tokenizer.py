@@ -0,0 +1,393 @@
+"""Token counting for chunking and prompt budgeting.
+
+Chunk sizes and context budgets are expressed in model tokens. Tokenizers are
+looked up per model through a small registry:
+
+- an exact tokenizer can be registered for a model with ``register_tokenizer``,
+  for instance a ``HuggingFaceTokenizer`` when the optional ``tokenizers``
+  package is installed;
+- ``VIDEO_NOTES_TOKENIZERS`` maps models to Hugging Face tokenizers, loaded on
+  first use, as in ``gemma3:12b=google/gemma-3-12b-it,llama3:8b=tokenizer.json``;
+- otherwise a ``CharRatioTokenizer`` is used, starting from the classic
+  4 characters per token and calibrated with the prompt token counts that
+  Ollama reports for real requests. The calibration of each model is saved in
+  the cache directory, so that the next process starts from it. Calibration
+  only updates the ratio in memory; the file is written from a background
+  thread at most every few minutes, and once more when the process exits.
+"""
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+# Characters per token assumed before any calibration
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+# Calibration samples outside this range are ignored: they come from prompts
+# too short to measure or from chat templates far from the assumed overhead
+MIN_CHARS_PER_TOKEN = 1.0
+MAX_CHARS_PER_TOKEN = 8.0
+
+# Weight of a new calibration sample in the running ratio
+CALIBRATION_WEIGHT = 0.2
+
+# Tokens added by the chat template around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# File of the cache directory keeping the characters per token of each model
+CALIBRATION_FILE = "tokenizers.json"
+
+# Relative change of a calibrated ratio worth saving again
+CALIBRATION_SAVE_CHANGE = 0.05
+
+# Minimum seconds between two saves of the calibration file
+CALIBRATION_SAVE_INTERVAL = 300.0
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+    """Anything able to count the tokens of a text for a given model."""
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text.
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            Number of tokens.
+        """
+        ...
+
+
+class CharRatioTokenizer:
+    """Approximate tokenizer based on an average number of characters per token."""
+
+    def __init__(self, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN) -> None:
+        """Initialize the tokenizer.
+
+        Args:
+            chars_per_token: Average number of characters per token.
+        """
+        self.chars_per_token = chars_per_token
+        self.calibrated = False
+        self.saved_chars_per_token: float | None = None
+        self._lock = threading.Lock()
+
+    def count_tokens(self, text: str) -> int:
+        """Estimate the tokens of a text from its length.
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            Estimated number of tokens.
+        """
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def calibrate(self, characters: int, tokens: int) -> None:
+        """Adjust the ratio with the measured token count of a text.
+
+        The first sample replaces the default ratio, later ones are blended in
+        with an exponential moving average.
+
+        Args:
+            characters: Number of characters of the measured text.
+            tokens: Number of tokens the model reported for it.
+        """
+        if characters <= 0 or tokens <= 0:
+            return
+
+        ratio = characters / tokens
+        if not MIN_CHARS_PER_TOKEN <= ratio <= MAX_CHARS_PER_TOKEN:
+            return
+
+        with self._lock:
+            if self.calibrated:
+                ratio = (1 - CALIBRATION_WEIGHT) * self.chars_per_token + CALIBRATION_WEIGHT * ratio
+            self.chars_per_token = ratio
+            self.calibrated = True
+
+    def needs_saving(self) -> bool:
+        """Check whether the ratio moved enough since it was last saved.
+
+        Returns:
+            True if the calibrated ratio should be saved again.
+        """
+        if not self.calibrated:
+            return False
+        if self.saved_chars_per_token is None:
+            return True
+        change = abs(self.chars_per_token - self.saved_chars_per_token)
+        return change >= CALIBRATION_SAVE_CHANGE * self.saved_chars_per_token
+
+
+class HuggingFaceTokenizer:
+    """Exact tokenizer backed by the optional ``tokenizers`` package."""
+
+    def __init__(self, identifier: str) -> None:
+        """Load a tokenizer from the Hugging Face hub or a local ``tokenizer.json``.
+
+        Args:
+            identifier: Hub repository name or path of a tokenizer file.
+
+        Raises:
+            ImportError: If the ``tokenizers`` package is not installed.
+        """
+        try:
+            from tokenizers import Tokenizer as _HubTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "Exact token counting requires the 'tokenizers' package: pip install tokenizers"
+            ) from e
+
+        if identifier.endswith(".json"):
+            self._tokenizer = _HubTokenizer.from_file(identifier)
+        else:
+            self._tokenizer = _HubTokenizer.from_pretrained(identifier)
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text.
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            Number of tokens, without special tokens.
+        """
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+_tokenizers: dict[str | None, Tokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+# Guards the save schedule, and the calibration file while it is rewritten
+_schedule_lock = threading.Lock()
+_calibration_lock = threading.Lock()
+_calibration_saved_at: float | None = None
+_exit_save_registered = False
+
+
+def get_tokenizer(model: str | None = None) -> Tokenizer:
+    """Get the tokenizer used for a model.
+
+    Args:
+        model: Ollama model name, or None for the model-agnostic default.
+
+    Returns:
+        The registered tokenizer, the Hugging Face tokenizer configured for the
+        model, or a character-ratio tokenizer created on first use from the
+        saved calibration of the model.
+    """
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(model)
+    if tokenizer is not None:
+        return tokenizer
+
+    # Loading a tokenizer can read files or the network, other models must not wait
+    tokenizer = _create_tokenizer(model)
+    with _tokenizers_lock:
+        return _tokenizers.setdefault(model, tokenizer)
+
+
+def _create_tokenizer(model: str | None) -> Tokenizer:
+    """Create the tokenizer of a model without a registered one.
+
+    Args:
+        model: Ollama model name, or None for the model-agnostic default.
+
+    Returns:
+        The configured Hugging Face tokenizer if it can be loaded, otherwise a
+        character-ratio tokenizer.
+    """
+    if model is None:
+        return CharRatioTokenizer()
+
+    if identifier := _configured_tokenizers().get(model):
+        try:
+            return HuggingFaceTokenizer(identifier)
+        except Exception as e:
+            from loguru import logger
+
+            logger.warning(f"Could not load tokenizer {identifier} for {model}: {e}")
+
+    tokenizer = CharRatioTokenizer()
+    if chars_per_token := _load_calibrations().get(model):
+        tokenizer.chars_per_token = chars_per_token
+        tokenizer.saved_chars_per_token = chars_per_token
+        tokenizer.calibrated = True
+    return tokenizer
+
+
+def _configured_tokenizers() -> dict[str, str]:
+    """Read the Hugging Face tokenizers configured with ``VIDEO_NOTES_TOKENIZERS``.
+
+    Returns:
+        Hub repository name or ``tokenizer.json`` path, keyed by model name.
+    """
+    tokenizers = {}
+    for entry in os.environ.get("VIDEO_NOTES_TOKENIZERS", "").split(","):
+        model, separator, identifier = entry.strip().partition("=")
+        if separator and model.strip() and identifier.strip():
+            tokenizers[model.strip()] = identifier.strip()
+    return tokenizers
+
+
+def _calibration_path() -> Path:
+    """Get the path of the file keeping the calibrated ratios.
+
+    Returns:
+        Path of the calibration file in the cache directory.
+    """
+    # Imported here so that counting tokens does not import pydantic
+    from video_notes.utils.cache import default_cache_dir
+
+    return default_cache_dir() / CALIBRATION_FILE
+
+
+def _load_calibrations() -> dict[str, float]:
+    """Read the saved characters per token of every model.
+
+    Returns:
+        Characters per token keyed by model name, empty if nothing usable was saved.
+    """
+    try:
+        calibrations = json.loads(_calibration_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(calibrations, dict):
+        return {}
+    return {
+        model: float(ratio)
+        for model, ratio in calibrations.items()
+        if isinstance(ratio, int | float) and MIN_CHARS_PER_TOKEN <= ratio <= MAX_CHARS_PER_TOKEN
+    }
+
+
+def save_calibrations() -> None:
+    """Save the calibrated ratios that moved since they were last saved.
+
+    The ratios of other models already in the file are kept, and the file is
+    replaced atomically. An unwritable cache directory only costs the
+    calibration of the next process.
+    """
+    with _tokenizers_lock:
+        tokenizers = {
+            model: tokenizer
+            for model, tokenizer in _tokenizers.items()
+            if model is not None
+            and isinstance(tokenizer, CharRatioTokenizer)
+            and tokenizer.needs_saving()
+        }
+
+    with _calibration_lock:
+        ratios = {model: tokenizer.chars_per_token for model, tokenizer in tokenizers.items()}
+        if not ratios:
+            return
+
+        path = _calibration_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            calibrations = {**_load_calibrations(), **ratios}
+            temporary_path.write_text(json.dumps(calibrations, indent=2), encoding="utf-8")
+            os.replace(temporary_path, path)
+        except OSError:
+            return
+
+        for model, tokenizer in tokenizers.items():
+            tokenizer.saved_chars_per_token = ratios[model]
+
+
+def _schedule_calibration_save() -> None:
+    """Save the calibration in the background unless it was saved recently.
+
+    Callers may be on an event loop, so the file is never written from their
+    thread. The first call also registers a final save at exit.
+    """
+    global _calibration_saved_at, _exit_save_registered
+
+    with _schedule_lock:
+        if not _exit_save_registered:
+            atexit.register(save_calibrations)
+            _exit_save_registered = True
+
+        now = time.monotonic()
+        if (
+            _calibration_saved_at is not None
+            and now - _calibration_saved_at < CALIBRATION_SAVE_INTERVAL
+        ):
+            return
+        _calibration_saved_at = now
+
+    threading.Thread(target=save_calibrations, name="tokenizer-calibration", daemon=True).start()
+
+
+def register_tokenizer(model: str | None, tokenizer: Tokenizer) -> None:
+    """Use a specific tokenizer for a model.
+
+    Args:
+        model: Ollama model name, or None for the model-agnostic default.
+        tokenizer: Tokenizer to use for the model.
+    """
+    with _tokenizers_lock:
+        _tokenizers[model] = tokenizer
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Count the tokens of a text for a model.
+
+    Args:
+        text: Text to measure.
+        model: Ollama model name, or None for the model-agnostic default.
+
+    Returns:
+        Number of tokens.
+    """
+    return get_tokenizer(model).count_tokens(text)
+
+
+def count_message_tokens(messages: list[dict[str, str]], model: str | None = None) -> int:
+    """Count the prompt tokens of a chat request.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys.
+        model: Ollama model name, or None for the model-agnostic default.
+
+    Returns:
+        Number of tokens, including the chat template overhead of each message.
+    """
+    tokenizer = get_tokenizer(model)
+    return sum(
+        tokenizer.count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in messages
+    )
+
+
+def calibrate_from_prompt(
+    messages: list[dict[str, str]], prompt_tokens: int | None, model: str
+) -> None:
+    """Calibrate the approximate tokenizer of a model with a reported prompt size.
+
+    Has no effect when an exact tokenizer is registered for the model. Only
+    the ratio in memory is updated; a noticeable change is saved later from a
+    background thread.
+
+    Args:
+        messages: Messages that were sent to the model.
+        prompt_tokens: Prompt token count reported by Ollama, if any.
+        model: Ollama model name.
+    """
+    tokenizer = get_tokenizer(model)
+    if not isinstance(tokenizer, CharRatioTokenizer) or not prompt_tokens:
+        return
+
+    template_tokens = MESSAGE_OVERHEAD_TOKENS * len(messages)
+    characters = sum(len(message["content"]) for message in messages)
+    tokenizer.calibrate(characters, prompt_tokens - template_tokens)
+    if tokenizer.needs_saving():
+        _schedule_calibration_save()
@@ -0,0 +1,71 @@
+"""Shared fixtures: an isolated cache directory and a simulated Ollama."""
+
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from video_notes.agents import ai_client
+from video_notes.services import checkpoint, residency, usage, video
+from video_notes.testing import FakeOllama
+from video_notes.utils import tokenizer
+
+MODEL = "gemma3:12b"
+
+WORDS = ("model", "data", "video", "summary", "network", "training", "result", "example")
+
+
+def make_transcript(size: int, seed: int = 0) -> str:
+    """Generate a deterministic transcript of ``size`` characters.
+
+    Args:
+        size: Number of characters.
+        seed: Seed of the generated words.
+
+    Returns:
+        Sentences of random words, most of them ending with punctuation.
+    """
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 20)))
+        if rng.random() < 0.7:
+            sentence += "."
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)[:size]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep every cache, checkpoint and ledger of a test in its own directory."""
+    monkeypatch.setenv("VIDEO_NOTES_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("VIDEO_NOTES_OFFLINE", "1")
+    monkeypatch.delenv("VIDEO_NOTES_TOKENIZERS", raising=False)
+    monkeypatch.delenv("VIDEO_NOTES_UNLOAD_AFTER", raising=False)
+    monkeypatch.setattr(checkpoint, "_store", None)
+    monkeypatch.setattr(usage, "_ledger", None)
+    monkeypatch.setattr(video, "_transcript_cache", None)
+    monkeypatch.setattr(video, "_video_info_cache", None)
+    monkeypatch.setattr(residency, "_residency", None)
+    monkeypatch.setattr(tokenizer, "_tokenizers", {})
+    monkeypatch.setattr(tokenizer, "_calibration_saved_at", None)
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def unusable_cache_dir(tmp_path, monkeypatch):
+    """Point the cache directory below a regular file."""
+    regular_file = tmp_path / "afile"
+    regular_file.write_text("not a directory")
+    monkeypatch.setenv("VIDEO_NOTES_CACHE_DIR", str(regular_file / "sub"))
+
+
+@pytest.fixture
+def fake_ollama() -> Iterator[FakeOllama]:
+    """Serve the shared Ollama clients from a simulated Ollama."""
+    fake = FakeOllama(response_tokens=30)
+    ai_client.configure(ai_client.ClientSettings(cache_enabled=False), fake.transport())
+    yield fake
+    ai_client.configure(ai_client.ClientSettings())
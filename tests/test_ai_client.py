@@ -0,0 +1,62 @@
+"""Tests of the shared Ollama client helpers."""
+
+import httpx
+import pytest
+
+from tests.conftest import MODEL
+from video_notes.agents import ai_client
+from video_notes.testing import FakeOllama
+
+
+@pytest.fixture
+def flaky_tags():
+    """Serve a simulated Ollama whose first model list request fails."""
+    fake = FakeOllama()
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tags":
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(500, json={"error": "model list unavailable"})
+        return fake.handle(request)
+
+    ai_client.configure(ai_client.ClientSettings(cache_enabled=False), httpx.MockTransport(handle))
+    yield requests
+    ai_client.configure(ai_client.ClientSettings())
+
+
+def test_model_digest_failures_are_not_retried_immediately(flaky_tags):
+    assert ai_client._model_digest(MODEL) == ""
+    assert ai_client._model_digest(MODEL) == ""
+
+    assert len(flaky_tags) == 1
+
+
+def test_model_digest_is_retried_after_the_retry_window(flaky_tags, monkeypatch):
+    assert ai_client._model_digest(MODEL) == ""
+
+    monkeypatch.setattr(ai_client, "MODEL_INFO_RETRY_SECONDS", 0.0)
+    digest = ai_client._model_digest(MODEL)
+
+    assert digest
+    assert len(flaky_tags) == 2
+    # Once known, the digest is not requested again
+    assert ai_client._model_digest(MODEL) == digest
+    assert len(flaky_tags) == 2
+
+
+@pytest.mark.usefixtures("unusable_cache_dir")
+def test_generation_bypasses_a_response_cache_that_cannot_open():
+    fake = FakeOllama(response_tokens=10)
+    ai_client.configure(ai_client.ClientSettings(cache_enabled=True), fake.transport())
+    messages = [{"role": "user", "content": "Summarize the video."}]
+    try:
+        first = ai_client.generate_with_messages(messages, model=MODEL)
+        second = ai_client.generate_with_messages(messages, model=MODEL)
+    finally:
+        ai_client.configure(ai_client.ClientSettings())
+
+    assert first
+    assert second
+    assert fake.stats.chat_requests == 2
@@ -0,0 +1,81 @@
+"""Tests of the expiry and eviction of DiskCache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from video_notes.utils import cache
+from video_notes.utils.cache import DiskCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the clock of the cache module with one advanced by hand."""
+    now = SimpleNamespace(value=1_000_000.0)
+    monkeypatch.setattr(cache, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def test_entries_expire_after_the_ttl(tmp_path, clock):
+    disk_cache = DiskCache(tmp_path / "cache.sqlite3", ttl=60)
+    disk_cache.set("key", {"value": 1})
+
+    clock.value += 59
+    assert disk_cache.get("key") == {"value": 1}
+
+    clock.value += 2
+    assert disk_cache.get("key") is None
+    assert disk_cache.get("key", ignore_ttl=True) == {"value": 1}
+    assert disk_cache.lookup("key").age == pytest.approx(61)
+
+
+def test_entries_without_ttl_never_expire(tmp_path, clock):
+    disk_cache = DiskCache(tmp_path / "cache.sqlite3")
+    disk_cache.set("key", "value")
+
+    clock.value += 10 * 365 * 24 * 3600
+    assert disk_cache.get("key") == "value"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    value = "x" * 98  # 100 bytes once encoded as JSON
+    disk_cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=300)
+    for key in ("a", "b", "c"):
+        disk_cache.set(key, value)
+        clock.value += 1
+
+    # Reading "a" makes "b" the least recently used entry
+    assert disk_cache.get("a") == value
+    clock.value += 1
+    disk_cache.set("d", value)
+
+    assert disk_cache.get("b") is None
+    assert [disk_cache.get(key) for key in ("a", "c", "d")] == [value] * 3
+    assert disk_cache.stats().size_bytes <= 300
+
+
+def test_an_entry_larger_than_the_budget_is_not_kept(tmp_path, clock):
+    disk_cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=50)
+    disk_cache.set("small", "x")
+    clock.value += 1
+    disk_cache.set("large", "x" * 100)
+
+    assert disk_cache.stats().entries <= 1
+    assert disk_cache.stats().size_bytes <= 50
+
+
+def test_stats_count_hits_and_misses(tmp_path):
+    disk_cache = DiskCache(tmp_path / "cache.sqlite3")
+    disk_cache.set("key", [1, 2, 3])
+
+    disk_cache.get("key")
+    disk_cache.get("missing")
+    stats = disk_cache.stats()
+
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_the_cache_persists_across_instances(tmp_path):
+    DiskCache(tmp_path / "cache.sqlite3").set("key", "value")
+
+    assert DiskCache(tmp_path / "cache.sqlite3").get("key") == "value"
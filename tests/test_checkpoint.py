@@ -0,0 +1,155 @@
+"""Tests of resuming interrupted jobs from their checkpoint."""
+
+import asyncio
+
+import pytest
+
+from tests.conftest import MODEL, make_transcript
+from video_notes.agents import ai_client
+from video_notes.models import ProcessingConfig
+from video_notes.services import video, workflow
+from video_notes.services.checkpoint import (
+    CheckpointStore,
+    checkpoint_job_id,
+    get_checkpoint_store,
+)
+
+VIDEO_ID = "checkpoint1"
+
+
+class JobInterruptedError(Exception):
+    """Stands for the job being killed before its summaries are combined."""
+
+
+@pytest.fixture
+def config(fake_ollama, tmp_path):
+    """Configure a long cached video that is split into many chunks."""
+    ai_client.configure(
+        ai_client.ClientSettings(cache_enabled=False, context_window=2048), fake_ollama.transport()
+    )
+    video._store_transcript(VIDEO_ID, "en", True, make_transcript(40_000))
+    video.get_video_info_cache().set(VIDEO_ID, {"title": "Checkpoints", "length": 1_200})
+    return ProcessingConfig(
+        youtube_url=f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        model=MODEL,
+        output_folder=str(tmp_path / "notes"),
+        max_workers=4,
+    )
+
+
+def run_interrupted(config, monkeypatch) -> int:
+    """Run a job that is killed once its chunks are summarized.
+
+    Returns:
+        Number of chunks summarized before the interruption.
+    """
+
+    def combine(*args, **kwargs):
+        raise JobInterruptedError
+
+    events = []
+    with monkeypatch.context() as patch:
+        patch.setattr(workflow, "combine_relevant_chunks", combine)
+        with pytest.raises(JobInterruptedError):
+            workflow.process_video(config, progress=events.append)
+    return len({event.chunk_index for event in events if event.chunk_index is not None})
+
+
+def resumed_chunks(events) -> int:
+    return sum(event.details.get("resumed_chunks", 0) for event in events)
+
+
+def test_an_interrupted_job_only_summarizes_missing_chunks(config, fake_ollama, monkeypatch):
+    chunks = run_interrupted(config, monkeypatch)
+    assert chunks > 2
+    requests = fake_ollama.stats.chat_requests
+
+    events = []
+    result = workflow.process_video(config, progress=events.append)
+
+    assert result.success
+    assert resumed_chunks(events) == chunks
+    # Only the model preload and the combine calls are made again
+    assert fake_ollama.stats.chat_requests - requests == result.usage.calls + result.usage.preloads
+    assert {usage.stage for event in events for usage in event.usage} == {"load", "combine"}
+
+
+def test_the_checkpoint_is_removed_once_combined(config):
+    assert workflow.process_video(config).success
+
+    events = []
+    assert workflow.process_video(config, progress=events.append).success
+
+    # Every chunk is summarized again
+    stages = [usage.stage for event in events for usage in event.usage]
+    chunks = {event.chunk_index for event in events if event.chunk_index is not None}
+    assert resumed_chunks(events) == 0
+    assert len(chunks) > 2
+    assert stages.count("summarize") == len(chunks)
+
+
+def test_resume_keeps_chunks_when_the_context_window_changes(config, fake_ollama, monkeypatch):
+    chunks = run_interrupted(config, monkeypatch)
+
+    ai_client.configure(
+        ai_client.ClientSettings(cache_enabled=False, context_window=8192), fake_ollama.transport()
+    )
+    events = []
+    assert workflow.process_video(config, progress=events.append).success
+
+    assert resumed_chunks(events) == chunks
+
+
+def test_an_async_job_resumes_a_threaded_one(config, fake_ollama, monkeypatch):
+    chunks = run_interrupted(config, monkeypatch)
+
+    events = []
+    result = asyncio.run(workflow.process_video_async(config, progress=events.append))
+
+    assert result.success
+    assert resumed_chunks(events) == chunks
+
+
+def test_other_notes_start_a_new_job():
+    transcript = make_transcript(1_000)
+
+    assert checkpoint_job_id(VIDEO_ID, MODEL, None, transcript) == checkpoint_job_id(
+        VIDEO_ID, MODEL, None, transcript
+    )
+    assert checkpoint_job_id(VIDEO_ID, MODEL, None, transcript) != checkpoint_job_id(
+        VIDEO_ID, MODEL, "Focus on the results", transcript
+    )
+
+
+def test_a_corrupted_job_is_discarded(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.sqlite3")
+    store._connection.execute(
+        "INSERT INTO jobs VALUES ('broken', 'not json', 4.0, 1e12)",
+    )
+
+    checkpoint = store.job("broken")
+
+    assert not checkpoint.started
+    assert checkpoint.completed == 0
+    assert store._connection.execute("SELECT COUNT(*) FROM jobs").fetchone() == (0,)
+
+
+@pytest.mark.usefixtures("unusable_cache_dir")
+def test_jobs_run_without_checkpoints_when_the_store_cannot_open(
+    fake_ollama, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("VIDEO_NOTES_OFFLINE", "0")
+    monkeypatch.setattr(
+        video, "_download_transcript", lambda video_id: (make_transcript(6_000), "en", True)
+    )
+    monkeypatch.setattr(
+        video, "_fetch_video_metadata", lambda url: {"title": "No cache", "length": 600}
+    )
+    config = ProcessingConfig(
+        youtube_url=f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        model=MODEL,
+        output_folder=str(tmp_path / "notes"),
+    )
+
+    assert get_checkpoint_store() is None
+    assert workflow.process_video(config).success
@@ -0,0 +1,192 @@
+"""Tests of the tree reduce of chunk summaries."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from tests.conftest import MODEL, make_transcript
+from video_notes.agents import ChunkParameters, CombinedSummary, ai_client
+from video_notes.agents.chunk_combiner import (
+    SUMMARY_SEPARATOR,
+    combine_relevant_chunks,
+    combine_relevant_chunks_async,
+    get_messages,
+    group_summaries,
+)
+from video_notes.services import workflow
+from video_notes.testing import FakeOllama
+from video_notes.utils.tokenizer import count_message_tokens, count_tokens
+
+
+@pytest.fixture
+def small_context(fake_ollama):
+    """Give the model a context that holds only a few summaries per prompt."""
+    ai_client.configure(
+        ai_client.ClientSettings(cache_enabled=False, context_window=2048), fake_ollama.transport()
+    )
+    return fake_ollama
+
+
+def summaries(count: int, size: int = 1_500) -> list[str]:
+    return [make_transcript(size, seed=index) for index in range(count)]
+
+
+def test_groups_keep_order_and_hold_at_least_two_summaries(fake_ollama):
+    parts = summaries(8)
+    groups = group_summaries(parts, model=MODEL, budget=1_000)
+
+    assert [summary for group in groups for summary in group] == parts
+    assert all(len(group) >= 2 for group in groups)
+
+
+@pytest.fixture
+def failing_first_combine(small_context):
+    """Answer the first combine request with a server error."""
+    failures = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/chat" and json.loads(request.content).get("messages"):
+            if not failures:
+                failures.append(request)
+                return httpx.Response(500, json={"error": "model crashed"})
+        return small_context.handle(request)
+
+    ai_client.configure(
+        ai_client.ClientSettings(cache_enabled=False, context_window=2048),
+        httpx.MockTransport(handle),
+    )
+    return failures
+
+
+def test_summaries_larger_than_the_budget_are_still_paired(fake_ollama):
+    parts = summaries(5, size=10_000)
+    groups = group_summaries(parts, model=MODEL, budget=100)
+
+    # The leftover summary does not fit with any other, it passes through alone
+    assert [len(group) for group in groups] == [2, 2, 1]
+
+
+def budget_for(parts: list[str]) -> int:
+    """Get the smallest combine prompt budget that holds exactly these summaries."""
+    separator_tokens = count_tokens(SUMMARY_SEPARATOR, MODEL)
+    return count_message_tokens(get_messages([]), MODEL) + sum(
+        count_tokens(part, MODEL) + separator_tokens for part in parts
+    )
+
+
+def test_leftover_summary_borrows_from_the_previous_group_when_both_fit(fake_ollama):
+    parts = summaries(4, size=400)
+    groups = group_summaries(parts, model=MODEL, budget=budget_for(parts[:3]))
+
+    assert groups == [parts[:2], parts[2:]]
+
+
+def test_leftover_summary_that_fits_with_no_other_passes_through(fake_ollama):
+    parts = [*summaries(3, size=400), make_transcript(4_000, seed=3)]
+    budget = budget_for(parts[:3])
+    groups = group_summaries(parts, model=MODEL, budget=budget)
+
+    assert groups == [parts[:3], parts[3:]]
+    assert budget_for(groups[0]) <= budget
+
+
+def test_summaries_that_fit_are_combined_in_one_call(fake_ollama):
+    result = combine_relevant_chunks(summaries(3, size=200), model=MODEL)
+
+    assert result.summary
+    assert result.reduce_levels == 1
+    assert fake_ollama.stats.chat_requests == 1
+
+
+def test_summaries_that_do_not_fit_are_reduced_as_a_tree(small_context):
+    result = combine_relevant_chunks(summaries(12), model=MODEL, max_workers=4)
+
+    assert result.summary
+    assert result.chunks_processed == 12
+    assert result.reduce_levels > 1
+    assert len(result.usage) == small_context.stats.chat_requests
+
+
+def test_async_tree_reduce_matches_the_threaded_one(small_context):
+    parts = summaries(12)
+    threaded = combine_relevant_chunks(parts, model=MODEL, max_workers=4)
+    calls = small_context.stats.chat_requests
+
+    result = asyncio.run(combine_relevant_chunks_async(parts, model=MODEL, max_workers=4))
+
+    assert result.summary
+    assert result.reduce_levels == threaded.reduce_levels
+    assert small_context.stats.chat_requests - calls == calls
+
+
+def test_tree_reduce_terminates_with_oversized_summaries(small_context):
+    # Each summary alone is over the budget, pairing still halves their number
+    result = combine_relevant_chunks(summaries(6, size=12_000), model=MODEL)
+
+    assert result.summary
+    assert result.reduce_levels > 1
+
+
+def test_one_failed_group_does_not_abort_the_tree_reduce(failing_first_combine):
+    result = combine_relevant_chunks(summaries(12), model=MODEL, max_workers=4)
+
+    assert len(failing_first_combine) == 1
+    assert result.summary
+    assert result.reduce_levels > 1
+
+
+def test_one_failed_group_does_not_abort_the_async_tree_reduce(failing_first_combine):
+    result = asyncio.run(combine_relevant_chunks_async(summaries(12), model=MODEL, max_workers=4))
+
+    assert len(failing_first_combine) == 1
+    assert result.summary
+    assert result.reduce_levels > 1
+
+
+def test_failed_combine_returns_an_empty_summary():
+    fake = FakeOllama(response_tokens=30, error_rate=1.0)
+    ai_client.configure(ai_client.ClientSettings(cache_enabled=False), fake.transport())
+    try:
+        result = combine_relevant_chunks(summaries(3, size=200), model=MODEL)
+    finally:
+        ai_client.configure(ai_client.ClientSettings())
+
+    assert result.summary == ""
+    assert result.chunks_processed == 3
+
+
+@pytest.mark.parametrize("chunk_summaries", [[], ["", "  "]])
+def test_nothing_to_combine(fake_ollama, chunk_summaries):
+    result = combine_relevant_chunks(chunk_summaries, model=MODEL)
+
+    assert result.chunks_processed == 0
+    assert fake_ollama.stats.chat_requests == 0
+
+
+def test_workflow_falls_back_to_the_chunk_summaries(fake_ollama, monkeypatch):
+    monkeypatch.setattr(
+        workflow,
+        "combine_relevant_chunks",
+        lambda chunk_summaries, **kwargs: CombinedSummary(
+            summary="", chunks_processed=len(chunk_summaries)
+        ),
+    )
+    chunk_params = ChunkParameters.model_validate(
+        {
+            "chunk_size": 500,
+            "chunk_overlap": 0,
+            "should_use_hierarchical": True,
+            "category": "long",
+            "context_window": 8192,
+        }
+    )
+    events = []
+
+    summary = workflow.create_hierarchical_summary(
+        make_transcript(6_000), chunk_params, MODEL, progress=events.append
+    )
+
+    assert summary.count("\n\n") == fake_ollama.stats.chat_requests - 1
+    assert any("Using fallback" in event.message for event in events)
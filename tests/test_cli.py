@@ -0,0 +1,151 @@
+"""Tests of the video-notes command line interface."""
+
+import io
+import json
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from tests.conftest import MODEL, make_transcript
+from video_notes.cli import cli, read_urls
+from video_notes.services import video
+
+VIDEO_ID = "clitest0001"
+URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+
+@pytest.fixture
+def cached_video(fake_ollama):
+    """Cache a short video so that it is processed offline."""
+    video._store_transcript(VIDEO_ID, "en", True, make_transcript(3_000))
+    video.get_video_info_cache().set(VIDEO_ID, {"title": "Command line", "length": 300})
+    return fake_ollama
+
+
+def records(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+
+@pytest.mark.usefixtures("cached_video")
+@pytest.mark.parametrize(
+    "arguments",
+    [["--verbose", "process", URL], ["process", URL, "--verbose"], ["process", "-v", URL]],
+)
+def test_verbose_is_accepted_before_and_after_the_command(tmp_path, arguments):
+    result = CliRunner().invoke(cli, [*arguments, "--model", MODEL, "-o", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert records(result.output)[-1]["succeeded"] == 1
+
+
+@pytest.mark.usefixtures("cached_video")
+def test_custom_output_files(tmp_path):
+    result = CliRunner().invoke(
+        cli,
+        [
+            "process",
+            URL,
+            "--model",
+            MODEL,
+            "-o",
+            str(tmp_path),
+            "--transcript-file",
+            "my_transcript.txt",
+            "--summary-file",
+            "my_summary.md",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    finished = records(result.output)[-2]
+    assert finished["summary_file"] == str(tmp_path / "my_summary.md")
+    assert finished["transcript_file"] == str(tmp_path / "my_transcript.txt")
+    assert (tmp_path / "my_summary.md").read_text().startswith("#")
+    assert (tmp_path / "my_transcript.txt").read_text() == make_transcript(3_000)
+
+
+def test_custom_output_files_need_a_single_url():
+    result = CliRunner().invoke(cli, ["process", URL, URL, "--summary-file", "summary.md"])
+
+    assert result.exit_code == 2
+    assert "single URL" in result.output
+
+
+def test_usage_reports_preloads_apart_from_calls(tmp_path, cached_video):
+    assert (
+        CliRunner().invoke(cli, ["process", URL, "--model", MODEL, "-o", str(tmp_path)]).exit_code
+        == 0
+    )
+
+    result = CliRunner().invoke(cli, ["usage"])
+
+    assert result.exit_code == 0, result.output
+    (stats,) = records(result.output)
+    assert stats["model"] == MODEL
+    assert stats["preloads"] == 1
+    assert stats["calls"] == cached_video.stats.chat_requests - 1
+    assert stats["cold_loads"] == 0
+
+
+@pytest.mark.usefixtures("unusable_cache_dir")
+def test_usage_fails_cleanly_without_a_usable_ledger():
+    result = CliRunner().invoke(cli, ["usage"])
+
+    assert result.exit_code == 1
+    assert "Could not read the usage ledger" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+@pytest.mark.usefixtures("cached_video")
+def test_failed_videos_give_a_failure_exit_code(tmp_path):
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(f"# Videos to summarize\n{URL}\n\nhttps://example.com/not-a-video\n")
+
+    result = CliRunner().invoke(
+        cli, ["process", "--file", str(url_file), "--model", MODEL, "-o", str(tmp_path)]
+    )
+
+    assert result.exit_code == 1, result.output
+    finished = {
+        record["url"]: record for record in records(result.output) if record["event"] == "finished"
+    }
+    assert finished[URL]["success"]
+    assert finished["https://example.com/not-a-video"]["error_message"] == "Invalid YouTube URL"
+    summary = records(result.output)[-1]
+    assert (summary["event"], summary["total"], summary["failed"]) == ("summary", 2, 1)
+
+
+@pytest.mark.usefixtures("cached_video")
+def test_progress_events_are_written_as_json_lines(tmp_path):
+    result = CliRunner().invoke(
+        cli, ["process", URL, "--progress", "--model", MODEL, "-o", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    progress = [record for record in records(result.output) if record["event"] == "progress"]
+    assert {record["url"] for record in progress} == {URL}
+    assert (progress[0]["stage"], progress[0]["status"]) == ("job", "started")
+    assert (progress[-1]["stage"], progress[-1]["status"]) == ("job", "completed")
+
+
+def test_urls_are_read_from_arguments_and_stdin(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(f"# From stdin\n\n  {URL}  \n"))
+
+    assert read_urls(("-", "https://youtu.be/clitest0002"), None) == [
+        "https://youtu.be/clitest0002",
+        URL,
+    ]
+
+
+def test_no_url_is_read_from_an_empty_stdin(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+
+    assert read_urls((), None) == []
+
+
+def test_info_lists_the_installed_models(fake_ollama):
+    result = CliRunner().invoke(cli, ["info"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.split() == [MODEL]
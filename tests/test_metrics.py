@@ -0,0 +1,109 @@
+"""Tests of the Prometheus metrics fed by progress events."""
+
+import threading
+
+import httpx
+import pytest
+
+from tests.conftest import MODEL, make_transcript
+from video_notes.models import ProcessingConfig
+from video_notes.services import video, workflow
+from video_notes.services.metrics import (
+    CONTENT_TYPE,
+    DEFAULT_HOST,
+    METRICS,
+    MetricsServer,
+    PipelineMetrics,
+    metrics_from_env,
+)
+
+VIDEO_ID = "metrics0001"
+
+
+def samples(text: str) -> dict[str, float]:
+    """Parse the sample lines of an exposition, keyed by name and labels."""
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            values[series] = float(value)
+    return values
+
+
+@pytest.fixture
+def exposition(fake_ollama, tmp_path) -> str:
+    """Render the metrics of one processed video."""
+    video._store_transcript(VIDEO_ID, "en", True, make_transcript(6_000))
+    video.get_video_info_cache().set(VIDEO_ID, {"title": "Metrics", "length": 600})
+    config = ProcessingConfig(
+        youtube_url=f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        model=MODEL,
+        output_folder=str(tmp_path / "notes"),
+    )
+
+    metrics = PipelineMetrics()
+    assert workflow.process_video(config, progress=metrics).success
+    return metrics.render()
+
+
+@pytest.fixture
+def metrics_server():
+    """Serve fresh metrics on a free local port."""
+    server = MetricsServer(PipelineMetrics(), DEFAULT_HOST, 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_one_job_is_counted(exposition):
+    values = samples(exposition)
+
+    assert values["video_notes_jobs_started_total"] == 1
+    assert values["video_notes_jobs_in_flight"] == 0
+    assert values['video_notes_jobs_finished_total{outcome="success"}'] == 1
+    assert values['video_notes_stage_duration_seconds_count{outcome="success",stage="job"}'] == 1
+
+
+def test_preloads_are_not_counted_as_calls(exposition, fake_ollama):
+    values = samples(exposition)
+    calls = {
+        series: value
+        for series, value in values.items()
+        if series.startswith("video_notes_llm_calls_total")
+    }
+
+    assert values[f'video_notes_llm_preloads_total{{model="{MODEL}"}}'] == 1
+    assert sum(calls.values()) == fake_ollama.stats.chat_requests - 1
+    assert calls
+    assert not any('stage="load"' in series for series in calls)
+
+
+def test_every_sample_is_described(exposition):
+    names = {line.split()[2] for line in exposition.splitlines() if line.startswith("# TYPE")}
+
+    assert names <= set(METRICS)
+    for series in samples(exposition):
+        name = series.split("{")[0]
+        assert name in names or name.rsplit("_", 1)[0] in names
+
+
+def test_metrics_are_served_over_http(metrics_server):
+    url = f"http://{DEFAULT_HOST}:{metrics_server.server_address[1]}"
+
+    response = httpx.get(f"{url}/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert samples(response.text)["video_notes_jobs_started_total"] == 0
+    assert httpx.get(f"{url}/other").status_code == 404
+
+
+@pytest.mark.parametrize("port", [None, "", "not-a-port"])
+def test_metrics_from_env_without_a_valid_port(monkeypatch, port):
+    if port is None:
+        monkeypatch.delenv("VIDEO_NOTES_METRICS_PORT", raising=False)
+    else:
+        monkeypatch.setenv("VIDEO_NOTES_METRICS_PORT", port)
+
+    assert metrics_from_env() is None
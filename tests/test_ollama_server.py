@@ -0,0 +1,49 @@
+"""Tests of the Ollama-compatible HTTP server backed by the simulated Ollama."""
+
+import httpx
+import ollama
+import pytest
+
+from tests.conftest import MODEL
+from video_notes.testing import FakeOllama
+from video_notes.testing.ollama_server import OllamaServer
+
+MESSAGES = [{"role": "user", "content": "Summarize the video."}]
+
+
+@pytest.fixture
+def server():
+    """Serve a simulated Ollama on a free local port."""
+    server = OllamaServer(FakeOllama(models=[MODEL], response_tokens=20), port=0)
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_models_are_listed(server):
+    response = ollama.Client(host=server.url).list()
+
+    assert [model.model for model in response.models] == [MODEL]
+
+
+def test_chat(server):
+    response = ollama.Client(host=server.url).chat(model=MODEL, messages=MESSAGES)
+
+    assert response.message.content
+    assert response.eval_count == 20
+    assert server.fake.stats.chat_requests == 1
+
+
+def test_streamed_chat(server):
+    parts = list(ollama.Client(host=server.url).chat(model=MODEL, messages=MESSAGES, stream=True))
+
+    assert parts[-1].done
+    assert "".join(part.message.content for part in parts)
+
+
+def test_invalid_json_is_rejected(server):
+    response = httpx.post(f"{server.url}/api/chat", content=b"{not json")
+
+    assert response.status_code == 400
+    assert server.fake.stats.chat_requests == 0
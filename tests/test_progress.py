@@ -0,0 +1,93 @@
+"""Tests of the progress events and the sinks recording them."""
+
+import threading
+
+import pytest
+
+from tests.conftest import MODEL, make_transcript
+from video_notes.models import ProcessingConfig
+from video_notes.services import video, workflow
+from video_notes.services.progress import (
+    PipelineStage,
+    ProgressReporter,
+    ProgressStatus,
+    TimingRecorder,
+    UsageRecorder,
+    combine_sinks,
+)
+
+VIDEO_ID = "progress001"
+
+
+@pytest.fixture
+def config(fake_ollama, tmp_path):
+    """Configure a cached video split into a few chunks."""
+    video._store_transcript(VIDEO_ID, "en", True, make_transcript(12_000))
+    video.get_video_info_cache().set(VIDEO_ID, {"title": "Progress", "length": 900})
+    return ProcessingConfig(
+        youtube_url=f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        model=MODEL,
+        output_folder=str(tmp_path / "notes"),
+    )
+
+
+def test_recorders_match_the_result_of_the_job(config, fake_ollama):
+    timings, usages, events = TimingRecorder(), UsageRecorder(), []
+
+    result = workflow.process_video(
+        config, progress=combine_sinks(timings, None, usages, events.append)
+    )
+
+    assert result.success
+    assert usages.summary == result.usage
+    assert usages.summary.calls + usages.summary.preloads == fake_ollama.stats.chat_requests
+    assert timings.timings.total == result.timings.total
+    assert [stage.stage for stage in timings.timings.stages] == [
+        stage.stage for stage in result.timings.stages
+    ]
+    assert events[0].stage == PipelineStage.JOB
+    assert events[0].status == ProgressStatus.STARTED
+    assert events[-1].stage == PipelineStage.JOB
+    assert events[-1].status == ProgressStatus.COMPLETED
+
+
+def test_events_are_emitted_from_the_calling_thread(config):
+    threads = set()
+
+    result = workflow.process_video(
+        config, progress=lambda event: threads.add(threading.get_ident())
+    )
+
+    assert result.success
+    assert threads == {threading.get_ident()}
+
+
+def test_a_failing_sink_does_not_fail_the_job(config):
+    def broken_sink(event):
+        raise RuntimeError("sink is broken")
+
+    assert workflow.process_video(config, progress=broken_sink).success
+
+
+def test_a_raising_stage_is_reported_as_failed():
+    events = []
+    reporter = ProgressReporter(events.append)
+
+    with pytest.raises(ValueError), reporter.stage(PipelineStage.FETCH, "Fetching"):
+        raise ValueError("no transcript")
+
+    assert [event.status for event in events] == [ProgressStatus.STARTED, ProgressStatus.FAILED]
+    assert events[-1].elapsed is not None
+
+
+def test_a_failed_tracker_emits_no_completion():
+    events, timings = [], TimingRecorder()
+    reporter = ProgressReporter(combine_sinks(events.append, timings))
+
+    with reporter.stage(PipelineStage.COMBINE, "Combining", "Combined") as tracker:
+        tracker.fail("Could not combine")
+
+    assert [event.status for event in events] == [ProgressStatus.STARTED, ProgressStatus.FAILED]
+    assert [(stage.stage, stage.success) for stage in timings.timings.stages] == [
+        ("combine", False)
+    ]
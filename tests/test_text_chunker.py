@@ -0,0 +1,100 @@
+"""Tests of the chunk boundaries of TextChunker."""
+
+import pytest
+
+from tests.conftest import make_transcript
+from video_notes.models import TextChunker
+from video_notes.utils.tokenizer import CharRatioTokenizer
+
+
+@pytest.mark.parametrize("text", ["", "   ", "\n\t\n"])
+def test_blank_text_has_no_chunks(text):
+    assert list(TextChunker(chunk_size=100, overlap=10).iter_spans(text)) == []
+
+
+def test_short_text_is_one_chunk():
+    text = "  A single short sentence.  "
+    spans = list(TextChunker(chunk_size=100, overlap=10).iter_spans(text))
+
+    assert len(spans) == 1
+    assert (spans[0].start_position, spans[0].end_position) == (0, len(text))
+    assert spans[0].content == text.strip()
+
+
+@pytest.mark.parametrize("overlap", [0, 50])
+def test_spans_cover_the_text_in_order(overlap):
+    text = make_transcript(20_000)
+    spans = list(TextChunker(chunk_size=500, overlap=overlap).iter_spans(text))
+
+    assert len(spans) > 1
+    assert spans[0].start_position == 0
+    assert spans[-1].end_position == len(text)
+    assert [span.chunk_index for span in spans] == list(range(len(spans)))
+    for previous, span in zip(spans, spans[1:], strict=False):
+        assert previous.start_position < span.start_position
+        if overlap:
+            assert span.start_position == previous.end_position - overlap * 4
+        else:
+            assert span.start_position == previous.end_position
+
+
+def test_spans_respect_the_chunk_size():
+    text = make_transcript(20_000)
+    chunker = TextChunker(chunk_size=500, overlap=50)
+
+    for span in chunker.iter_spans(text):
+        assert span.end_position - span.start_position <= 500 * 4
+
+
+def test_spans_end_on_sentence_boundaries():
+    text = make_transcript(20_000)
+    spans = list(TextChunker(chunk_size=500, overlap=0).iter_spans(text))
+
+    for span in spans[:-1]:
+        assert span.content.endswith(".")
+
+
+def test_text_without_boundaries_is_cut_at_the_chunk_size():
+    text = "x" * 1_000
+    spans = list(TextChunker(chunk_size=100, overlap=0).iter_spans(text))
+
+    assert [(span.start_position, span.end_position) for span in spans] == [
+        (start, start + 400) if start + 400 <= 1_000 else (start, 1_000)
+        for start in range(0, 1_000, 400)
+    ]
+
+
+def test_blank_spans_are_skipped():
+    text = "First sentence." + " " * 2_000 + "Last sentence."
+    spans = list(TextChunker(chunk_size=100, overlap=0).iter_spans(text))
+
+    assert [span.content for span in spans] == ["First sentence.", "Last sentence."]
+    assert [span.chunk_index for span in spans] == [0, 1]
+
+
+def test_iter_chunks_materializes_iter_spans():
+    text = make_transcript(10_000)
+    chunker = TextChunker(chunk_size=300, overlap=30)
+
+    chunks = list(chunker.iter_chunks(text))
+    spans = list(chunker.iter_spans(text))
+
+    assert [chunk.content for chunk in chunks] == [span.content for span in spans]
+    assert [(chunk.start_position, chunk.end_position) for chunk in chunks] == [
+        (span.start_position, span.end_position) for span in spans
+    ]
+    assert chunker.chunk_text(text) == chunks
+
+
+def test_fixed_chars_per_token_reproduces_earlier_chunks():
+    text = make_transcript(10_000)
+    tokenizer = CharRatioTokenizer(chars_per_token=3.0)
+    chunker = TextChunker(chunk_size=300, overlap=30, tokenizer=tokenizer)
+    spans = [(span.start_position, span.end_position) for span in chunker.iter_spans(text)]
+
+    # A later calibration changes the ratio, the fixed one keeps the boundaries
+    tokenizer.chars_per_token = 5.0
+    replayed = TextChunker(chunk_size=300, overlap=30, tokenizer=tokenizer, chars_per_token=3.0)
+
+    assert [(span.start_position, span.end_position) for span in replayed.iter_spans(text)] == spans
+    assert len(list(chunker.iter_spans(text))) < len(spans)
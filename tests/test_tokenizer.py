@@ -0,0 +1,74 @@
+"""Tests of the token estimates and their saved calibration."""
+
+import json
+import threading
+
+from video_notes.utils import tokenizer
+from video_notes.utils.tokenizer import (
+    CharRatioTokenizer,
+    calibrate_from_prompt,
+    get_tokenizer,
+    save_calibrations,
+)
+
+MESSAGES = [{"role": "user", "content": "x" * 3_000}]
+
+
+def test_calibration_follows_reported_prompt_sizes():
+    calibrate_from_prompt(MESSAGES, 1_004, "model")
+
+    assert get_tokenizer("model").chars_per_token == 3.0
+    assert get_tokenizer("other").chars_per_token == 4.0
+
+
+def test_samples_out_of_range_are_ignored():
+    calibrate_from_prompt(MESSAGES, 10_004, "model")
+
+    assert not get_tokenizer("model").calibrated
+
+
+def test_calibration_is_saved_off_the_calling_thread(cache_dir, monkeypatch):
+    threads = []
+    save = tokenizer.save_calibrations
+
+    def spy():
+        threads.append(threading.current_thread())
+        save()
+
+    monkeypatch.setattr(tokenizer, "save_calibrations", spy)
+    calibrate_from_prompt(MESSAGES, 1_004, "model")
+    for thread in threading.enumerate():
+        if thread.name == "tokenizer-calibration":
+            thread.join()
+
+    assert threads and threading.current_thread() not in threads
+    assert json.loads((cache_dir / "tokenizers.json").read_text()) == {"model": 3.0}
+
+
+def test_saves_are_throttled(monkeypatch):
+    saves = []
+    monkeypatch.setattr(tokenizer, "save_calibrations", lambda: saves.append(1))
+
+    calibrate_from_prompt(MESSAGES, 1_004, "model")
+    calibrate_from_prompt(MESSAGES, 504, "model")
+    calibrate_from_prompt(MESSAGES, 504, "model")
+
+    assert len(saves) == 1
+
+
+def test_saved_calibration_is_used_by_new_tokenizers(monkeypatch):
+    calibrate_from_prompt(MESSAGES, 1_004, "model")
+    save_calibrations()
+
+    monkeypatch.setattr(tokenizer, "_tokenizers", {})
+    restored = get_tokenizer("model")
+
+    assert isinstance(restored, CharRatioTokenizer)
+    assert (restored.chars_per_token, restored.calibrated) == (3.0, True)
+    assert not restored.needs_saving()
+
+
+def test_unloadable_configured_tokenizer_falls_back(monkeypatch):
+    monkeypatch.setenv("VIDEO_NOTES_TOKENIZERS", "model=/missing/tokenizer.json")
+
+    assert isinstance(get_tokenizer("model"), CharRatioTokenizer)
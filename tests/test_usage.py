@@ -0,0 +1,110 @@
+"""Tests of the usage ledger."""
+
+import pytest
+
+from tests.conftest import MODEL, make_transcript
+from video_notes.models import LLMUsage, ProcessingConfig, UsageSummary
+from video_notes.models.usage import COLD_LOAD_SECONDS, LOAD_STAGE
+from video_notes.services import video, workflow
+from video_notes.services.usage import UsageLedger, get_usage_ledger
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    yield ledger
+    ledger.close()
+
+
+def job_usages(timestamp: float = 1_000.0) -> list[LLMUsage]:
+    """Build the usage of a job: a cold preload, two calls and a cached one."""
+    return [
+        LLMUsage(
+            model=MODEL,
+            stage=LOAD_STAGE,
+            load_duration=COLD_LOAD_SECONDS * 2,
+            total_duration=COLD_LOAD_SECONDS * 2,
+            timestamp=timestamp,
+        ),
+        *(
+            LLMUsage(
+                model=MODEL,
+                stage="summarize",
+                prompt_tokens=1_000,
+                completion_tokens=100,
+                prompt_eval_duration=0.5,
+                eval_duration=2.0,
+                total_duration=2.5,
+                timestamp=timestamp,
+            )
+            for _ in range(2)
+        ),
+        LLMUsage(model=MODEL, stage="combine", cached=True, timestamp=timestamp),
+    ]
+
+
+def test_model_stats_aggregate_the_recorded_jobs(ledger):
+    ledger.record_job("job-1", MODEL, job_usages(), video_seconds=1_800)
+    ledger.record_job("job-2", MODEL, job_usages(), video_seconds=1_800)
+
+    (stats,) = ledger.model_stats()
+
+    assert stats.jobs == 2
+    assert stats.calls == 6
+    assert stats.cached_calls == 2
+    assert stats.preloads == 2
+    assert stats.cold_loads == 0
+    assert stats.cold_load_rate == 0
+    assert stats.tokens_per_second == 50
+    assert stats.prompt_tokens_per_second == 2_000
+    assert stats.video_hours == 1
+    assert stats.server_seconds_per_video_hour == pytest.approx(12)
+
+
+def test_model_stats_since(ledger):
+    ledger.record_job("old", MODEL, job_usages(timestamp=1_000.0))
+    ledger.record_job("new", MODEL, job_usages(timestamp=2_000.0))
+
+    (stats,) = ledger.model_stats(since=1_500.0)
+
+    assert stats.jobs == 1
+    assert ledger.model_stats(since=3_000.0) == []
+
+
+def test_summary_counts_preloads_apart_from_calls():
+    summary = UsageSummary.from_usages(job_usages())
+
+    assert summary.calls == 3
+    assert summary.cached_calls == 1
+    assert summary.preloads == 1
+    assert summary.cold_loads == 0
+    assert summary.load_duration == COLD_LOAD_SECONDS * 2
+
+
+def test_a_write_error_is_not_raised(ledger):
+    ledger.close()
+
+    ledger.record_job("job-1", MODEL, job_usages())
+
+
+def test_the_ledger_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("VIDEO_NOTES_USAGE_LEDGER", "0")
+
+    assert get_usage_ledger() is None
+
+
+def test_a_job_succeeds_when_the_ledger_cannot_be_opened(fake_ollama, tmp_path, monkeypatch):
+    video._store_transcript("usage000001", "en", True, make_transcript(3_000))
+    video.get_video_info_cache().set("usage000001", {"title": "Usage", "length": 300})
+
+    def unusable_ledger():
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(workflow, "get_usage_ledger", unusable_ledger)
+    config = ProcessingConfig(
+        youtube_url="https://www.youtube.com/watch?v=usage000001",
+        model=MODEL,
+        output_folder=str(tmp_path / "notes"),
+    )
+
+    assert workflow.process_video(config).success
@@ -0,0 +1,70 @@
+"""Tests of the transcript and metadata caches."""
+
+import pytest
+
+from video_notes.models import VideoInfo
+from video_notes.services import video
+
+VIDEO_ID = "abcdefghijk"
+URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replace the YouTube downloads with counted stand-ins."""
+    calls = {"transcript": 0, "metadata": 0}
+
+    def download_transcript(video_id):
+        calls["transcript"] += 1
+        return f"Transcript of {video_id}.", "en", True
+
+    def fetch_video_metadata(url):
+        calls["metadata"] += 1
+        return {"title": "A video", "author": "Someone", "length": 90}
+
+    monkeypatch.setattr(video, "_download_transcript", download_transcript)
+    monkeypatch.setattr(video, "_fetch_video_metadata", fetch_video_metadata)
+    return calls
+
+
+def test_transcripts_are_downloaded_once(downloads):
+    video_info = VideoInfo(url=URL, video_id=VIDEO_ID)
+
+    first = video.get_transcript_content(video_info, offline=False)
+    second = video.get_transcript_content(video_info, offline=False)
+
+    assert first == second == f"Transcript of {VIDEO_ID}."
+    assert downloads["transcript"] == 1
+
+
+def test_offline_mode_requires_a_cached_transcript(downloads):
+    with pytest.raises(ValueError, match="offline"):
+        video.get_transcript_content(VideoInfo(url=URL, video_id=VIDEO_ID), offline=True)
+
+    assert downloads["transcript"] == 0
+
+
+def test_metadata_is_extracted_once(downloads):
+    first = video.extract_video_info(URL)
+    second = video.extract_video_info(URL)
+
+    assert first.title == second.title == "A video"
+    assert second.length == 90
+    assert downloads["metadata"] == 1
+
+
+@pytest.mark.usefixtures("unusable_cache_dir")
+def test_transcripts_are_downloaded_without_a_usable_cache(downloads):
+    video_info = VideoInfo(url=URL, video_id=VIDEO_ID)
+
+    assert video.get_transcript_content(video_info, offline=False) == f"Transcript of {VIDEO_ID}."
+    assert video.get_transcript_content(video_info, offline=False) == f"Transcript of {VIDEO_ID}."
+    assert downloads["transcript"] == 2
+
+
+@pytest.mark.usefixtures("unusable_cache_dir")
+def test_metadata_is_extracted_without_a_usable_cache(downloads):
+    video_info = video.extract_video_info(URL)
+
+    assert (video_info.video_id, video_info.title) == (VIDEO_ID, "A video")
+    assert downloads["metadata"] == 1